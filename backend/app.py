@@ -4,66 +4,99 @@ This module contains the Flask application factory for the CareConnect backend.
 It configures the database, authentication, CORS, and registers all route blueprints.
 """
 
+import importlib
 import os
 from flask import Flask
 from backend.config import Config
 from backend.extensions import db, init_cors, init_session, init_oauth
 from backend.database.database_factory import DatabaseFactory
+from backend.database.query_stats import init_query_stats
+from backend.compression import init_compression
+from backend.services.telemetry import init_telemetry
+from backend.profiler import init_profiler
+from backend.json_provider import OrjsonProvider
 
-from backend.routes.auth_routes import auth_bp
-from backend.routes.profile_routes import profile_bp
-from backend.routes.donations_routes import donations_bp
-from backend.routes.requests_routes import requests_bp
-from backend.routes.community_routes import community_bp
-from backend.routes.jobs_routes import jobs_bp
-from backend.routes.notification_routes import notification_bp
-from backend.routes.inventory_routes import inventory_bp
+# API route blueprints as (module, blueprint name); imported by
+# register_blueprints() so importing this module stays cheap
+BLUEPRINTS = (
+    ("backend.routes.auth_routes", "auth_bp"),
+    ("backend.routes.profile_routes", "profile_bp"),
+    ("backend.routes.donations_routes", "donations_bp"),
+    ("backend.routes.requests_routes", "requests_bp"),
+    ("backend.routes.community_routes", "community_bp"),
+    ("backend.routes.notification_routes", "notification_bp"),
+    ("backend.routes.jobs_routes", "jobs_bp"),
+    ("backend.routes.inventory_routes", "inventory_bp"),
+    ("backend.routes.admin_routes", "admin_bp"),
+    ("backend.routes.metrics_routes", "metrics_bp"),
+)
 
-from .controllers.jobs_controller import JobsController
+def register_blueprints(app):
+    """Import and register all API route blueprints.
+    
+    Args:
+        app (Flask): Flask application instance.
+    """
+    for module_name, bp_name in BLUEPRINTS:
+        app.register_blueprint(getattr(importlib.import_module(module_name), bp_name))
 
-def create_app():
+def create_app(start_schedulers=None):
     """Create and configure the Flask application.
-    
+
+    Importing this module has no side effects; call this factory (or load
+    ``backend.wsgi:app``) to build the application.
+
+    Args:
+        start_schedulers (bool, optional): Start background job threads.
+            Defaults to Config.RUN_SCHEDULERS. The gunicorn config passes
+            False and starts them after forking instead.
+
     Returns:
         Flask: Configured Flask application instance.
     """
     app = Flask(__name__)
     app.config.from_object(Config)
+    app.json = OrjsonProvider(app)  # orjson-backed jsonify/request.get_json
 
     # Initialize session management and CORS
     init_session(app, Config.SESSION_TYPE, Config.REDIS_URL, Config.ENV)
     init_cors(app, Config.FRONTEND_ORIGIN)
+    init_compression(app)  # gzip/brotli for large JSON responses
 
     # Initialize database using Factory pattern
-    db_type = "postgres"  # Switch between "sqlite" and "postgres"
-    impl = DatabaseFactory.getDatabase(db_type)
+    db_type = Config.DB_TYPE  # "postgres", "sqlite" or "memory"
+    impl = DatabaseFactory.getDatabase(db_type, replica_url=Config.DATABASE_REPLICA_URL)
     impl.init_app(app, db)  # Bind the shared SQLAlchemy instance
+    init_query_stats(app, db)  # Per-request SQL counts, slow-query and N+1 logging
+    init_telemetry(app)  # Prometheus request/DB/pool metrics for /metrics
 
-    # Create database tables if they don't exist
+    # Verify the schema is at the latest migration (or apply pending ones)
+    from backend.database.migrations import ensure_schema
     with app.app_context():
-        db.create_all()
+        ensure_schema(db.engine, auto_upgrade=Config.DB_AUTO_MIGRATE)
+
+    # Load cached community club markers (disk copy or bundled snapshot)
+    from backend.services.cc_cache import init_cc_cache
+    init_cc_cache(app)
 
     # Initialize Google OAuth
     init_oauth(app, Config.GOOGLE_CLIENT_ID, Config.GOOGLE_CLIENT_SECRET)
 
     # Register all API route blueprints
-    app.register_blueprint(auth_bp)
-    app.register_blueprint(profile_bp)
-    app.register_blueprint(donations_bp)
-    app.register_blueprint(requests_bp)
-    app.register_blueprint(community_bp)
-    app.register_blueprint(notification_bp)
-    app.register_blueprint(jobs_bp)
-    app.register_blueprint(inventory_bp)
-
-    # Start background job schedulers
-    JobsController.start_schedulers(app)
-    return app
+    register_blueprints(app)
+    init_profiler(app)  # opt-in per-request profiling (PROFILER_TOKEN)
 
-app = create_app()
+    # Start background job schedulers (disabled when a standalone worker runs them)
+    if start_schedulers is None:
+        start_schedulers = Config.RUN_SCHEDULERS
+    if start_schedulers:
+        from backend.controllers.jobs_controller import JobsController
+        JobsController.start_schedulers(app)
+    return app
 
-# Run the application if executed directly
+# Run the development server if executed directly (production: backend.wsgi)
 if __name__ == "__main__":
+    app = create_app()
     app.run(
         host="0.0.0.0",  # Accept connections from any IP
         port=int(os.getenv("FLASK_RUN_PORT", "5000")),  # Default to port 5000
@@ -0,0 +1,4 @@
+"""Benchmarks for CareConnect Backend.
+
+Standalone scripts run with ``python -m backend.benchmarks.<name>``.
+"""
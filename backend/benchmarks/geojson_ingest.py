@@ -0,0 +1,144 @@
+"""GeoJSON Ingestion Benchmark for CareConnect Backend.
+
+This module compares the two ways of turning the community club GeoJSON
+into markers, on a synthetic local file shaped like the data.gov.sg one
+(Point features with an HTML description table):
+    - "document": load the whole document with ``json.loads`` and convert
+      every feature (what ``requests.get(...).json()`` used to do);
+    - "stream": decode features incrementally from 64 KiB chunks with
+      ``iter_markers``, keeping the markers ("stream") or only counting
+      them ("stream-count", memory independent of the dataset size).
+
+Time is the best of --runs; peak memory is measured with tracemalloc in a
+separate run.
+
+Usage:
+    python -m backend.benchmarks.geojson_ingest
+    python -m backend.benchmarks.geojson_ingest --features 200000 --runs 3 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from backend.services.community_clubs import feat_to_marker, iter_markers
+
+CHUNK_CHARS = 64 * 1024
+
+def _description(i: int, rng: random.Random) -> str:
+    rows = {
+        "NAME": f"Benchmark Community Club {i}",
+        "ADDRESSBLOCKHOUSENUMBER": str(rng.randint(1, 999)),
+        "ADDRESSSTREETNAME": f"Street {rng.randint(1, 500)}",
+        "ADDRESSPOSTALCODE": f"{rng.randint(100000, 829999)}",
+        "DESCRIPTION": "Community club &amp; residents' network centre " * 3,
+        "HYPERLINK": f"https://www.onepa.gov.sg/cc/cc-{i}",
+        "INC_CRC": f"{rng.getrandbits(64):016X}",
+        "FMEL_UPD_D": "20240101120000",
+    }
+    cells = "".join(f"<tr><th>{k}</th> <td>{v}</td></tr>" for k, v in rows.items())
+    return f"<center><table><tr><th colspan='2'>Attributes</th></tr>{cells}</table></center>"
+
+def write_fixture(path: str, features: int, random_seed: int = 0):
+    """Write a FeatureCollection with ``features`` Point features to ``path``."""
+    rng = random.Random(random_seed)
+    with open(path, "w") as f:
+        f.write('{"type":"FeatureCollection","name":"CommunityClubs","features":[')
+        for i in range(features):
+            if i:
+                f.write(",")
+            json.dump({
+                "type": "Feature",
+                "properties": {"Name": f"kml_{i}", "Description": _description(i, rng)},
+                "geometry": {"type": "Point", "coordinates": [
+                    round(rng.uniform(103.6, 104.0), 6), round(rng.uniform(1.2, 1.47), 6), 0.0,
+                ]},
+            }, f)
+        f.write("]}")
+
+def _chunks(path: str):
+    with open(path) as f:
+        while True:
+            chunk = f.read(CHUNK_CHARS)
+            if not chunk:
+                return
+            yield chunk
+
+def run_document(path: str) -> int:
+    with open(path) as f:
+        gj = json.loads(f.read())
+    markers = [m for m in map(feat_to_marker, gj.get("features") or []) if m]
+    return len(markers)
+
+def run_stream(path: str) -> int:
+    return len(list(iter_markers(_chunks(path))))
+
+def run_stream_count(path: str) -> int:
+    return sum(1 for _ in iter_markers(_chunks(path)))
+
+METHODS = {"document": run_document, "stream": run_stream, "stream-count": run_stream_count}
+
+def measure(path: str, runs: int) -> dict:
+    """Time each method and record its peak traced memory.
+
+    Returns:
+        dict: Method name to markers, best time (ms) and peak memory (MiB).
+    """
+    results = {}
+    for name, fn in METHODS.items():
+        times = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            count = fn(path)
+            times.append((time.perf_counter() - started) * 1000)
+        tracemalloc.start()
+        fn(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        results[name] = {
+            "markers": count,
+            "best_ms": round(min(times), 1),
+            "peak_mib": round(peak / (1024 * 1024), 2),
+        }
+    return results
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.benchmarks.geojson_ingest``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: 1 if the methods disagree on the marker count, else 0.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.geojson_ingest")
+    parser.add_argument("--features", type=int, default=50000, help="features in the fixture")
+    parser.add_argument("--runs", type=int, default=3, help="timed runs per method (best reported)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory(prefix="careconnect-geojson-") as workdir:
+        path = os.path.join(workdir, "community_clubs.geojson")
+        write_fixture(path, args.features)
+        size_mib = round(os.path.getsize(path) / (1024 * 1024), 1)
+        results = measure(path, args.runs)
+
+    counts = {r["markers"] for r in results.values()}
+    if args.json:
+        print(json.dumps({"features": args.features, "file_mib": size_mib, "results": results}, indent=2))
+    else:
+        print(f"{args.features} features, {size_mib} MiB")
+        for name, r in results.items():
+            print(f"  {name:<13} {r['best_ms']:>9.1f} ms  peak {r['peak_mib']:>8.2f} MiB  ({r['markers']} markers)")
+    if len(counts) != 1:
+        print(f"FAIL marker counts differ: {sorted(counts)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Import-Time Benchmark for CareConnect Backend.
+
+This module measures the cold-start import cost of the web and worker
+entry modules with ``python -X importtime`` in fresh interpreters, and
+checks that client libraries meant to load lazily (Supabase, Authlib,
+Redis, ...) stay out of the import graph.
+
+It exits 1 when an entry module is over the budget (IMPORT_BUDGET_MS,
+default 1000 ms; both currently import in about 650 ms) or loads a lazy
+module; backend/tests/test_import_time.py enforces the same checks in the
+test suite.
+
+Usage:
+    python -m backend.benchmarks.import_time                    # check against the default budget
+    python -m backend.benchmarks.import_time --budget-ms 800    # tighter budget
+    python -m backend.benchmarks.import_time --budget-ms 0      # report only (lazy modules still fail)
+    python -m backend.benchmarks.import_time backend.jobs --runs 5 --top 15
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DEFAULT_MODULES = ("backend.app", "backend.jobs")
+
+# Milliseconds an entry module may take to import (median of the runs)
+DEFAULT_BUDGET_MS = float(os.getenv("IMPORT_BUDGET_MS", "1000"))
+
+# Imported on first use; importing an entry module must not load them
+LAZY_MODULES = ("supabase", "authlib", "redis", "flask_session", "argon2", "requests", "alembic")
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """Parse ``-X importtime`` output.
+
+    Args:
+        stderr (str): Standard error of the profiled interpreter.
+
+    Returns:
+        list: One dict per import with name, depth, self_us and cumulative_us.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        rows.append({
+            "name": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_us": int(self_us),
+            "cumulative_us": int(cumulative_us),
+        })
+    return rows
+
+def profile_once(module: str) -> List[dict]:
+    """Import ``module`` in a fresh interpreter and return its import rows.
+
+    Raises:
+        RuntimeError: If the import fails.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=REPO_ROOT, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+def measure(module: str, runs: int = 3, top: int = 10) -> Dict[str, object]:
+    """Measure the import time of ``module`` over several cold starts.
+
+    Args:
+        module (str): Dotted module name to import.
+        runs (int): Number of fresh interpreters to time (median is reported).
+        top (int): Number of heaviest direct imports to report.
+
+    Returns:
+        dict: Median total, heaviest direct imports and lazy modules loaded.
+    """
+    totals, rows = [], []
+    for _ in range(runs):
+        rows = profile_once(module)
+        target = next(r for r in rows if r["name"] == module and r["depth"] == 0)
+        totals.append(target["cumulative_us"] / 1000)
+
+    children = sorted((r for r in rows if r["depth"] == 1), key=lambda r: r["cumulative_us"], reverse=True)
+    names = {r["name"] for r in rows}
+    lazy_loaded = sorted(
+        lazy for lazy in LAZY_MODULES
+        if any(n == lazy or n.startswith(lazy + ".") for n in names)
+    )
+    return {
+        "module": module,
+        "total_ms": round(statistics.median(totals), 1),
+        "runs_ms": [round(t, 1) for t in totals],
+        "top": [(r["name"], round(r["cumulative_us"] / 1000, 1)) for r in children[:top]],
+        "lazy_loaded": lazy_loaded,
+    }
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.benchmarks.import_time``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: 0 when every module is within budget and no lazy module was imported.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.import_time")
+    parser.add_argument("modules", nargs="*", default=list(DEFAULT_MODULES))
+    parser.add_argument("--runs", type=int, default=3, help="cold starts per module (median reported)")
+    parser.add_argument("--top", type=int, default=10, help="heaviest direct imports to list")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="fail if a module takes longer (0 disables the budget)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    results = [measure(m, runs=args.runs, top=args.top) for m in args.modules]
+    failures = []
+    for r in results:
+        if args.budget_ms and r["total_ms"] > args.budget_ms:
+            failures.append(f"{r['module']}: {r['total_ms']} ms exceeds budget of {args.budget_ms} ms")
+        if r["lazy_loaded"]:
+            failures.append(f"{r['module']}: imports lazily loaded modules {', '.join(r['lazy_loaded'])}")
+
+    if args.json:
+        print(json.dumps({"results": results, "failures": failures}, indent=2))
+    else:
+        for r in results:
+            print(f"{r['module']}: {r['total_ms']} ms (runs: {r['runs_ms']})")
+            for name, ms in r["top"]:
+                print(f"    {ms:>8.1f} ms  {name}")
+        for f in failures:
+            print(f"FAIL {f}")
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
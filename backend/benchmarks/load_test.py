@@ -0,0 +1,489 @@
+"""Offline Load Test for CareConnect Backend.
+
+This module boots the app against a freshly seeded SQLite database (WAL
+mode, in a temporary directory) and replays a weighted mix of the hot API
+calls from concurrent worker threads through Flask test clients:
+notification polling, map loads, request creation, the donation
+create → approve → add flow and manager dashboards.
+
+Nothing leaves the machine: Supabase storage is replaced by an in-memory
+fake, the data.gov.sg community club markers are generated locally, and
+users are logged in by writing ``user_id`` into their session instead of
+going through Google OAuth. Background schedulers are off.
+
+The report lists throughput plus p50/p95/p99 latency and SQL statements
+per request (from the X-DB-Query-Count header) for each endpoint. Save a
+run as a baseline and compare later runs against it. After the run the
+database is checked for allocation corruption (an item reserved twice, or
+a request whose allocation differs from its reservations); any violation
+fails the run.
+
+Usage:
+    python -m backend.benchmarks.load_test                          # 20 s, 8 workers
+    python -m backend.benchmarks.load_test --workers 16 --duration 60
+    python -m backend.benchmarks.load_test --allocation-mode deferred   # writes without allocation
+    python -m backend.benchmarks.load_test --save-baseline baseline.json
+    python -m backend.benchmarks.load_test --baseline baseline.json --max-regression 20
+"""
+
+import argparse
+import io
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+# (action, weight): how often each user action is picked
+TRAFFIC_MIX = (
+    ("poll_unread_count", 30),
+    ("poll_notifications", 10),
+    ("map_load", 10),
+    ("client_summary", 5),
+    ("my_requests", 5),
+    ("create_request", 8),
+    ("donation_flow", 5),
+    ("manager_dashboard", 10),
+)
+
+SEED_CCS = [f"Load Test CC {i}" for i in range(1, 21)]
+
+# Environment for the app under test, set before backend.config is imported
+_APP_ENV = {
+    "DB_TYPE": "sqlite",
+    "DATABASE_URL": "",
+    "DATABASE_REPLICA_URL": "",
+    "DB_AUTO_MIGRATE": "true",
+    "RUN_SCHEDULERS": "false",
+    "SESSION_TYPE": "filesystem",
+    "SQL_INSTRUMENTATION": "true",
+    "SQL_DEBUG_HEADERS": "true",
+    "PROFILER_TOKEN": "",
+    "GOOGLE_CLIENT_ID": "",
+    "GOOGLE_CLIENT_SECRET": "",
+    "SUPABASE_URL": "",
+    "SUPABASE_SERVICE_KEY": "",
+    "FLASK_SECRET_KEY": "load-test",
+}
+
+class _FakeBucket:
+    def upload(self, file, path, file_options=None):
+        return None
+
+    def get_public_url(self, path):
+        return f"https://storage.invalid/{path}"
+
+class FakeSupabase:
+    """Stand-in for the Supabase client: uploads succeed without network I/O."""
+
+    class _Storage:
+        def from_(self, bucket):
+            return _FakeBucket()
+
+    def __init__(self):
+        self.storage = self._Storage()
+
+def fake_markers(ccs: List[str], random_seed: int = 0) -> List[dict]:
+    """Build community club markers shaped like the data.gov.sg ones.
+
+    Args:
+        ccs (list): Community club names.
+        random_seed (int): Seed for reproducible coordinates.
+
+    Returns:
+        list: Marker dicts with name, address, postal code and lat/lng.
+    """
+    rng = random.Random(random_seed)
+    return [
+        {
+            "name": cc,
+            "address": f"{i} Load Test Road",
+            "postal": f"{100000 + i}",
+            "lat": round(rng.uniform(1.25, 1.45), 6),
+            "lng": round(rng.uniform(103.65, 103.98), 6),
+        }
+        for i, cc in enumerate(ccs, start=1)
+    ]
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(int(round(pct / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+class Recorder:
+    """Thread-safe collection of per-endpoint samples."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.queries: Dict[str, List[int]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    def add(self, endpoint: str, elapsed_ms: float, status: int, query_count: Optional[int]):
+        with self._lock:
+            self.latencies[endpoint].append(elapsed_ms)
+            if query_count is not None:
+                self.queries[endpoint].append(query_count)
+            if status >= 400:
+                self.errors[endpoint] += 1
+
+    def summary(self, duration_s: float) -> dict:
+        """Aggregate the samples into the report/baseline format."""
+        endpoints = {}
+        total = 0
+        for endpoint, values in sorted(self.latencies.items()):
+            values = sorted(values)
+            total += len(values)
+            queries = self.queries.get(endpoint) or []
+            endpoints[endpoint] = {
+                "requests": len(values),
+                "errors": self.errors.get(endpoint, 0),
+                "rps": round(len(values) / duration_s, 1),
+                "p50_ms": round(percentile(values, 50), 2),
+                "p95_ms": round(percentile(values, 95), 2),
+                "p99_ms": round(percentile(values, 99), 2),
+                "avg_queries": round(sum(queries) / len(queries), 2) if queries else None,
+            }
+        return {
+            "duration_s": round(duration_s, 2),
+            "requests": total,
+            "rps": round(total / duration_s, 1),
+            "errors": sum(self.errors.values()),
+            "endpoints": endpoints,
+        }
+
+class VirtualUser:
+    """One worker thread's pair of logged-in clients (a client and a manager).
+
+    Args:
+        app (Flask): Application under test.
+        recorder (Recorder): Sample sink.
+        client_id (int): User id of the client account.
+        manager_id (int): User id of the manager account.
+        cc (str): The manager's community club.
+        rng (random.Random): Worker-local random source.
+    """
+
+    def __init__(self, app, recorder, client_id, manager_id, cc, rng):
+        self.recorder = recorder
+        self.cc = cc
+        self.rng = rng
+        self.client = self._login(app, client_id)
+        self.manager = self._login(app, manager_id)
+
+    @staticmethod
+    def _login(app, user_id):
+        http = app.test_client()
+        with http.session_transaction() as sess:
+            sess["user_id"] = user_id
+        return http
+
+    def call(self, http, method, path, endpoint, **kwargs):
+        started = time.perf_counter()
+        resp = http.open(path, method=method, **kwargs)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        count = resp.headers.get("X-DB-Query-Count")
+        self.recorder.add(endpoint, elapsed_ms, resp.status_code, int(count) if count else None)
+        return resp
+
+    def poll_unread_count(self):
+        self.call(self.client, "GET", "/api/notifications/unread-count", "GET /api/notifications/unread-count")
+
+    def poll_notifications(self):
+        self.call(self.client, "GET", "/api/notifications", "GET /api/notifications")
+
+    def map_load(self):
+        self.call(self.client, "GET", "/api/community-clubs", "GET /api/community-clubs")
+
+    def client_summary(self):
+        self.call(self.client, "GET", "/api/client/cc_summary", "GET /api/client/cc_summary")
+
+    def my_requests(self):
+        self.call(self.client, "GET", "/api/my_requests", "GET /api/my_requests")
+
+    def create_request(self):
+        from backend.database.fixtures import CATEGORY_ITEMS
+        category = self.rng.choice(list(CATEGORY_ITEMS))
+        self.call(self.client, "POST", "/api/requests", "POST /api/requests", json={
+            "request_category": category,
+            "request_item": self.rng.choice(CATEGORY_ITEMS[category]),
+            "request_quantity": self.rng.randint(1, 3),
+            "location": self.rng.choice(SEED_CCS),
+        })
+
+    def donation_flow(self):
+        from backend.database.fixtures import CATEGORY_ITEMS
+        category = self.rng.choice(["Furnitures", "Electronics", "Essentials"])  # no expiry needed
+        resp = self.call(self.client, "POST", "/api/donations", "POST /api/donations", data={
+            "donation_category": category,
+            "donation_item": self.rng.choice(CATEGORY_ITEMS[category]),
+            "donation_quantity": str(self.rng.randint(1, 3)),
+            "location": self.cc,
+            "image": (io.BytesIO(b"\x89PNG\r\n\x1a\n"), "item.png", "image/png"),
+        }, content_type="multipart/form-data")
+        if resp.status_code != 201:
+            return
+        donation_id = resp.get_json()["id"]
+        resp = self.call(self.manager, "POST", f"/api/manager/donations/{donation_id}/approve",
+                         "POST /api/manager/donations/<id>/approve")
+        if resp.status_code == 200:
+            self.call(self.manager, "POST", f"/api/manager/donations/{donation_id}/add",
+                      "POST /api/manager/donations/<id>/add")
+
+    def manager_dashboard(self):
+        self.call(self.manager, "GET", "/api/manager/cc_summary", "GET /api/manager/cc_summary")
+        self.call(self.manager, "GET", "/api/manager/donations", "GET /api/manager/donations")
+        self.call(self.manager, "GET", "/api/manager/matched_requests", "GET /api/manager/matched_requests")
+        self.call(self.manager, "GET", f"/api/manager/inventory/{self.cc}", "GET /api/manager/inventory/<cc>")
+
+def build_app(workdir: str, clients: int, requests: int, donations: int, random_seed: int):
+    """Create the app on a seeded SQLite database with external services stubbed.
+
+    Allocation runs once after seeding, so the measured writes see a steady
+    queue instead of the whole backlog being matched on the first one.
+
+    Args:
+        workdir (str): Directory for the database and session files.
+        clients (int): Client accounts to seed.
+        requests (int): Pending requests to seed.
+        donations (int): Added donations to seed.
+        random_seed (int): Seed for reproducible data.
+
+    Returns:
+        tuple: (Flask app, client user ids, manager user id by CC).
+    """
+    os.environ.update(_APP_ENV)
+    os.environ["SQLITE_PATH"] = os.path.join(workdir, "loadtest.db")
+    os.chdir(workdir)  # Flask-Session's filesystem store lives in the cwd
+
+    from backend.app import create_app
+    from backend.services.cc_cache import cc_cache
+    from backend.database.fixtures import seed
+    from backend.extensions import db
+    from backend.models import Client, Manager
+    from backend.services.run_allocation import run_allocation
+
+    markers = fake_markers(SEED_CCS, random_seed)
+    cc_cache.fetch = lambda: markers
+    cc_cache.path = os.path.join(workdir, "cc_markers.json")
+    cc_cache.set(markers)
+
+    app = create_app(start_schedulers=False)
+    app._supabase = FakeSupabase()
+    with app.app_context():
+        seed(db, ccs=SEED_CCS, clients=clients, requests=requests, donations=donations,
+             random_seed=random_seed)
+        run_allocation()
+        client_ids = [c.user_id for c in Client.query.all()]
+        managers = {m.cc: m.user_id for m in Manager.query.all()}
+    return app, client_ids, managers
+
+def run_load(app, client_ids, managers, workers: int, duration: float, warmup: float,
+             random_seed: int) -> dict:
+    """Replay TRAFFIC_MIX from ``workers`` threads for ``duration`` seconds.
+
+    Args:
+        app (Flask): Application under test.
+        client_ids (list): Client user ids to log in as.
+        managers (dict): CC name to manager user id.
+        workers (int): Concurrent worker threads.
+        duration (float): Measured run time in seconds.
+        warmup (float): Unmeasured run time before measuring.
+        random_seed (int): Seed for each worker's action sequence.
+
+    Returns:
+        dict: Recorder summary of the measured period.
+    """
+    actions = [name for name, _ in TRAFFIC_MIX]
+    weights = [weight for _, weight in TRAFFIC_MIX]
+    measured = Recorder()
+    warming = Recorder()
+    phase = {"recorder": warming}
+    stop = threading.Event()
+    failures = []
+
+    def worker(index):
+        rng = random.Random(random_seed + index)
+        cc = SEED_CCS[index % len(SEED_CCS)]
+        user = VirtualUser(app, warming, rng.choice(client_ids), managers[cc], cc, rng)
+        while not stop.is_set():
+            user.recorder = phase["recorder"]
+            try:
+                getattr(user, rng.choices(actions, weights)[0])()
+            except Exception as e:  # keep the other workers going
+                failures.append(repr(e))
+                stop.set()
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(workers)]
+    for t in threads:
+        t.start()
+    time.sleep(warmup)
+    phase["recorder"] = measured
+    started = time.perf_counter()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+    if failures:
+        raise RuntimeError(f"worker crashed: {failures[0]}")
+    return measured.summary(time.perf_counter() - started)
+
+def check_integrity(app) -> List[str]:
+    """Check the allocation invariants after concurrent writes.
+
+    Args:
+        app (Flask): Application under test.
+
+    Returns:
+        list: One message per violation (empty if the data is consistent).
+    """
+    from sqlalchemy import func
+    from backend.extensions import db
+    from backend.models import Request, Reservation
+
+    with app.app_context():
+        double_booked = (db.session.query(Reservation.item_id, func.count(Reservation.id))
+            .group_by(Reservation.item_id)
+            .having(func.count(Reservation.id) > 1)
+            .all())
+        reserved = (db.session.query(Reservation.request_id, func.count(Reservation.id).label("n"))
+            .group_by(Reservation.request_id)
+            .subquery())
+        mismatched = (db.session.query(Request.id, Request.allocation, func.coalesce(reserved.c.n, 0))
+            .outerjoin(reserved, reserved.c.request_id == Request.id)
+            .filter(Request.allocation != func.coalesce(reserved.c.n, 0))
+            .all())
+    return (
+        [f"item {item_id} has {n} reservations" for item_id, n in double_booked]
+        + [f"request {rid} has allocation {alloc} but {n} reservations" for rid, alloc, n in mismatched]
+    )
+
+def compare(current: dict, baseline: dict) -> List[dict]:
+    """Compare a run against a saved baseline.
+
+    Args:
+        current (dict): Summary of this run.
+        baseline (dict): Summary loaded from a baseline file.
+
+    Returns:
+        list: Per-endpoint p95/throughput/query changes in percent.
+    """
+    def change(new, old):
+        return round((new - old) / old * 100, 1) if old else None
+
+    rows = []
+    for endpoint, cur in current["endpoints"].items():
+        old = baseline.get("endpoints", {}).get(endpoint)
+        if not old:
+            continue
+        rows.append({
+            "endpoint": endpoint,
+            "p95_change_pct": change(cur["p95_ms"], old["p95_ms"]),
+            "rps_change_pct": change(cur["rps"], old["rps"]),
+            "queries_change": (
+                round(cur["avg_queries"] - old["avg_queries"], 2)
+                if cur["avg_queries"] is not None and old.get("avg_queries") is not None else None
+            ),
+        })
+    return rows
+
+def print_report(summary: dict, comparison: Optional[List[dict]] = None):
+    print(f"{summary['requests']} requests in {summary['duration_s']} s: "
+          f"{summary['rps']} req/s, {summary['errors']} errors")
+    print(f"{'endpoint':<48} {'reqs':>6} {'err':>4} {'req/s':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'queries':>8}")
+    for endpoint, e in summary["endpoints"].items():
+        queries = "-" if e["avg_queries"] is None else f"{e['avg_queries']:.1f}"
+        print(f"{endpoint:<48} {e['requests']:>6} {e['errors']:>4} {e['rps']:>7} "
+              f"{e['p50_ms']:>8.1f} {e['p95_ms']:>8.1f} {e['p99_ms']:>8.1f} {queries:>8}")
+    if comparison:
+        print("\nvs baseline:")
+        for row in comparison:
+            print(f"{row['endpoint']:<48} p95 {row['p95_change_pct']:+}%  req/s {row['rps_change_pct']:+}%"
+                  f"  queries {row['queries_change'] if row['queries_change'] is not None else '-'}")
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.benchmarks.load_test``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: 1 if a worker crashed, the allocation data is inconsistent after
+        the run, or p95 regressed beyond --max-regression, else 0.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.benchmarks.load_test")
+    parser.add_argument("--workers", type=int, default=8, help="concurrent worker threads")
+    parser.add_argument("--duration", type=float, default=20, help="measured seconds")
+    parser.add_argument("--warmup", type=float, default=3, help="unmeasured seconds before measuring")
+    parser.add_argument("--clients", type=int, default=300, help="seeded client accounts")
+    parser.add_argument("--requests", type=int, default=1000, help="seeded Pending requests")
+    parser.add_argument("--donations", type=int, default=400, help="seeded Added donations")
+    parser.add_argument("--allocation-mode", choices=["sync", "deferred", "auto"], default=None,
+                        help="override ALLOCATION_MODE (deferred skips allocation: no scheduler runs)")
+    parser.add_argument("--seed", type=int, default=0, help="random seed for data and traffic")
+    parser.add_argument("--save-baseline", metavar="PATH", help="write this run's results as JSON")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved run")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="fail if any endpoint's p95 is this many percent slower than the baseline")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--verbose", action="store_true", help="keep slow-query and N+1 warnings")
+    args = parser.parse_args(argv)
+
+    save_path = os.path.abspath(args.save_baseline) if args.save_baseline else None
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    if args.allocation_mode:
+        os.environ["ALLOCATION_MODE"] = args.allocation_mode
+    with tempfile.TemporaryDirectory(prefix="careconnect-load-") as workdir:
+        cwd = os.getcwd()
+        try:
+            app, client_ids, managers = build_app(
+                workdir, args.clients, args.requests, args.donations, args.seed
+            )
+            if not args.verbose:
+                app.logger.setLevel(logging.ERROR)
+            summary = run_load(app, client_ids, managers, args.workers, args.duration,
+                               args.warmup, args.seed)
+            violations = check_integrity(app)
+        except RuntimeError as e:
+            print(f"FAIL {e}")
+            return 1
+        finally:
+            os.chdir(cwd)
+
+    summary["config"] = {k: getattr(args, k) for k in ("workers", "clients", "requests", "donations", "seed", "allocation_mode")}
+    summary["integrity_violations"] = violations
+    comparison = compare(summary, baseline) if baseline else None
+    if save_path:
+        with open(save_path, "w") as f:
+            json.dump(summary, f, indent=2)
+
+    if args.json:
+        print(json.dumps({"summary": summary, "comparison": comparison}, indent=2))
+    else:
+        print_report(summary, comparison)
+
+    for v in violations[:20]:
+        print(f"FAIL integrity: {v}")
+    if len(violations) > 20:
+        print(f"FAIL integrity: ... {len(violations) - 20} more")
+
+    slower = []
+    if comparison and args.max_regression is not None:
+        slower = [r for r in comparison if (r["p95_change_pct"] or 0) > args.max_regression]
+        for r in slower:
+            print(f"FAIL {r['endpoint']}: p95 {r['p95_change_pct']:+}% exceeds {args.max_regression}%")
+    return 1 if slower or violations else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
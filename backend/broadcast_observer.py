@@ -76,10 +76,10 @@ class ISubject(ABC):
 class SubscriptionObserver(IObserver):
     """Observer for user subscription to CC broadcasts.
     
-    Represents ONE subscription (user_email + cc).
+    Represents ONE subscription (user_id + cc).
     Uses pull model: when update() is called, it pulls subject.get_desc(cc).
     """
-    user_email: str
+    user_id: int
     cc: str
     _subject : ISubject
     _notification_strategy: DatabaseNotificationStrategy = DatabaseNotificationStrategy()
@@ -96,7 +96,7 @@ class SubscriptionObserver(IObserver):
         now = datetime.now(timezone.utc)
         msg = f"⚠️ {self.cc}: {desc}"
         try:
-            self._notification_strategy.create_notification(msg, self.user_email)
+            self._notification_strategy.create_notification(msg, self.user_id)
         except Exception:
             db.session.rollback()
             raise
@@ -149,16 +149,16 @@ class CCFulfilmentSubject(ISubject):
         return self.desc
 
     # --- Utilities for routes ---
-    def find(self, user_email: str, cc: str) -> Optional[IObserver]:
+    def find(self, user_id: int, cc: str) -> Optional[IObserver]:
         with self._lock:
             for o in self._observers:
-                if o.user_email == user_email and o.cc == cc:
+                if o.user_id == user_id and o.cc == cc:
                     return o
         return None
 
-    def subscriptions_for_user(self, user_email: str) -> List[IObserver]:
+    def subscriptions_for_user(self, user_id: int) -> List[IObserver]:
         with self._lock:
-            return [o for o in self._observers if o.user_email == user_email]
+            return [o for o in self._observers if o.user_id == user_id]
 
     # --- Business helper invoked by metrics ---
     def maybe_broadcast(self, cc: str, fulfilment_rate: float) -> None:
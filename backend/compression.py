@@ -0,0 +1,75 @@
+"""Response Compression for CareConnect Backend.
+
+This module compresses text and JSON responses above COMPRESS_MIN_BYTES
+with the best encoding the client accepts: brotli when the optional
+``brotli`` package is installed, otherwise gzip. Disable it with
+COMPRESS_ENABLED=false when a reverse proxy already compresses.
+"""
+
+import gzip
+from functools import lru_cache
+
+from flask import current_app, request
+
+_COMPRESSIBLE = ("application/json", "application/javascript", "image/svg+xml")
+
+@lru_cache(maxsize=None)
+def _brotli():
+    """Return the brotli module, or None when it is not installed."""
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+def _encoders() -> dict:
+    """Map of available content codings to compression functions."""
+    cfg = current_app.config
+    encoders = {"gzip": lambda data: gzip.compress(data, compresslevel=cfg.get("COMPRESS_GZIP_LEVEL", 6))}
+    brotli = _brotli()
+    if brotli is not None:
+        encoders["br"] = lambda data: brotli.compress(data, quality=cfg.get("COMPRESS_BROTLI_QUALITY", 5))
+    return encoders
+
+def _compressible(response) -> bool:
+    mimetype = response.mimetype or ""
+    return (
+        200 <= response.status_code < 300
+        and response.status_code != 204
+        and not response.direct_passthrough
+        and not response.is_streamed
+        and "Content-Encoding" not in response.headers
+        and (mimetype.startswith("text/") or mimetype in _COMPRESSIBLE)
+    )
+
+def _compress_response(response):
+    if response.status_code == 304:
+        response.vary.add("Accept-Encoding")  # same Vary as the 200 it revalidates
+    if not _compressible(response):
+        return response
+    response.vary.add("Accept-Encoding")  # caches must key on the negotiated coding
+    data = response.get_data()
+    if len(data) < current_app.config.get("COMPRESS_MIN_BYTES", 1024):
+        return response
+
+    encoders = _encoders()
+    # Prefer brotli when the client weights it at least as high as gzip
+    coding = request.accept_encodings.best_match(sorted(encoders, key=lambda c: c != "br"))
+    if coding is None:
+        return response
+
+    response.set_data(encoders[coding](data))
+    response.headers["Content-Encoding"] = coding
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)  # the bytes differ from the identity encoding
+    return response
+
+def init_compression(app):
+    """Compress eligible responses of ``app``.
+
+    Args:
+        app (Flask): Flask application instance.
+    """
+    if app.config.get("COMPRESS_ENABLED", True):
+        app.after_request(_compress_response)
@@ -22,12 +22,52 @@ class Config:
     # Flask application settings
     SECRET_KEY = os.getenv("FLASK_SECRET_KEY")
     SESSION_TYPE = os.getenv("SESSION_TYPE", "filesystem")
+    SESSION_FILE_DIR = os.getenv("SESSION_FILE_DIR", os.path.join(os.getcwd(), "flask_session"))
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "http://localhost:5173")
 
-    # Database configuration
+    # Response compression (brotli needs the optional `brotli` package).
+    # Turn off when a reverse proxy already compresses responses.
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "true").lower() == "true"
+    COMPRESS_MIN_BYTES = int(os.getenv("COMPRESS_MIN_BYTES", "1024"))
+    COMPRESS_GZIP_LEVEL = int(os.getenv("COMPRESS_GZIP_LEVEL", "6"))
+    COMPRESS_BROTLI_QUALITY = int(os.getenv("COMPRESS_BROTLI_QUALITY", "5"))
+
+    # Database configuration: DB_TYPE is "postgres", "sqlite" or "memory"
+    DB_TYPE = os.getenv("DB_TYPE", "postgres")
     SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL")
     SQLALCHEMY_TRACK_MODIFICATIONS = False  # Disable event system for performance
+    DB_AUTO_MIGRATE = os.getenv("DB_AUTO_MIGRATE", "false").lower() == "true"  # upgrade schema at startup
+
+    # SQL instrumentation: slow-query log threshold, repeats of one statement
+    # per request that count as N+1, and X-DB-* debug headers (dev only by default)
+    SQL_INSTRUMENTATION = os.getenv("SQL_INSTRUMENTATION", "true").lower() == "true"
+    SQL_SLOW_QUERY_MS = float(os.getenv("SQL_SLOW_QUERY_MS", "200"))
+    SQL_NPLUS1_THRESHOLD = int(os.getenv("SQL_NPLUS1_THRESHOLD", "10"))
+
+    # Optional read replica for read-only endpoints (e.g. sqlite:///replica.db
+    # locally: that file is refreshed from the primary after each write).
+    # After a write, the user's reads stay on the primary for REPLICA_PIN_SECONDS.
+    DATABASE_REPLICA_URL = os.getenv("DATABASE_REPLICA_URL")
+    REPLICA_PIN_SECONDS = float(os.getenv("REPLICA_PIN_SECONDS", "5"))
+
+    # Connection pooling (PostgreSQL). Size the pool against worker concurrency:
+    # workers * threads should not exceed pool_size + max_overflow per process.
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))         # seconds to wait for a connection
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))       # seconds before reconnecting
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    DB_STATEMENT_TIMEOUT_MS = int(os.getenv("DB_STATEMENT_TIMEOUT_MS", "0"))  # 0 = no limit; per transaction behind PgBouncer
+    DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "false").lower() == "true"  # NullPool behind PgBouncer
+
+    # SQLite settings (file path relative to the instance folder, or ":memory:"
+    # for a shared in-memory database)
+    SQLITE_PATH = os.getenv("SQLITE_PATH", "app.db")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
 
     # Supabase storage configuration
     SUPABASE_URL = os.getenv("SUPABASE_URL")
@@ -40,3 +80,70 @@ class Config:
 
     # Application environment
     ENV = os.getenv("FLASK_ENV", "development")
+    SQL_DEBUG_HEADERS = os.getenv("SQL_DEBUG_HEADERS", str(ENV != "production")).lower() == "true"
+
+    # On-demand profiler: requests sending this token in an X-Profile header
+    # (or ?__profile=) are profiled. Unset = profiler not installed at all.
+    # PROFILER_MODE is "sampling" (.folded stacks) or "cprofile" (.prof).
+    PROFILER_TOKEN = os.getenv("PROFILER_TOKEN")
+    PROFILER_MODE = os.getenv("PROFILER_MODE", "sampling").lower()
+    PROFILER_DIR = os.getenv("PROFILER_DIR", "/tmp/careconnect-profiles")
+    PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "5"))
+    PROFILER_MAX_PER_MINUTE = int(os.getenv("PROFILER_MAX_PER_MINUTE", "6"))
+    PROFILER_MAX_FILES = int(os.getenv("PROFILER_MAX_FILES", "50"))
+
+    # Prometheus /metrics. Under gunicorn the workers aggregate samples via
+    # files in METRICS_MULTIPROC_DIR (exported as PROMETHEUS_MULTIPROC_DIR)
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_MULTIPROC_DIR = os.getenv("PROMETHEUS_MULTIPROC_DIR", "/tmp/careconnect-metrics")
+
+    # Argon2 password hashing costs (memory in KiB; see
+    # `python -m backend.services.password calibrate`), plus the per-process
+    # pool: hashes running at once and how many more may wait before
+    # logins get a 503. Each running hash holds PASSWORD_MEMORY_COST.
+    PASSWORD_TIME_COST = int(os.getenv("PASSWORD_TIME_COST", "3"))
+    PASSWORD_MEMORY_COST = int(os.getenv("PASSWORD_MEMORY_COST", "65536"))
+    PASSWORD_PARALLELISM = int(os.getenv("PASSWORD_PARALLELISM", "1"))
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))
+    PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "16"))
+
+    # Logged-in user + Client/Manager rows cached per process for this long
+    # (0 = per request only). Commits invalidate them in the writing process;
+    # other workers see account status/role changes after the TTL
+    USER_CONTEXT_TTL_SECONDS = float(os.getenv("USER_CONTEXT_TTL_SECONDS", "5"))
+    USER_CONTEXT_CACHE_SIZE = int(os.getenv("USER_CONTEXT_CACHE_SIZE", "2048"))
+
+    # Community club markers (data.gov.sg): disk copy shared by workers, age
+    # after which they are refreshed in the background, retry backoff, and
+    # how long one worker may hold the cluster-wide refresh lease
+    CC_DATASET_ID = os.getenv("CC_DATASET_ID", "d_f706de1427279e61fe41e89e24d440fa")
+    CC_CACHE_FILE = os.getenv("CC_CACHE_FILE", "/tmp/careconnect-cc-markers.json")
+    CC_CACHE_TTL_SECONDS = int(os.getenv("CC_CACHE_TTL_SECONDS", "3600"))
+    CC_CACHE_RETRY_SECONDS = int(os.getenv("CC_CACHE_RETRY_SECONDS", "300"))
+    CC_CACHE_LEASE_SECONDS = int(os.getenv("CC_CACHE_LEASE_SECONDS", "120"))
+
+    # Background jobs: set to "false" in web workers when jobs run in a
+    # separate `python -m backend.jobs scheduler` process
+    RUN_SCHEDULERS = os.getenv("RUN_SCHEDULERS", "true").lower() == "true"
+    # Under gunicorn only the worker holding this file lock runs the schedulers
+    SCHEDULER_LOCK_FILE = os.getenv("SCHEDULER_LOCK_FILE", "/tmp/careconnect-scheduler.lock")
+
+    # Gunicorn (backend/gunicorn.conf.py): worker processes, worker class
+    # ("sync" or "gthread"), threads per worker, bind address and timeout
+    GUNICORN_WORKERS = int(os.getenv("GUNICORN_WORKERS", str((os.cpu_count() or 1) * 2 + 1)))
+    GUNICORN_WORKER_CLASS = os.getenv("GUNICORN_WORKER_CLASS", "gthread")
+    GUNICORN_THREADS = int(os.getenv("GUNICORN_THREADS", "4"))
+    GUNICORN_BIND = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '5000')}")
+    GUNICORN_TIMEOUT = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+
+    # Allocation job: periodic interval, debounce window for on-demand runs,
+    # and whether request handlers allocate inline ("sync"), hand off to the
+    # background allocator ("deferred"), or hand off only when busy ("auto")
+    ALLOCATION_INTERVAL_SECONDS = int(os.getenv("ALLOCATION_INTERVAL_SECONDS", "600"))
+    ALLOCATION_DEBOUNCE_SECONDS = float(os.getenv("ALLOCATION_DEBOUNCE_SECONDS", "5"))
+    ALLOCATION_MODE = os.getenv("ALLOCATION_MODE", "sync").lower()
+    # Cross-CC fallback: after matching within each CC, fill what is still
+    # missing from the K nearest other CCs within RADIUS_KM
+    ALLOCATION_CROSS_CC = os.getenv("ALLOCATION_CROSS_CC", "false").lower() == "true"
+    ALLOCATION_CROSS_CC_K = int(os.getenv("ALLOCATION_CROSS_CC_K", "3"))
+    ALLOCATION_CROSS_CC_RADIUS_KM = float(os.getenv("ALLOCATION_CROSS_CC_RADIUS_KM", "3"))
@@ -0,0 +1,39 @@
+"""Admin Controller for CareConnect Backend.
+
+This module exposes operational information about the running backend,
+such as database connection pool statistics and Prometheus metrics.
+"""
+
+from ..database.pool_stats import get_pool_stats
+from ..database.query_stats import get_query_stats
+from ..services.telemetry import render_metrics
+
+class AdminController:
+    """Controller for operational/admin endpoints."""
+
+    @staticmethod
+    def pool_status():
+        """Get connection pool statistics for every database bind.
+        
+        Returns:
+            dict: Bind name to checkout-wait and utilisation statistics.
+        """
+        return {"pools": get_pool_stats()}
+
+    @staticmethod
+    def query_status():
+        """Get per-endpoint SQL statement counts and timings.
+        
+        Returns:
+            dict: Endpoint name to query totals and averages.
+        """
+        return {"endpoints": get_query_stats()}
+
+    @staticmethod
+    def metrics():
+        """Render request, database, job and allocation metrics.
+        
+        Returns:
+            tuple: (Prometheus text exposition bytes, content type).
+        """
+        return render_metrics()
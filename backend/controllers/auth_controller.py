@@ -5,7 +5,7 @@ supporting both Google OAuth and password-based authentication.
 """
 
 from flask import jsonify, redirect, url_for, session, request
-from ..extensions import oauth
+from ..extensions import get_oauth
 from ..services.auth_strategies import (
     AuthenticationContext,
     GoogleOAuthStrategy,
@@ -30,7 +30,7 @@ class AuthController:
             Response: Redirect response to Google OAuth authorization URL.
         """
         redirect_uri = url_for("auth.auth_callback", _external=True)
-        return oauth.google.authorize_redirect(redirect_uri)
+        return get_oauth().google.authorize_redirect(redirect_uri)
 
     @staticmethod
     def google_callback(frontend_origin: str):
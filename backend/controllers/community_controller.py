@@ -5,16 +5,14 @@ including fulfilment rate calculations for each community club.
 """
 
 from flask import jsonify, request
-import time
 from sqlalchemy import func
 from ..extensions import db
-from ..models import Request
-from ..services.community_clubs import fetch_cc_markers_from_api
+from ..models import CommunityClub, Request
+from ..services.cc_cache import cc_cache
 
-# simple in-memory cache (module-level)
-_cc_cache = {"markers": None, "ts": 0}
-_CACHE_TTL = 3600
-_DATASET_ID = "d_f706de1427279e61fe41e89e24d440fa"
+# Result sizes for /community-clubs/nearest
+_DEFAULT_NEAREST = 5
+_MAX_NEAREST = 100
 
 class CCController:
     """Controller for community club operations.
@@ -31,35 +29,40 @@ class CCController:
         Returns:
             tuple: JSON response with markers array and HTTP status code.
         """
-        now = time.time()
-        if not _cc_cache["markers"] or (now - _cc_cache["ts"] > _CACHE_TTL):
-            try:
-                _cc_cache["markers"] = fetch_cc_markers_from_api(_DATASET_ID)
-                _cc_cache["ts"] = now
-            except Exception as e:
-                return jsonify({"error": str(e)}), 502
+        # Stale markers are served while a background refresh runs
+        try:
+            snapshot = cc_cache.get_snapshot()
+        except Exception as e:
+            return jsonify({"error": str(e)}), 502
 
         q = (request.args.get("q") or "").strip().lower()
-        markers = _cc_cache["markers"]
+        markers = snapshot.markers
         if q:
-            tokens = [t for t in q.split() if t]
-            markers = [m for m in markers if all(t in m["name"].lower() for t in tokens)]
+            # Every name containing all query tokens, from the index:
+            # token-prefix matches first, then infix ("pines" in "Tampines")
+            markers = [markers[i] for i in snapshot.search.search(q)]
+        markers = [dict(m) for m in markers]  # fulfilment fields are per response
 
         # Calculate fulfillment rates for each community club
-        # Request.location stores the CC name selected by users
+        # (one grouped query for all of them, by CommunityClub id)
         names = [m["name"] for m in markers]
         if names:
+            rows = (
+                db.session.query(
+                    CommunityClub.name,
+                    func.sum(Request.request_quantity),
+                    func.sum(Request.allocation)
+                )
+                .join(Request, Request.cc_id == CommunityClub.id)
+                .filter(CommunityClub.name.in_(names))
+                .group_by(CommunityClub.name)
+                .all()
+            )
+            totals = {name: (r_qty, r_alloc) for name, r_qty, r_alloc in rows}
             for m in markers:
-                cc_name = m["name"]
-
-                # Aggregate request quantities and allocations for this CC
-                req_row = db.session.query(
-                        func.sum(Request.request_quantity),
-                        func.sum(Request.allocation)
-                ).filter(Request.location == cc_name).first()
-
-                r_qty = req_row[0] if req_row[0] else 0    # Total requested
-                r_alloc = req_row[1] if req_row[1] else 0  # Total allocated
+                r_qty, r_alloc = totals.get(m["name"], (0, 0))
+                r_qty = r_qty or 0      # Total requested
+                r_alloc = r_alloc or 0  # Total allocated
 
                 # Calculate fulfillment rate (100% if no requests)
                 if r_qty == 0:
@@ -69,9 +72,48 @@ class CCController:
                 
                 # Add fulfillment metrics to marker data
                 m["fulfilmentRate"] = rate  # e.g., 0.67 (67%)
-                m["lowFulfilment"] = (rate is not None) and (rate < 0.5) and req_row[0]
-        else:
-            # No markers found, skip fulfillment calculation
-            pass
+                m["lowFulfilment"] = (rate is not None) and (rate < 0.5) and r_qty
 
         return jsonify({"markers": markers})
+
+    @staticmethod
+    def nearest_community_clubs():
+        """Get the community clubs nearest to a location.
+        
+        Query parameters: ``lat`` and ``lng`` (degrees, required), ``k``
+        (number of clubs, default 5, at most 100) and ``radius_km``
+        (only clubs within this distance; without ``k`` returns all of them).
+        
+        Returns:
+            tuple: JSON response with markers (nearest first, each with
+            ``distance_km``) and HTTP status code.
+        """
+        try:
+            lat = float(request.args["lat"])
+            lng = float(request.args["lng"])
+        except (KeyError, ValueError):
+            return jsonify({"message": "lat and lng are required numbers"}), 400
+        if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+            return jsonify({"message": "lat/lng out of range"}), 400
+
+        radius = request.args.get("radius_km")
+        k = request.args.get("k")
+        try:
+            radius = float(radius) if radius is not None else None
+            k = int(k) if k is not None else (None if radius is not None else _DEFAULT_NEAREST)
+            if (radius is not None and radius <= 0) or (k is not None and not 1 <= k <= _MAX_NEAREST):
+                raise ValueError
+        except ValueError:
+            return jsonify({"message": f"k must be 1-{_MAX_NEAREST} and radius_km positive"}), 400
+
+        try:
+            snapshot = cc_cache.get_snapshot()
+        except Exception as e:
+            return jsonify({"error": str(e)}), 502
+
+        if radius is not None:
+            hits = snapshot.geo.within(lat, lng, radius, limit=k)
+        else:
+            hits = snapshot.geo.nearest(lat, lng, k)
+        markers = [{**snapshot.markers[i], "distance_km": round(km, 3)} for i, km in hits]
+        return jsonify({"markers": markers}), 200
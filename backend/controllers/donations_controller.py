@@ -7,13 +7,16 @@ approval workflow, and inventory management for donated items.
 from flask import jsonify, request
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from ..extensions import db
-from ..models import Donation, Item, Request, Reservation
-from ..services.find_user import get_current_user, find_manager_by_email
+from ..models import Donation, Item, Request, Reservation, Manager, User
+from ..services.find_user import get_current_user
+from ..services.user_context import current_manager
 from ..services.image_upload import upload_image_to_supabase
+from ..services.cc_registry import cc_id_for
 from datetime import datetime, timezone
-from ..services.run_allocation import run_allocation
+from ..controllers.jobs_controller import JobsController
 from ..services.notification_strategies import DatabaseNotificationStrategy
 from ..services.find_user import find_managers_by_cc
+from ..serializers import donation_serializer
 
 class DonationController:
     """Controller for donation management operations.
@@ -36,19 +39,10 @@ class DonationController:
         if not u: return jsonify({"message": "Unauthorized"}), 401
 
         d = Donation.query.get(donation_id)
-        if not d or d.donor_email != u.email:
+        if not d or d.donor_id != u.id:
             return jsonify({"message": "Not found"}), 404
 
-        return jsonify({
-            "id": d.id,
-            "donation_category": d.donation_category,
-            "donation_item": d.donation_item,
-            "donation_quantity": d.donation_quantity,
-            "location": d.location,
-            "status": d.status,
-            "image_link": d.image_link,
-            "expiryDate": d.expiryDate.isoformat() if d.expiryDate else None,
-        }), 200
+        return jsonify(donation_serializer(d)), 200
 
     def update_pending_donation(donation_id: int, supabase, bucket):
         """Update a pending donation.
@@ -68,7 +62,7 @@ class DonationController:
         if not u: return jsonify({"message": "Unauthorized"}), 401
 
         d = Donation.query.get(donation_id)
-        if not d or d.donor_email != u.email:
+        if not d or d.donor_id != u.id:
             return jsonify({"message": "Not found"}), 404
 
         if d.status != "Pending":
@@ -100,7 +94,9 @@ class DonationController:
             d.donation_category = donation_category
             d.donation_item = donation_item
             d.donation_quantity = donation_quantity
-            d.location = location
+            if location != d.location:
+                d.cc_id = cc_id_for(location)
+                d.location = location
             d.expiryDate = expiry_date
 
             # optional new image
@@ -129,7 +125,7 @@ class DonationController:
         if not u: return jsonify({"message": "Unauthorized"}), 401
 
         d = Donation.query.get(donation_id)
-        if not d or d.donor_email != u.email:
+        if not d or d.donor_id != u.id:
             return jsonify({"message": "Not found"}), 404
 
         if d.status not in ("Pending", "Approved"):
@@ -196,8 +192,8 @@ class DonationController:
             return jsonify({"message": f"Image upload failed: {e}"}), 400
 
         d = Donation(
-            donor_email=u.email, donation_category=donation_category, donation_item=donation_item,
-            donation_quantity=donation_quantity, location=location, status="Pending",
+            donor_id=u.id, donation_category=donation_category, donation_item=donation_item,
+            donation_quantity=donation_quantity, cc_id=cc_id_for(location), location=location, status="Pending",
             image_link=public_url, expiryDate=expiry_date
         )
         db.session.add(d); db.session.commit()
@@ -211,7 +207,7 @@ class DonationController:
                     f"submitted by {u.name} ({u.email}). Please review and approve/reject."
                 )
                 notification_strategy = DatabaseNotificationStrategy()
-                notification_strategy.create_notification(message=msg, receiver_email=manager.email)
+                notification_strategy.create_notification(message=msg, receiver_id=manager.user_id)
 
         except Exception as e:
             # Soft-fail the notifications (donation was already created successfully)
@@ -230,13 +226,8 @@ class DonationController:
         """
         u = get_current_user()
         if not u: return jsonify({"message": "Unauthorized"}), 401
-        rows = Donation.query.filter_by(donor_email=u.email).order_by(Donation.id.desc()).all()
-        data = [{
-            "id": d.id, "donation_category": d.donation_category, "donation_item": d.donation_item,
-            "donation_quantity": d.donation_quantity, "location": d.location,
-            "image_link": d.image_link, "status": d.status, "expiryDate":d.expiryDate
-        } for d in rows]
-        return jsonify({"donations": data}), 200
+        rows = Donation.query.filter_by(donor_id=u.id).order_by(Donation.id.desc()).all()
+        return jsonify({"donations": donation_serializer.many(rows)}), 200
 
     def manager_list_donations():
         """Get donations for manager's community club.
@@ -246,18 +237,12 @@ class DonationController:
         """
         u = get_current_user()
         if not u: return jsonify({"message": "Unauthorized"}), 401
-        m = find_manager_by_email(u.email)
-        rows = Donation.query.filter(Donation.location == m.cc, Donation.status.in_(["Pending", "Approved"]))\
+        m = current_manager()
+        rows = db.session.query(Donation, User.email).join(User, User.id == Donation.donor_id)\
+                            .filter(Donation.cc_id == m.cc_id, Donation.status.in_(["Pending", "Approved"]))\
                             .order_by(Donation.id.desc()).all()
-        def ser(d: Donation):
-            return {
-                "id": d.id, "donor_email": d.donor_email, "donation_category": d.donation_category,
-                "donation_item": d.donation_item, "donation_quantity": d.donation_quantity,
-                "location": d.location, "image_link": d.image_link, "status": d.status,
-                "expiryDate": d.expiryDate.isoformat() if d.expiryDate else None,
-            }
-        pending = [ser(d) for d in rows if d.status == "Pending"]
-        approved = [ser(d) for d in rows if d.status == "Approved"]
+        pending = [donation_serializer(d, donor_email=e) for d, e in rows if d.status == "Pending"]
+        approved = [donation_serializer(d, donor_email=e) for d, e in rows if d.status == "Approved"]
         return jsonify({"pending": pending, "approved": approved}), 200
 
     def manager_approve(donation_id: int):
@@ -271,10 +256,10 @@ class DonationController:
         """
         u = get_current_user()
         if not u: return jsonify({"message": "Unauthorized"}), 401
-        m = find_manager_by_email(u.email)
+        m = current_manager()
         d = Donation.query.get(donation_id)
         if not d: return jsonify({"message": "Donation not found"}), 404
-        if d.location != m.cc: return jsonify({"message": "Cannot modify donations outside your CC"}), 403
+        if d.cc_id != m.cc_id: return jsonify({"message": "Cannot modify donations outside your CC"}), 403
         if d.status != "Pending": return jsonify({"message": "Only Pending donations can be approved"}), 400
         d.status = "Approved"; db.session.commit()
 
@@ -284,7 +269,7 @@ class DonationController:
             "Please come down within 2 days to donate your items. Thanks for contributing!"
         )
         notification_strategy = DatabaseNotificationStrategy()
-        notification_strategy.create_notification(message=msg, receiver_email=d.donor_email)
+        notification_strategy.create_notification(message=msg, receiver_id=d.donor_id)
 
         return jsonify({"ok": True, "id": d.id, "status": d.status}), 200
 
@@ -299,10 +284,10 @@ class DonationController:
         """
         u = get_current_user()
         if not u: return jsonify({"message": "Unauthorized"}), 401
-        m = find_manager_by_email(u.email)
+        m = current_manager()
         d = Donation.query.get(donation_id)
         if not d: return jsonify({"message": "Donation not found"}), 404
-        if d.location != m.cc: return jsonify({"message": "Cannot modify donations outside your CC"}), 403
+        if d.cc_id != m.cc_id: return jsonify({"message": "Cannot modify donations outside your CC"}), 403
         if d.status not in ("Pending", "Approved"):
             return jsonify({"message": "Only Pending or Approved donations can be rejected"}), 400
         db.session.delete(d)
@@ -314,7 +299,7 @@ class DonationController:
             "If you believe this was a mistake, please submit a new donation."
         )
         notification_strategy = DatabaseNotificationStrategy()
-        notification_strategy.create_notification(message=msg, receiver_email=d.donor_email)
+        notification_strategy.create_notification(message=msg, receiver_id=d.donor_id)
 
         return jsonify({"ok": True, "id": donation_id, "deleted": True}), 200
 
@@ -323,7 +308,8 @@ class DonationController:
         
         Approve → Added:
         - Create Item rows as Available only (no reservations).
-        - Allocation is performed by the 10-min background allocator.
+        - Allocation runs inline or is handed to the background allocator
+          (see Config.ALLOCATION_MODE).
         
         Args:
             donation_id (int): ID of donation to add to inventory.
@@ -333,11 +319,11 @@ class DonationController:
         """
         u = get_current_user()
         if not u: return jsonify({"message": "Unauthorized"}), 401
-        m = find_manager_by_email(u.email)
+        m = current_manager()
 
         d = Donation.query.get(donation_id)
         if not d: return jsonify({"message": "Donation not found"}), 404
-        if d.location != m.cc: return jsonify({"message": "Cannot modify donations outside your CC"}), 403
+        if d.cc_id != m.cc_id: return jsonify({"message": "Cannot modify donations outside your CC"}), 403
         if d.status != "Approved": return jsonify({"message": "Only Approved donations can be added"}), 400
 
         try:
@@ -356,9 +342,9 @@ class DonationController:
                 f"with {len(created_items)} item(s). We’ll match them to requests soon!"
             )
             notification_strategy = DatabaseNotificationStrategy()
-            notification_strategy.create_notification(message=msg, receiver_email=d.donor_email)
+            notification_strategy.create_notification(message=msg, receiver_id=d.donor_id)
 
-            run_allocation()
+            JobsController.allocate_now_or_defer()
 
             return jsonify({
                 "message": f"{len(created_items)} items created as Available for donation {d.id}",
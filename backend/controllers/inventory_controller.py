@@ -7,8 +7,8 @@ community club summaries, fulfillment rates, and shortage tracking.
 from flask import request, jsonify
 from sqlalchemy import func, case
 from datetime import datetime, timedelta
-from ..models import Donation, Request, db  
-from ..controllers.community_controller import _cc_cache
+from ..models import CommunityClub, Donation, Request, db
+from ..services.cc_cache import cc_cache
 
 class InventoryController:
     """Controller for inventory management and reporting.
@@ -20,50 +20,57 @@ class InventoryController:
     def get_cc_summary():
         """Generate community club summary statistics.
         
+        Only clubs in the dataset are listed: ``community_club`` also holds
+        any other name a request or donation was filed under.
+
         Returns:
             list: Summary data for all community clubs.
         """
-        # Aggregated data
-        req_rows = (
+        # All CC names from the marker cache (never blocks)
+        cc_names = sorted({m["name"] for m in cc_cache.peek()})
+
+        # Per-CC aggregates, outer-joined onto those CCs in one statement
+        req_agg = (
             db.session.query(
-                Request.location,
-                func.sum(Request.request_quantity),
-                func.sum(Request.allocation)
+                Request.cc_id.label("cc_id"),
+                func.sum(Request.request_quantity).label("total_requests"),
+                func.sum(Request.allocation).label("fulfilled"),
             )
-            .group_by(Request.location)
-            .all()
+            .group_by(Request.cc_id)
+            .subquery()
         )
-
-        don_rows = (
+        don_agg = (
             db.session.query(
-                Donation.location,
+                Donation.cc_id.label("cc_id"),
                 func.sum(
-                case(
-                        (Donation.status == "Added", Donation.donation_quantity),
-                        else_=0
-                    )
-                )
+                    case((Donation.status == "Added", Donation.donation_quantity), else_=0)
+                ).label("total_donations"),
             )
-            .group_by(Donation.location)
-            .all()
+            .group_by(Donation.cc_id)
+            .subquery()
         )
-
-        req_dict = {r[0]: {"total_requests": int(r[1] or 0), "fulfilled": int(r[2] or 0)} for r in req_rows}
-        don_dict = {d[0]: int(d[1] or 0) for d in don_rows}
-
-        # All CC names from cache
-        cc_names = [m["name"] for m in _cc_cache["markers"]]
+        rows = (
+            db.session.query(
+                CommunityClub.name,
+                func.coalesce(req_agg.c.total_requests, 0),
+                func.coalesce(req_agg.c.fulfilled, 0),
+                func.coalesce(don_agg.c.total_donations, 0),
+            )
+            .outerjoin(req_agg, req_agg.c.cc_id == CommunityClub.id)
+            .outerjoin(don_agg, don_agg.c.cc_id == CommunityClub.id)
+            .filter(CommunityClub.name.in_(cc_names))
+            .all()
+        ) if cc_names else []
+        totals = {name: (int(r), int(f), int(d)) for name, r, f, d in rows}
 
         summary = []
-        for name in sorted(cc_names):
-            req_info = req_dict.get(name, {"total_requests": 0, "fulfilled": 0})
-            total_req = req_info["total_requests"]
-            fulfilled = req_info["fulfilled"]
+        for name in cc_names:
+            # Dataset CCs not synced into community_club yet have no activity
+            total_req, fulfilled, total_don = totals.get(name, (0, 0, 0))
             if total_req == 0:
                 fulfill_rate = 100
             else:
                 fulfill_rate = (fulfilled / total_req * 100)
-            total_don = don_dict.get(name, 0)
 
             summary.append({
                 "location": name,
@@ -108,12 +115,14 @@ class InventoryController:
         # --- Identify severe shortage items ---
         items = (
             db.session.query(
-                Request.location,
+                CommunityClub.name.label("location"),
                 Request.request_item,
                 func.sum(Request.request_quantity).label("total_requested"),
                 func.sum(Request.allocation).label("fulfilled_quantity")
             )
-            .group_by(Request.location, Request.request_item)
+            .join(CommunityClub, CommunityClub.id == Request.cc_id)
+            .filter(CommunityClub.name.in_([cc["location"] for cc in summary]))
+            .group_by(CommunityClub.name, Request.request_item)
             .all()
         )
 
@@ -132,6 +141,12 @@ class InventoryController:
 
     @staticmethod
     def get_cc_inventory(location):
+        cc_id = (
+            db.session.query(CommunityClub.id)
+            .filter(CommunityClub.name == location)
+            .scalar_subquery()
+        )
+
     # 1) Aggregate requests per item for this CC
         req_agg = (
             db.session.query(
@@ -139,7 +154,7 @@ class InventoryController:
                 func.sum(Request.request_quantity).label("total_requested"),
                 func.sum(Request.allocation).label("fulfilled_quantity"),
             )
-            .filter(Request.location == location)
+            .filter(Request.cc_id == cc_id)
             .group_by(Request.request_item)
             .subquery()
         )
@@ -152,7 +167,7 @@ class InventoryController:
                     case((Donation.status == "Added", Donation.donation_quantity), else_=0)
                 ).label("total_donated"),
             )
-            .filter(Donation.location == location)
+            .filter(Donation.cc_id == cc_id)
             .group_by(Donation.donation_item)
             .subquery()
         )
@@ -7,8 +7,12 @@ expiry management, and manual job triggers with status tracking.
 import threading
 import time
 from dataclasses import dataclass, asdict
-from typing import Dict
+from typing import Callable, Dict, List, Optional, Tuple
 
+from ..config import Config
+from ..services.cc_registry import sync_community_clubs
+from ..services.run_allocation import run_allocation
+from ..services.telemetry import record_job
 from ..services.jobs_service import (
     run_cleanup_expired_items_once,
     run_expire_matched_requests_once,
@@ -23,10 +27,16 @@ class JobStatus:
         last_ok (str): Timestamp of last successful execution.
         last_error (str): Last error message if any.
         running (bool): Whether job is currently running.
+        runs (int): Number of completed executions.
+        last_duration_ms (float): Wall time of the last execution.
+        total_duration_ms (float): Wall time of all executions.
     """
     last_ok: str = ""
     last_error: str = ""
     running: bool = False
+    runs: int = 0
+    last_duration_ms: float = 0.0
+    total_duration_ms: float = 0.0
 
 
 class JobsController:
@@ -41,9 +51,23 @@ class JobsController:
         "cleanup_expired_items": JobStatus(),
         "expire_matched_requests": JobStatus(),
         "cleanup_approved_donations": JobStatus(),
+        "sync_community_clubs": JobStatus(),
     }
 
+    # Scheduled jobs: key -> (job function, interval in seconds)
+    schedule: Dict[str, Tuple[Callable[[], dict], int]] = {
+        "allocation": (run_allocation, Config.ALLOCATION_INTERVAL_SECONDS),
+        "cleanup_expired_items": (run_cleanup_expired_items_once, 24 * 60 * 60),
+        "expire_matched_requests": (run_expire_matched_requests_once, 24 * 60 * 60),
+        "cleanup_approved_donations": (run_cleanup_approved_donations_once, 24 * 60 * 60),
+        "sync_community_clubs": (sync_community_clubs, Config.CC_CACHE_TTL_SECONDS),
+    }
+
+    # Wake-up events for jobs that can be triggered early (debounced)
+    _triggers: Dict[str, threading.Event] = {"allocation": threading.Event()}
+
     _schedulers_started = False  # prevent double-starts
+    _run_lock = threading.Lock()  # guards the running flags
 
     # ---------- Internal helper ----------
     @staticmethod
@@ -57,18 +81,94 @@ class JobsController:
             fn (callable): Function to execute.
         """
         s = JobsController.status[job_key]
-        if s.running:
-            return
-        s.running = True
+        with JobsController._run_lock:
+            if s.running:
+                return
+            s.running = True
+        started = time.perf_counter()
+        ok = False
         try:
             result = fn()
+            ok = True
             s.last_ok = (result or {}).get("at", "")
             s.last_error = ""
         except Exception as e:
             # Capture full error message for /status endpoint
             s.last_error = str(e)
         finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            s.runs += 1
+            s.last_duration_ms = round(elapsed_ms, 1)
+            s.total_duration_ms = round(s.total_duration_ms + elapsed_ms, 1)
             s.running = False
+            record_job(job_key, elapsed_ms / 1000, ok)
+
+    @staticmethod
+    def run_job(job_key: str, **kwargs):
+        """Run a scheduled job once by key.
+        
+        Used by the manual triggers and the standalone job worker.
+        Must be called inside an app context.
+        
+        Args:
+            job_key (str): Key of the job in ``JobsController.schedule``.
+            **kwargs: Keyword arguments passed to the job function.
+            
+        Returns:
+            dict: Status of the job after the run.
+            
+        Raises:
+            KeyError: If the job key is unknown.
+        """
+        fn, _ = JobsController.schedule[job_key]
+        JobsController._safe_run(job_key, lambda: fn(**kwargs))
+        return asdict(JobsController.status[job_key])
+
+    # ---------- Allocation ----------
+    @staticmethod
+    def request_allocation():
+        """Ask the background allocator to run soon.
+        
+        Repeated calls within the debounce window coalesce into one run.
+        Only wakes the allocator in this process; a standalone job worker
+        or the scheduler-leader gunicorn worker picks the work up on its
+        next interval.
+        """
+        JobsController._triggers["allocation"].set()
+
+    @staticmethod
+    def allocate_now_or_defer() -> Optional[dict]:
+        """Run allocation after a write, inline or deferred per ALLOCATION_MODE.
+        
+        - "sync": always allocate on the request thread, after any pass
+          already running in this process.
+        - "deferred": always hand off to the background allocator.
+        - "auto": allocate inline unless another pass (background job or
+          request thread) is running, in which case hand off instead of
+          queueing behind it.
+        
+        Returns:
+            dict: Allocation result, or None if it was deferred.
+        """
+        mode = Config.ALLOCATION_MODE
+        if mode == "deferred":
+            JobsController.request_allocation()
+            return None
+        # "auto" takes the allocation lock only if it is free (no check-then-act);
+        # "sync" waits for a running pass, so passes never overlap
+        result = run_allocation(wait=mode != "auto")
+        if result is None:
+            JobsController.request_allocation()
+        return result
+
+    @staticmethod
+    def run_allocation_now():
+        """Manually trigger the allocation job.
+        
+        Returns:
+            dict: Job execution result and status.
+        """
+        return {"ok": True, "status": JobsController.run_job("allocation")}
 
     # ---------- Manual job triggers (requests have app context) ----------
     @staticmethod
@@ -78,8 +178,7 @@ class JobsController:
         Returns:
             dict: Job execution result and status.
         """
-        JobsController._safe_run("cleanup_expired_items", run_cleanup_expired_items_once)
-        return {"ok": True, "status": asdict(JobsController.status["cleanup_expired_items"])}
+        return {"ok": True, "status": JobsController.run_job("cleanup_expired_items")}
 
     @staticmethod
     def run_expiry_now(days: int = 2):
@@ -91,11 +190,21 @@ class JobsController:
         Returns:
             dict: Job execution result and status.
         """
-        JobsController._safe_run(
-            "expire_matched_requests",
-            lambda: run_expire_matched_requests_once(days_until_expire=days),
-        )
-        return {"ok": True, "status": asdict(JobsController.status["expire_matched_requests"])}
+        status = JobsController.run_job("expire_matched_requests", days_until_expire=days)
+        return {"ok": True, "status": status}
+
+    @staticmethod
+    def run_cleanup_approved_donations_now(days: int = 2):
+        """Manually trigger cleanup of old approved donations.
+        
+        Args:
+            days (int): Days until deletion (default 2).
+            
+        Returns:
+            dict: Job execution result and status.
+        """
+        status = JobsController.run_job("cleanup_approved_donations", days_until_delete=days)
+        return {"ok": True, "status": status}
 
     @staticmethod
     def get_status():
@@ -108,40 +217,39 @@ class JobsController:
 
     # ---------- Background schedulers ----------
     @staticmethod
-    def start_schedulers(app):
+    def start_schedulers(app) -> List[threading.Thread]:
         """Start periodic background job schedulers.
         
-        Called once from app.py to initialize background threads.
-        IMPORTANT: push app.app_context() inside each thread before DB work.
+        Called once from app.py (or the standalone job worker) to initialize
+        background threads. Each thread pushes its own app context before DB work.
         
         Args:
             app (Flask): Flask application instance for context.
+            
+        Returns:
+            list: Started scheduler threads (empty if already started).
         """
         if JobsController._schedulers_started:
-            return
+            return []
         JobsController._schedulers_started = True
 
-        def cleanup_loop():
+        def loop(job_key: str, fn: Callable[[], dict], interval: int):
+            trigger = JobsController._triggers.get(job_key)
             while True:
                 with app.app_context():
-                    JobsController._safe_run("cleanup_expired_items", run_cleanup_expired_items_once)
-                time.sleep(24*60*60)  # daily
+                    JobsController._safe_run(job_key, fn)
+                if trigger is None:
+                    time.sleep(interval)
+                elif trigger.wait(interval):
+                    # Woken early: wait out the debounce window so bursts coalesce
+                    time.sleep(Config.ALLOCATION_DEBOUNCE_SECONDS)
+                    trigger.clear()
 
-        def expiry_loop():
-            while True:
-                with app.app_context():
-                    JobsController._safe_run("expire_matched_requests", run_expire_matched_requests_once)
-                time.sleep(24*60*60)  # daily
-                
-        def approved_donation_loop():
-            while True:
-                with app.app_context():
-                    JobsController._safe_run(
-                        "cleanup_approved_donations",
-                        run_cleanup_approved_donations_once
-                    )
-                time.sleep(24 * 60 * 60)  # run daily
-        
-        threading.Thread(target=cleanup_loop, name="jobs-cleanup", daemon=True).start()
-        threading.Thread(target=expiry_loop, name="jobs-expiry", daemon=True).start()
-        threading.Thread(target=approved_donation_loop, name="jobs-approved-cleanup", daemon=True).start()
+        threads = []
+        for job_key, (fn, interval) in JobsController.schedule.items():
+            t = threading.Thread(
+                target=loop, args=(job_key, fn, interval), name=f"jobs-{job_key}", daemon=True
+            )
+            t.start()
+            threads.append(t)
+        return threads
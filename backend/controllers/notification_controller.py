@@ -11,6 +11,7 @@ from ..models import Notification, db  # keep db import if you later need it
 from ..services.find_user import get_current_user
 from ..broadcast_observer import subject, SubscriptionObserver
 from ..services.notification_strategies import DatabaseNotificationStrategy
+from ..serializers import notification_serializer
 
 class NotificationController:
     """Controller for notification and broadcast operations.
@@ -22,12 +23,12 @@ class NotificationController:
         self.notification_strategy = DatabaseNotificationStrategy()
     
     @staticmethod
-    def create_notification(message, receiver_email, link=None):
+    def create_notification(message, receiver_id, link=None):
         """Create a new notification.
         
         Args:
             message (str): Notification message content.
-            receiver_email (str): Email of notification recipient.
+            receiver_id (int): User id of notification recipient.
             link (str, optional): Optional link for notification.
             
         Returns:
@@ -35,7 +36,7 @@ class NotificationController:
         """
         strategy = DatabaseNotificationStrategy()
         try:
-            notif = strategy.create_notification(message, receiver_email)
+            notif = strategy.create_notification(message, receiver_id)
             return {"ok": True, "id": notif.id}, 201
         except ValueError as ve:
             return {"error": str(ve)}, 400
@@ -57,7 +58,7 @@ class NotificationController:
         if not user:
             return jsonify({"message": "Unauthorized"}), 401
 
-        n = Notification.query.filter_by(id=notification_id, receiver_email=user.email).first()
+        n = Notification.query.filter_by(id=notification_id, receiver_id=user.id).first()
         if not n:
             return jsonify({"message": "Notification not found"}), 404
 
@@ -93,9 +94,9 @@ class NotificationController:
             return jsonify({"message": "cc is required"}), 400
 
         # In-memory subscription (Observer pattern)
-        if not subject.find(user.email, cc):
+        if not subject.find(user.id, cc):
             subject.register(
-                SubscriptionObserver(user_email=user.email, cc=cc, _subject=subject)
+                SubscriptionObserver(user_id=user.id, cc=cc, _subject=subject)
             )
 
         return jsonify({"ok": True, "cc": cc, "subscribed": True}), 200
@@ -117,7 +118,7 @@ class NotificationController:
         if not cc:
             return jsonify({"message": "cc is required"}), 400
 
-        obs = subject.find(user.email, cc)
+        obs = subject.find(user.id, cc)
         if obs:
             subject.unregister(obs)
 
@@ -135,9 +136,9 @@ class NotificationController:
         if not user:
             return jsonify({"message": "Unauthorized"}), 401
 
-        subs = subject.subscriptions_for_user(user.email)
+        subs = subject.subscriptions_for_user(user.id)
         # Simple shape for frontend
-        data = [{"cc": s.cc, "active": True, "id": f"{s.user_email}-{s.cc}"} for s in subs]
+        data = [{"cc": s.cc, "active": True, "id": f"{s.user_id}-{s.cc}"} for s in subs]
         return jsonify({"subscriptions": data}), 200
 
     # GET /api/notifications
@@ -154,18 +155,12 @@ class NotificationController:
 
         rows = (
             Notification.query
-            .filter_by(receiver_email=user.email)
+            .filter_by(receiver_id=user.id)
             .order_by(Notification.created_at.desc())
             .limit(50)
             .all()
         )
-        data = [{
-            "id": n.id,
-            "message": n.message,
-            "created_at": n.created_at.isoformat(),
-        } for n in rows]
-
-        return jsonify({"notifications": data}), 200
+        return jsonify({"notifications": notification_serializer.many(rows)}), 200
 
     @staticmethod
     def get_unread_count():
@@ -184,7 +179,7 @@ class NotificationController:
         try:
             unread_count = (
                 db.session.query(func.count(Notification.id))
-                .filter_by(receiver_email=user.email, viewed=False)
+                .filter_by(receiver_id=user.id, viewed=False)
                 .scalar()
             )
             return jsonify({"unread": int(unread_count)}), 200
@@ -208,7 +203,7 @@ class NotificationController:
 
         try:
             Notification.query.filter_by(
-                receiver_email=user.email, viewed=False
+                receiver_id=user.id, viewed=False
             ).update({"viewed": True})
             db.session.commit()
             return jsonify({"message": "Marked all as read"}), 200
@@ -8,9 +8,11 @@ from flask import jsonify, session
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 from ..extensions import db
 from ..models import User, Client, Manager
-from ..services.find_user import get_current_user, find_client_by_email, find_manager_by_email
-from ..services.password import hash_password
+from ..services.find_user import get_current_user, find_user_by_email
+from ..services.password import PasswordServiceBusy, hash_password
+from ..services.user_context import current_client
 from ..services.notification_strategies import DatabaseNotificationStrategy
+from ..serializers import client_serializer, pending_client_serializer
 
 class ProfileController:
     """Controller for user profile operations.
@@ -41,7 +43,7 @@ class ProfileController:
         u = get_current_user()
         if not u:
             return jsonify({"error": "Unauthorized"}), 401
-        c = find_client_by_email(u.email)
+        c = current_client()
 
         income_changed = False
 
@@ -56,7 +58,12 @@ class ProfileController:
                         c.monthly_income = mi
             except Exception:
                 return jsonify({"error": "monthly_income must be non-negative"}), 400
-        if "password" in data: u.password_hash = hash_password(data["password"])
+        if "password" in data:
+            try:
+                u.password_hash = hash_password(data["password"])
+            except PasswordServiceBusy as e:
+                db.session.rollback()
+                return jsonify({"error": str(e)}), 503
         if "email" in data: u.email = data["email"]
         c.account_status = "Pending"
         db.session.commit()
@@ -70,7 +77,7 @@ class ProfileController:
             for m in managers:
                 notification_strategy.create_notification(
                     message=msg,
-                    receiver_email=m.email
+                    receiver_id=m.id
                 )
 
         return jsonify({"ok": True}), 200
@@ -84,13 +91,12 @@ class ProfileController:
         Returns:
             JSON response with client profile data.
         """
-        client, user = db.session.query(Client, User).join(User).filter(Client.email == user_email).first()
+        client, user = db.session.query(Client, User).join(User).filter(User.email == user_email).first()
         profile_complete = bool(user.email and user.name and user.contact_number and client.monthly_income)
-        return jsonify({
-            "email": user.email, "name": user.name, "contact_number": user.contact_number,
-            "monthly_income": client.monthly_income, "profile_complete": profile_complete,
-            "gmail_acc": client.gmail_acc, "role": "C", "account_status": client.account_status
-        })
+        return jsonify(client_serializer(
+            client, email=user.email, name=user.name, contact_number=user.contact_number,
+            profile_complete=profile_complete, role="C",
+        ))
 
     def get_manager_profile(user_email):
         """Get manager profile data.
@@ -101,7 +107,7 @@ class ProfileController:
         Returns:
             JSON response with manager profile data.
         """
-        manager, user = db.session.query(Manager, User).join(User).filter(Manager.email == user_email).first()
+        manager, user = db.session.query(Manager, User).join(User).filter(User.email == user_email).first()
         return jsonify({
             "email": user.email, "name": user.name, "contact_number": user.contact_number,
             "cc": manager.cc, "profile_complete": True, "role": "M"
@@ -116,7 +122,7 @@ class ProfileController:
         rows = db.session.query(Client, User).join(User).filter(Client.account_status == "Pending").all()
         out = []
         for client, user in rows:
-            out.append({"client": {"email": client.email, "monthly_income": client.monthly_income},
+            out.append({"client": pending_client_serializer(client, email=user.email),
                         "user": {"contact_number": user.contact_number, "name": user.name}})
         return jsonify(out)
 
@@ -130,11 +136,10 @@ class ProfileController:
         Returns:
             JSON response with operation result.
         """
-        c = Client.query.get(email)
+        u = find_user_by_email(email)
+        c = db.session.get(Client, u.id) if u else None
         if not c: return jsonify({"error": "Client not found"}), 404
 
-        u = User.query.get(email)
-
         try:
             if outcome:
                 c.account_status = "Confirmed"
@@ -145,14 +150,14 @@ class ProfileController:
                 notification_strategy = DatabaseNotificationStrategy()
                 notification_strategy.create_notification(
                     message=msg,
-                    receiver_email=email
+                    receiver_id=u.id
                 )
             else:
                 # Notify user: rejected
                 c.account_status = "Rejected"
                 db.session.commit()
 
-                name = u.name if u else email             
+                name = u.name or email             
                 msg = (
                     f"Hi {name}, your registration has been rejected. "
                     "You may re-apply with updated information."
@@ -160,7 +165,7 @@ class ProfileController:
                 notification_strategy = DatabaseNotificationStrategy()
                 notification_strategy.create_notification(
                     message=msg,
-                    receiver_email=email
+                    receiver_id=u.id
                 )
 
             return jsonify({"ok": True})
@@ -6,11 +6,14 @@ update, deletion, and completion workflow for item requests.
 
 from flask import jsonify, request
 from ..extensions import db
-from ..models import Request, Item, Donation, Reservation, Manager
+from ..models import Request, Item, Donation, Reservation, Manager, User
 from ..services.find_user import get_current_user
+from ..services.user_context import current_manager
 from datetime import datetime, timezone, timedelta
-from ..services.run_allocation import run_allocation
+from ..controllers.jobs_controller import JobsController
+from ..services.cc_registry import cc_id_for
 from ..services.metrics import check_and_broadcast_for_cc
+from ..serializers import request_serializer
 
 class RequestController:
     """Controller for request management operations.
@@ -31,19 +34,10 @@ class RequestController:
         if not u: return jsonify({"message": "Unauthorized"}), 401
 
         r = Request.query.get(req_id)
-        if not r or r.requester_email != u.email:
+        if not r or r.requester_id != u.id:
             return jsonify({"message": "Not found"}), 404
 
-        return jsonify({
-            "id": r.id,
-            "request_category": r.request_category,
-            "request_item": r.request_item,
-            "request_quantity": r.request_quantity,
-            "allocation": r.allocation,
-            "location": r.location,
-            "status": r.status,
-            "created_at": r.created_at.isoformat() if r.created_at else None,
-        }), 200
+        return jsonify(request_serializer(r)), 200
 
     def update_pending_request(req_id: int):
         """Update a pending request.
@@ -61,7 +55,7 @@ class RequestController:
         if not u: return jsonify({"message": "Unauthorized"}), 401
 
         r = Request.query.get(req_id)
-        if not r or r.requester_email != u.email:
+        if not r or r.requester_id != u.id:
             return jsonify({"message": "Not found"}), 404
 
         if r.status != "Pending":
@@ -94,7 +88,9 @@ class RequestController:
             r.request_category = new_cat
             r.request_item = new_item
             r.request_quantity = new_qty
-            r.location = new_loc
+            if new_loc != r.location:
+                r.cc_id = cc_id_for(new_loc)
+                r.location = new_loc
             db.session.commit()
             return jsonify({"ok": True, "id": r.id}), 200
         except Exception as e:
@@ -117,7 +113,7 @@ class RequestController:
         if not u: return jsonify({"message": "Unauthorized"}), 401
 
         r = Request.query.get(req_id)
-        if not r or r.requester_email != u.email:
+        if not r or r.requester_id != u.id:
             return jsonify({"message": "Not found"}), 404
 
         if r.status != "Pending":
@@ -137,7 +133,7 @@ class RequestController:
             db.session.delete(r)
             db.session.commit()
 
-            run_allocation()
+            JobsController.allocate_now_or_defer()
             
             return jsonify({
                 "ok": True,
@@ -162,27 +158,18 @@ class RequestController:
         if u.role != "M":
             return jsonify({"message": "Forbidden: managers only"}), 403
 
-        mgr = Manager.query.get(u.email)
+        mgr = current_manager()
         if not mgr:
             return jsonify({"message": "Manager profile not found"}), 404
 
         rows = (
-            Request.query
-            .filter(Request.status == "Matched", Request.location == mgr.cc)
+            db.session.query(Request, User.email)
+            .join(User, User.id == Request.requester_id)
+            .filter(Request.status == "Matched", Request.cc_id == mgr.cc_id)
             .order_by(Request.matched_at.desc().nullslast(), Request.id.desc())
             .all()
         )
-        data = [{
-            "id": r.id,
-            "requester_email": r.requester_email,
-            "request_category": r.request_category,
-            "request_item": r.request_item,
-            "request_quantity": r.request_quantity,
-            "allocation": r.allocation,
-            "location": r.location,
-            "status": r.status,
-            "matched_at": r.matched_at.isoformat() if r.matched_at else None,
-        } for r in rows]
+        data = [request_serializer(r, requester_email=requester_email) for r, requester_email in rows]
         return jsonify({"requests": data, "cc": mgr.cc}), 200
 
     def manager_complete_request(req_id: int):
@@ -203,7 +190,7 @@ class RequestController:
         if u.role != "M":
             return jsonify({"message": "Forbidden: managers only"}), 403
 
-        mgr = Manager.query.get(u.email)
+        mgr = current_manager()
         if not mgr:
             return jsonify({"message": "Manager profile not found"}), 404
 
@@ -211,7 +198,7 @@ class RequestController:
         if not req:
             return jsonify({"message": "Request not found"}), 404
 
-        if req.location != mgr.cc:
+        if req.cc_id != mgr.cc_id:
             return jsonify({"message": "Forbidden: request not in your CC"}), 403
 
         if req.status != "Matched":
@@ -263,10 +250,11 @@ class RequestController:
 
         try:
             req = Request(
-                requester_email=u.email,
+                requester_id=u.id,
                 request_category=request_category,
                 request_item=request_item,
                 request_quantity=request_quantity,
+                cc_id=cc_id_for(location),
                 location=location,
                 status="Pending",
                 allocation=0,
@@ -274,7 +262,7 @@ class RequestController:
             db.session.add(req)
             db.session.commit()
             
-            run_allocation()
+            JobsController.allocate_now_or_defer()
 
             # Check this CC's fulfilment after adding the new request
             check_and_broadcast_for_cc(location)
@@ -296,14 +284,8 @@ class RequestController:
         """
         u = get_current_user()
         if not u: return jsonify({"message": "Unauthorized"}), 401
-        rows = Request.query.filter_by(requester_email=u.email).order_by(Request.id.desc()).all()
-        data = [{
-            "id": r.id, "request_category": r.request_category, "request_item": r.request_item,
-            "request_quantity": r.request_quantity, "allocation": r.allocation,
-            "location": r.location, "status": r.status,
-            "created_at": r.created_at.isoformat() if r.created_at else None,
-        } for r in rows]
-        return jsonify({"requests": data}), 200
+        rows = Request.query.filter_by(requester_id=u.id).order_by(Request.id.desc()).all()
+        return jsonify({"requests": request_serializer.many(rows)}), 200
 
     # server/controllers/requests_controller.py
     def reject_matched_request():
@@ -325,7 +307,7 @@ class RequestController:
 
         req = Request.query.get(req_id)
         if not req: return jsonify({"message": "Request not found"}), 404
-        if req.requester_email != u.email: return jsonify({"message": "Forbidden"}), 403
+        if req.requester_id != u.id: return jsonify({"message": "Forbidden"}), 403
         if req.status != "Matched": return jsonify({"message": "Only Matched requests can be rejected"}), 400
 
         try:
@@ -342,7 +324,7 @@ class RequestController:
             db.session.delete(req)
             db.session.commit()
 
-            run_allocation()
+            JobsController.allocate_now_or_defer()
 
             return jsonify({
                 "message": "Request rejected. Items are now Available and will be reallocated by the scheduler.",
@@ -1,11 +1,12 @@
 """Database Factory for CareConnect Backend.
 
 This module implements the Factory pattern to create database instances
-based on configuration. Supports SQLite and PostgreSQL databases.
+based on configuration. Supports SQLite, PostgreSQL and in-memory databases.
 """
 
 from .sqlite_database import SQLiteDatabase
 from .postgres_database import PostgresSQLDatabase
+from .memory_database import MemoryDatabase
 
 class DatabaseFactory:
     """Factory class for creating database instances.
@@ -14,11 +15,12 @@ class DatabaseFactory:
     implementation based on the specified database type.
     """
     @staticmethod
-    def getDatabase(db_type: str):
+    def getDatabase(db_type: str, replica_url: str = None):
         """Create a database instance based on the specified type.
         
         Args:
-            db_type (str): Database type - 'sqlite' or 'postgres'/'postgresql'.
+            db_type (str): Database type - 'sqlite', 'postgres'/'postgresql' or 'memory'.
+            replica_url (str, optional): Read-replica URL for read-only endpoints.
             
         Returns:
             Database implementation instance.
@@ -29,8 +31,24 @@ class DatabaseFactory:
         t = (db_type or "").lower()
         if t == "sqlite":
             print("Using SQLite database...")
-            return SQLiteDatabase()
+            return SQLiteDatabase(replica_url)
         if t in ("postgres", "postgresql"):
             print("Using PostgreSQL database...")
-            return PostgresSQLDatabase()
+            return PostgresSQLDatabase(replica_url)
+        if t == "memory":
+            print("Using in-memory database...")
+            return MemoryDatabase()
         raise ValueError(f"Unsupported database type: {db_type}")
+
+    @staticmethod
+    def getPoolProfile(db_type: str, config) -> dict:
+        """Return the engine/pool options a database type would use.
+        
+        Args:
+            db_type (str): Database type - 'sqlite', 'postgres'/'postgresql' or 'memory'.
+            config (Mapping): Flask app config.
+            
+        Returns:
+            dict: Keyword arguments for ``create_engine``.
+        """
+        return DatabaseFactory.getDatabase(db_type).engine_options(config)
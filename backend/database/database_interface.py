@@ -11,7 +11,13 @@ class DatabaseInterface(ABC):
     
     Defines the contract that all database types (SQLite, PostgreSQL, etc.)
     must implement for the Factory pattern.
+    
+    Attributes:
+        replica_url (str): Optional read-replica URL, bound as "replica".
     """
+    def __init__(self, replica_url=None):
+        self.replica_url = replica_url
+
     @abstractmethod
     def init_app(self, app, db):
         """Configure Flask app for this database type.
@@ -24,3 +30,29 @@ class DatabaseInterface(ABC):
             SQLAlchemy: Configured database instance.
         """
         pass
+
+    def engine_options(self, config) -> dict:
+        """Return the SQLAlchemy engine/pool options for this database type.
+        
+        Args:
+            config (Mapping): Flask app config.
+            
+        Returns:
+            dict: Keyword arguments for ``create_engine`` (empty for defaults).
+        """
+        return {}
+
+    def bind_replica(self, app):
+        """Register the read replica (if any) as the "replica" bind.
+        
+        Call before ``db.init_app`` so the engine is created with the others.
+        The replica uses the same pooling profile as the primary.
+        
+        Args:
+            app (Flask): Flask application instance.
+        """
+        if not self.replica_url:
+            return
+        binds = dict(app.config.get("SQLALCHEMY_BINDS") or {})
+        binds["replica"] = {"url": self.replica_url, **self.engine_options(app.config)}
+        app.config["SQLALCHEMY_BINDS"] = binds
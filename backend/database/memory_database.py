@@ -0,0 +1,75 @@
+"""In-Memory Database Implementation for CareConnect Backend.
+
+This module provides a throwaway in-memory SQLite database for tests
+and benchmarks, so they run without a PostgreSQL server.
+"""
+
+import uuid
+
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from .database_interface import DatabaseInterface
+from .pool_stats import attach_pool_stats
+from .sqlite_database import SQLiteDatabase, keep_alive
+
+class MemoryDatabase(DatabaseInterface):
+    """In-memory SQLite database implementation.
+    
+    Each instance gets its own named shared-cache database. Every thread
+    checks out its own connection to it, so one thread's commit or
+    rollback never touches another's transaction, and a sentinel
+    connection keeps the data alive while the pool opens and closes
+    connections. The schema is created from the models and stamped at the
+    latest migration, so startup schema checks pass. Data lives only as
+    long as the process.
+
+    Shared-cache locks are per table and not retried: a thread that
+    touches a table another thread is writing gets "database table is
+    locked". Use DB_TYPE=sqlite (a WAL file) for concurrent load.
+    """
+    def __init__(self, replica_url=None):
+        super().__init__(replica_url)
+        self.url = f"sqlite:///file:careconnect-{uuid.uuid4().hex}?mode=memory&cache=shared&uri=true"
+
+    def engine_options(self, config) -> dict:
+        """Build connection options for the in-memory database.
+        
+        Args:
+            config (Mapping): Flask app config.
+            
+        Returns:
+            dict: Keyword arguments for ``create_engine``.
+        """
+        return {
+            "poolclass": QueuePool,
+            "connect_args": {"check_same_thread": False},  # pooled connections move between threads
+        }
+
+    def init_app(self, app, db):
+        """Initialize Flask app with a fresh in-memory database.
+        
+        Args:
+            app (Flask): Flask application instance.
+            db (SQLAlchemy): SQLAlchemy instance to configure.
+            
+        Returns:
+            SQLAlchemy: Configured database instance.
+        """
+        app.config["SQLALCHEMY_DATABASE_URI"] = self.url
+        app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **self.engine_options(app.config),
+            **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),  # explicit overrides win
+        }
+        db.init_app(app)
+
+        from .migrations import head_revision, stamp  # Alembic is only needed here
+        from .. import models  # noqa: F401 (registers the tables on db.metadata)
+
+        with app.app_context():
+            keep_alive(app, db.engine)
+            event.listen(db.engine, "connect", SQLiteDatabase._pragma_hook(app.config, True))
+            db.create_all()
+            stamp(db.engine, head_revision())
+            attach_pool_stats(db.engine)
+        return db
@@ -0,0 +1,213 @@
+"""Schema Migrations for CareConnect Backend.
+
+This module wraps Alembic so the schema is managed by versioned revisions
+in ``backend/migrations/versions`` instead of ``db.create_all()``.
+Startup only compares the stored revision with the latest one, which is
+a single-row lookup instead of reflecting every table.
+
+Usage:
+    python -m backend.database.migrations upgrade       # apply pending revisions
+    python -m backend.database.migrations current       # show stored revision
+    python -m backend.database.migrations stamp 0001    # adopt a create_all() database
+    python -m backend.database.migrations check         # fail if models drift
+    python -m backend.database.migrations revision -m "add x"  # new autogenerated revision
+"""
+
+import argparse
+import os
+import sys
+from contextlib import contextmanager
+from typing import List, Optional
+
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config as AlembicConfig
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy import create_engine, inspect
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "migrations")
+
+def alembic_config(connection=None) -> AlembicConfig:
+    """Build an Alembic configuration pointing at the bundled revisions.
+
+    Args:
+        connection (Connection, optional): Connection for env.py to use.
+
+    Returns:
+        alembic.config.Config: Programmatic Alembic configuration.
+    """
+    cfg = AlembicConfig()
+    cfg.set_main_option("script_location", MIGRATIONS_DIR)
+    cfg.attributes["connection"] = connection
+    return cfg
+
+def head_revision() -> str:
+    """Return the latest revision id in the migrations directory."""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+def current_revision(engine) -> Optional[str]:
+    """Return the revision stored in the database, or None if unversioned.
+
+    Args:
+        engine (Engine): Database engine.
+    """
+    with engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+@contextmanager
+def _migration_connection(engine):
+    """Yield a connection inside a transaction for running revisions.
+
+    SQLite batch migrations copy and drop whole tables. With foreign keys
+    enforced, dropping a parent table would cascade-delete child rows, so
+    enforcement is paused for the run (it cannot change mid-transaction).
+
+    Args:
+        engine (Engine): Database engine.
+    """
+    with engine.connect() as conn:
+        sqlite = conn.dialect.name == "sqlite"
+        if sqlite:
+            fk_on = conn.exec_driver_sql("PRAGMA foreign_keys").scalar()
+            conn.exec_driver_sql("PRAGMA foreign_keys=OFF")
+            conn.commit()
+        try:
+            with conn.begin():
+                yield conn
+        finally:
+            if sqlite and fk_on:
+                conn.exec_driver_sql("PRAGMA foreign_keys=ON")
+                conn.commit()
+
+def upgrade(engine, revision: str = "head"):
+    """Apply revisions up to ``revision``.
+
+    Args:
+        engine (Engine): Database engine.
+        revision (str): Target revision (default latest).
+    """
+    with _migration_connection(engine) as conn:
+        command.upgrade(alembic_config(conn), revision)
+
+def downgrade(engine, revision: str):
+    """Revert revisions down to ``revision``.
+
+    Args:
+        engine (Engine): Database engine.
+        revision (str): Target revision.
+    """
+    with _migration_connection(engine) as conn:
+        command.downgrade(alembic_config(conn), revision)
+
+def stamp(engine, revision: str):
+    """Record ``revision`` as applied without running it.
+
+    Args:
+        engine (Engine): Database engine.
+        revision (str): Revision to record.
+    """
+    with engine.begin() as conn:
+        command.stamp(alembic_config(conn), revision)
+
+def ensure_schema(engine, auto_upgrade: bool = False):
+    """Check at startup that the database schema is at the latest revision.
+
+    Args:
+        engine (Engine): Database engine.
+        auto_upgrade (bool): Apply pending revisions instead of failing.
+
+    Raises:
+        RuntimeError: If the schema is behind and auto_upgrade is off.
+    """
+    current, head = current_revision(engine), head_revision()
+    if current == head:
+        return
+    if auto_upgrade:
+        upgrade(engine)
+        return
+    if current is None and inspect(engine).has_table("user"):
+        hint = "stamp 0001` and then `upgrade"  # tables from the old create_all()
+    else:
+        hint = "upgrade"
+    raise RuntimeError(
+        f"Database schema is at revision {current or 'none'}, expected {head}. "
+        f"Run `python -m backend.database.migrations {hint}` "
+        "or set DB_AUTO_MIGRATE=true."
+    )
+
+def check_drift(engine=None) -> List[tuple]:
+    """Compare the models with the schema produced by the migrations.
+
+    With no engine, the migrations are applied to a scratch in-memory
+    SQLite database, so the check runs without any server.
+
+    Args:
+        engine (Engine, optional): Database at the latest revision to compare.
+
+    Returns:
+        list: Alembic diff tuples; empty when models and migrations agree.
+    """
+    from ..models import db  # imported late: registers every model on the metadata
+    if engine is None:
+        engine = create_engine("sqlite://")
+        upgrade(engine)
+    with engine.connect() as conn:
+        ctx = MigrationContext.configure(conn, opts={"compare_type": True})
+        return compare_metadata(ctx, db.metadata)
+
+def _engine_from_config():
+    """Create the configured database engine through the worker app."""
+    from ..extensions import db
+    from ..jobs import create_worker_app
+    app = create_worker_app()
+    with app.app_context():
+        return db.engine
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.database.migrations``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.database.migrations")
+    sub = parser.add_subparsers(dest="command", required=True)
+    up = sub.add_parser("upgrade", help="apply pending revisions")
+    up.add_argument("revision", nargs="?", default="head")
+    down = sub.add_parser("downgrade", help="revert to a revision")
+    down.add_argument("revision")
+    st = sub.add_parser("stamp", help="record a revision without running it")
+    st.add_argument("revision")
+    sub.add_parser("current", help="show the stored and latest revisions")
+    chk = sub.add_parser("check", help="exit 1 if models drift from the migrations")
+    chk.add_argument("--live", action="store_true", help="compare against the configured database")
+    rev = sub.add_parser("revision", help="autogenerate a new revision")
+    rev.add_argument("-m", "--message", required=True)
+    args = parser.parse_args(argv)
+
+    if args.command == "check":
+        diffs = check_drift(_engine_from_config() if args.live else None)
+        for diff in diffs:
+            print(diff)
+        print("Models and migrations are in sync." if not diffs else f"{len(diffs)} difference(s) found.")
+        return 1 if diffs else 0
+
+    engine = _engine_from_config()
+    if args.command == "upgrade":
+        upgrade(engine, args.revision)
+    elif args.command == "downgrade":
+        downgrade(engine, args.revision)
+    elif args.command == "stamp":
+        stamp(engine, args.revision)
+    elif args.command == "current":
+        print(f"current: {current_revision(engine)}  head: {head_revision()}")
+    elif args.command == "revision":
+        with engine.begin() as conn:
+            command.revision(alembic_config(conn), message=args.message, autogenerate=True)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+"""Connection Pool Statistics for CareConnect Backend.
+
+This module tracks checkout wait times and utilisation of SQLAlchemy
+connection pools so the pool can be sized against worker concurrency.
+"""
+
+import time
+from threading import Lock
+from typing import Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import QueuePool
+
+
+class PoolStats:
+    """Counters for one engine's connection pool.
+
+    Attributes:
+        checkouts (int): Connections handed out by the pool.
+        checkins (int): Connections returned to the pool.
+        connects (int): New DBAPI connections opened.
+        timeouts (int): Checkouts that gave up waiting for a connection.
+        peak_in_use (int): Highest number of connections in use at once.
+        wait_total_ms (float): Time spent waiting for connections in total.
+        wait_max_ms (float): Longest single checkout wait.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.timeouts = 0
+        self.peak_in_use = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+        self._waits = 0
+
+    def record_wait(self, elapsed_ms: float, timed_out: bool = False):
+        """Record how long one checkout waited on the pool queue.
+
+        Args:
+            elapsed_ms (float): Wait duration in milliseconds.
+            timed_out (bool): Whether the checkout raised a pool timeout.
+        """
+        with self._lock:
+            self._waits += 1
+            self.wait_total_ms += elapsed_ms
+            self.wait_max_ms = max(self.wait_max_ms, elapsed_ms)
+            if timed_out:
+                self.timeouts += 1
+
+    def on_checkout(self, *_):
+        with self._lock:
+            self.checkouts += 1
+            self.peak_in_use = max(self.peak_in_use, self.checkouts - self.checkins)
+
+    def on_checkin(self, *_):
+        with self._lock:
+            self.checkins += 1
+
+    def on_connect(self, *_):
+        with self._lock:
+            self.connects += 1
+
+    def snapshot(self, pool) -> dict:
+        """Return counters plus the pool's current utilisation.
+
+        Args:
+            pool (Pool): The pool these counters belong to.
+
+        Returns:
+            dict: JSON-serialisable statistics.
+        """
+        with self._lock:
+            data = {
+                "pool_class": type(pool).__name__,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "in_use": self.checkouts - self.checkins,
+                "peak_in_use": self.peak_in_use,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "wait_avg_ms": round(self.wait_total_ms / self._waits, 3) if self._waits else 0.0,
+                "wait_max_ms": round(self.wait_max_ms, 3),
+            }
+        # QueuePool exposes its capacity; NullPool/StaticPool do not
+        if isinstance(pool, QueuePool):
+            capacity = pool.size() + max(pool._max_overflow, 0)
+            data.update({
+                "size": pool.size(),
+                "max_overflow": pool._max_overflow,
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "utilisation": round(pool.checkedout() / capacity, 3) if capacity else None,
+            })
+        return data
+
+
+class TimedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waits for a connection."""
+
+    stats: Optional[PoolStats] = None
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            conn = super()._do_get()
+        except exc.TimeoutError:
+            if self.stats:
+                self.stats.record_wait((time.perf_counter() - started) * 1000, timed_out=True)
+            raise
+        if self.stats:
+            self.stats.record_wait((time.perf_counter() - started) * 1000)
+        return conn
+
+    def recreate(self):
+        # engine.dispose() swaps in a new pool; keep counting into the same stats
+        new_pool = super().recreate()
+        new_pool.stats = self.stats
+        return new_pool
+
+
+# Registered engines by bind name (None is the default bind)
+_registry: Dict[Optional[str], tuple] = {}
+
+def attach_pool_stats(engine, name: Optional[str] = None) -> PoolStats:
+    """Start collecting pool statistics for an engine.
+
+    Args:
+        engine (Engine): SQLAlchemy engine to instrument.
+        name (str, optional): Bind name used as the key in reports.
+
+    Returns:
+        PoolStats: Counters for this engine.
+    """
+    if name in _registry and _registry[name][0] is engine:
+        return _registry[name][1]
+    stats = PoolStats()
+    event.listen(engine, "checkout", stats.on_checkout)
+    event.listen(engine, "checkin", stats.on_checkin)
+    event.listen(engine, "connect", stats.on_connect)
+    if isinstance(engine.pool, TimedQueuePool):
+        engine.pool.stats = stats
+    _registry[name] = (engine, stats)
+    return stats
+
+def get_pool_stats() -> Dict[str, dict]:
+    """Return a statistics snapshot for every instrumented engine.
+
+    Returns:
+        dict: Bind name ("default" for the main bind) to statistics.
+    """
+    return {
+        (name or "default"): stats.snapshot(engine.pool)
+        for name, (engine, stats) in _registry.items()
+    }
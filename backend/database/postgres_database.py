@@ -4,14 +4,65 @@ This module provides PostgreSQL-specific database configuration
 for the Factory pattern database abstraction layer.
 """
 
+from sqlalchemy import event
+from sqlalchemy.pool import NullPool
 from .database_interface import DatabaseInterface
+from .pool_stats import TimedQueuePool, attach_pool_stats
 
 class PostgresSQLDatabase(DatabaseInterface):
     """PostgreSQL database implementation.
     
     Configures Flask application to use PostgreSQL database
-    with connection string from environment variables.
+    with connection string and pooling profile from environment variables.
     """
+    def engine_options(self, config) -> dict:
+        """Build the pooling profile for PostgreSQL.
+        
+        With DB_PGBOUNCER enabled, pooling is left to PgBouncer (transaction
+        mode) and SQLAlchemy opens a fresh connection per checkout (NullPool).
+        
+        Args:
+            config (Mapping): Flask app config.
+            
+        Returns:
+            dict: Keyword arguments for ``create_engine``.
+        """
+        if config.get("DB_PGBOUNCER"):
+            options = {"poolclass": NullPool}
+        else:
+            options = {
+                "poolclass": TimedQueuePool,
+                "pool_size": config.get("DB_POOL_SIZE", 5),
+                "max_overflow": config.get("DB_MAX_OVERFLOW", 10),
+                "pool_timeout": config.get("DB_POOL_TIMEOUT", 30),
+                "pool_recycle": config.get("DB_POOL_RECYCLE", 1800),
+            }
+        options["pool_pre_ping"] = config.get("DB_POOL_PRE_PING", True)
+
+        # Server-side statement timeout, passed as a libpq startup option.
+        # PgBouncer rejects that parameter; see _set_timeout_per_transaction.
+        timeout_ms = config.get("DB_STATEMENT_TIMEOUT_MS") or 0
+        if timeout_ms > 0 and not config.get("DB_PGBOUNCER"):
+            options["connect_args"] = {"options": f"-c statement_timeout={int(timeout_ms)}"}
+        return options
+
+    @staticmethod
+    def _set_timeout_per_transaction(engine, timeout_ms: int):
+        """Set the statement timeout at the start of every transaction.
+
+        Used behind PgBouncer, which refuses the ``options`` startup
+        parameter. A session-level SET would stay on whichever server
+        connection ran it (transaction pooling), so SET LOCAL is issued
+        inside each transaction instead.
+
+        Args:
+            engine (Engine): Engine to configure.
+            timeout_ms (int): Timeout in milliseconds.
+        """
+        @event.listens_for(engine, "begin")
+        def set_statement_timeout(conn):
+            conn.exec_driver_sql(f"SET LOCAL statement_timeout = {int(timeout_ms)}")
+
     def init_app(self, app, db):
         """Initialize Flask app with PostgreSQL configuration.
         
@@ -29,5 +80,20 @@ class PostgresSQLDatabase(DatabaseInterface):
             # Expect DATABASE_URL in your env and loaded into Config
             raise RuntimeError("DATABASE_URL must be set for PostgreSQL.")
         app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **self.engine_options(app.config),
+            **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),  # explicit overrides win
+        }
+        self.bind_replica(app)
         db.init_app(app)
+
+        with app.app_context():
+            engines = [db.engine] + ([db.engines["replica"]] if self.replica_url else [])
+            timeout_ms = app.config.get("DB_STATEMENT_TIMEOUT_MS") or 0
+            if app.config.get("DB_PGBOUNCER") and timeout_ms > 0:
+                for engine in engines:
+                    self._set_timeout_per_transaction(engine, timeout_ms)
+            attach_pool_stats(db.engine)
+            if self.replica_url:
+                attach_pool_stats(db.engines["replica"], "replica")
         return db
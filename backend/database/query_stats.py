@@ -0,0 +1,164 @@
+"""Per-Request SQL Instrumentation for CareConnect Backend.
+
+This module counts and times every SQL statement issued while handling
+a Flask request. It logs slow statements with their parameters and flags
+likely N+1 patterns: the same statement shape repeated many times in one
+request (e.g. a query inside a loop over rows).
+
+Results are added as X-DB-* response headers when SQL_DEBUG_HEADERS is on
+(development) and aggregated per endpoint for /admin/db/queries.
+"""
+
+import re
+import time
+from collections import Counter
+from threading import Lock
+from typing import Dict
+
+from flask import current_app, g, has_request_context, request
+from sqlalchemy import event
+
+# Collapse whitespace and expanded IN-lists so equivalent statements share a shape
+_WS_RE = re.compile(r"\s+")
+_IN_LIST_RE = re.compile(r"\(\s*(?:\?|%\(\w+\)s|:\w+)(?:\s*,\s*(?:\?|%\(\w+\)s|:\w+))*\s*\)")
+
+_totals_lock = Lock()
+_endpoint_totals: Dict[str, dict] = {}
+
+
+def statement_shape(statement: str) -> str:
+    """Normalise a SQL statement so repeated executions compare equal.
+
+    Args:
+        statement (str): SQL text as sent to the driver.
+
+    Returns:
+        str: Whitespace-collapsed statement with parameter lists folded.
+    """
+    return _IN_LIST_RE.sub("(...)", _WS_RE.sub(" ", statement).strip())
+
+
+class RequestQueryStats:
+    """SQL statistics for a single request.
+
+    Attributes:
+        count (int): Statements executed.
+        total_ms (float): Time spent executing statements.
+        shapes (Counter): Executions per statement shape.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.shapes = Counter()
+
+    def repeated(self, threshold: int) -> Dict[str, int]:
+        """Return statement shapes executed more than ``threshold`` times."""
+        return {shape: n for shape, n in self.shapes.items() if n > threshold}
+
+
+def current_stats():
+    """Return the SQL statistics of the current request, if any."""
+    if not has_request_context():
+        return None
+    return g.get("_query_stats")
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("_query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["_query_started"].pop()
+    stats = current_stats()
+    if stats is None:
+        return  # background jobs and CLI commands are not tracked per request
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    stats.count += 1
+    stats.total_ms += elapsed_ms
+    stats.shapes[statement_shape(statement)] += 1
+
+    slow_ms = current_app.config.get("SQL_SLOW_QUERY_MS", 200)
+    if elapsed_ms >= slow_ms:
+        current_app.logger.warning(
+            "Slow query (%.1f ms) in %s %s: %s | params=%.500r",
+            elapsed_ms, request.method, request.path, statement, parameters,
+        )
+
+
+def _handle_error(context):
+    # A failed statement never reaches after_cursor_execute; drop its start time
+    conn = context.connection
+    if conn is not None and conn.info.get("_query_started"):
+        conn.info["_query_started"].pop()
+
+
+def _start_request():
+    g._query_stats = RequestQueryStats()
+
+
+def _finish_request(response):
+    stats = current_stats()
+    if stats is None:
+        return response
+    threshold = current_app.config.get("SQL_NPLUS1_THRESHOLD", 10)
+    repeated = stats.repeated(threshold)
+    for shape, n in repeated.items():
+        current_app.logger.warning(
+            "Possible N+1 in %s %s: statement ran %d times: %s", request.method, request.path, n, shape
+        )
+
+    endpoint = request.endpoint or "<unmatched>"
+    with _totals_lock:
+        t = _endpoint_totals.setdefault(
+            endpoint, {"requests": 0, "queries": 0, "query_ms": 0.0, "max_queries": 0, "nplus1_requests": 0}
+        )
+        t["requests"] += 1
+        t["queries"] += stats.count
+        t["query_ms"] += stats.total_ms
+        t["max_queries"] = max(t["max_queries"], stats.count)
+        t["nplus1_requests"] += 1 if repeated else 0
+
+    if current_app.config.get("SQL_DEBUG_HEADERS"):
+        response.headers["X-DB-Query-Count"] = str(stats.count)
+        response.headers["X-DB-Query-Time-Ms"] = f"{stats.total_ms:.1f}"
+        if repeated:
+            response.headers["X-DB-NPlus1"] = str(max(repeated.values()))
+    return response
+
+
+def get_query_stats() -> Dict[str, dict]:
+    """Return per-endpoint SQL totals since the process started.
+
+    Returns:
+        dict: Endpoint name to request/query counts and average query time.
+    """
+    with _totals_lock:
+        out = {}
+        for endpoint, t in _endpoint_totals.items():
+            out[endpoint] = {
+                **t,
+                "query_ms": round(t["query_ms"], 1),
+                "avg_queries": round(t["queries"] / t["requests"], 2),
+                "avg_query_ms": round(t["query_ms"] / t["requests"], 2),
+            }
+        return out
+
+
+def init_query_stats(app, db):
+    """Instrument every engine of ``db`` and hook the Flask request cycle.
+
+    Args:
+        app (Flask): Flask application instance.
+        db (SQLAlchemy): Shared SQLAlchemy instance (already initialised).
+    """
+    if not app.config.get("SQL_INSTRUMENTATION", True):
+        return
+    with app.app_context():
+        for engine in db.engines.values():
+            if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+                event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+                event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+                event.listen(engine, "handle_error", _handle_error)
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
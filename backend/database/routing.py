@@ -0,0 +1,99 @@
+"""Read-Replica Routing for CareConnect Backend.
+
+This module routes queries from read-only endpoints to an optional
+replica database, while keeping writes and read-after-write reads on
+the primary.
+
+A view (or controller method) decorated with ``@read_only`` sends its
+SELECTs to the "replica" bind when one is configured. Everything else
+uses the primary. Reads stay on the primary when:
+    - the session is flushing (a write is in progress),
+    - anything was written earlier in the same request (flushed ORM
+      changes or bulk ``update()``/``delete()``/``insert()`` statements), or
+    - the same user wrote within the last REPLICA_PIN_SECONDS (stored
+      in the Flask session), so they always see their own writes.
+
+After a transaction that wrote commits, the function registered in
+``app.extensions["replica_sync"]`` (if any) runs; the local SQLite
+replica uses it to copy the primary.
+"""
+
+import time
+from functools import wraps
+
+from flask import current_app, g, has_request_context, session
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND = "replica"
+_PIN_KEY = "_db_pin_until"
+_WROTE = "_db_wrote"  # session.info flag: this transaction wrote
+
+def read_only(fn):
+    """Mark a view or controller method as safe to serve from the replica.
+
+    Args:
+        fn (callable): View function or controller method.
+
+    Returns:
+        callable: Wrapped function that enables replica reads for the request.
+    """
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        g.db_read_only = True
+        return fn(*args, **kwargs)
+    return wrapper
+
+def _replica_allowed() -> bool:
+    """Check whether reads in the current request may use the replica.
+
+    Returns:
+        bool: True for read-only requests that are not pinned to the primary.
+    """
+    if not has_request_context() or not g.get("db_read_only") or g.get("db_pinned"):
+        return False
+    return session.get(_PIN_KEY, 0) < time.time()
+
+class RoutingSession(Session):
+    """Flask-SQLAlchemy session that sends read-only traffic to the replica."""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        engine = super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+        if bind is not None or self._flushing or not _replica_allowed():
+            return engine
+        engines = self._db.engines
+        # Only the default bind has a replica
+        if REPLICA_BIND in engines and engine is engines.get(None):
+            return engines[REPLICA_BIND]
+        return engine
+
+def _pin_to_primary(sess):
+    """Pin the rest of this request, and this user briefly, to the primary."""
+    sess.info[_WROTE] = True
+    if not has_request_context():
+        return
+    g.db_pinned = True
+    pin_seconds = current_app.config.get("REPLICA_PIN_SECONDS", 5)
+    if pin_seconds > 0 and REPLICA_BIND in sess._db.engines:
+        session[_PIN_KEY] = time.time() + pin_seconds
+
+@event.listens_for(RoutingSession, "after_flush")
+def _pin_after_flush(sess, _flush_context):
+    _pin_to_primary(sess)
+
+@event.listens_for(RoutingSession, "do_orm_execute")
+def _pin_after_bulk_write(state):
+    # Query.update()/delete() and insert() statements write without a flush
+    if state.is_insert or state.is_update or state.is_delete:
+        _pin_to_primary(state.session)
+
+@event.listens_for(RoutingSession, "after_commit")
+def _sync_replica(sess):
+    if sess.info.pop(_WROTE, False):
+        sync = current_app.extensions.get("replica_sync")
+        if sync is not None:
+            sync()
+
+@event.listens_for(RoutingSession, "after_rollback")
+def _forget_write(sess):
+    sess.info.pop(_WROTE, None)
@@ -4,14 +4,94 @@ This module provides SQLite-specific database configuration
 for the Factory pattern database abstraction layer.
 """
 
+from sqlalchemy import event
 from .database_interface import DatabaseInterface
+from .pool_stats import attach_pool_stats
+
+# Shared-cache in-memory database: every pooled connection sees the same data
+MEMORY_URI = "sqlite:///file:careconnect?mode=memory&cache=shared&uri=true"
+
+def keep_alive(app, engine):
+    """Keep a shared-cache in-memory database alive as long as ``app``.
+
+    Such a database is dropped when its last connection closes, which a
+    pool does on overflow, recycle or dispose. This opens a sentinel
+    connection outside the pool, with the engine's own connect arguments
+    (Flask-SQLAlchemy rewrites relative names into the instance folder),
+    and keeps it in ``app.extensions``.
+
+    Args:
+        app (Flask): Application owning the engine.
+        engine (Engine): Engine of the in-memory database.
+    """
+    cargs, cparams = engine.dialect.create_connect_args(engine.url)
+    app.extensions["sqlite_keep_alive"] = engine.dialect.loaded_dbapi.connect(*cargs, **cparams)
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
 
 class SQLiteDatabase(DatabaseInterface):
     """SQLite database implementation.
     
     Configures Flask application to use SQLite database
-    with appropriate connection settings.
+    with appropriate connection settings. File databases run in WAL mode
+    with tuned pragmas so concurrent readers and writers do not block
+    each other; SQLITE_PATH=":memory:" gives a shared in-memory database
+    for tests and benchmarks.
+
+    A SQLite replica URL (a second local file, for trying out read
+    routing) is kept in step by copying the primary into it with SQLite's
+    online backup after every committed write. The copy is not free, so
+    it is meant for local testing only.
     """
+    def engine_options(self, config) -> dict:
+        """Build connection options for SQLite.
+        
+        Args:
+            config (Mapping): Flask app config.
+            
+        Returns:
+            dict: Keyword arguments for ``create_engine``.
+        """
+        busy_ms = config.get("SQLITE_BUSY_TIMEOUT_MS", 5000)
+        return {
+            "connect_args": {
+                "timeout": busy_ms / 1000,     # driver-level lock wait (seconds)
+                "check_same_thread": False,    # connections are shared via the pool
+            },
+        }
+
+    @staticmethod
+    def _pragma_hook(config, in_memory: bool):
+        """Create a connect-event hook that applies the tuned pragmas.
+        
+        Args:
+            config (Mapping): Flask app config.
+            in_memory (bool): Whether the database is in memory (no WAL).
+            
+        Returns:
+            callable: Listener for the engine "connect" event.
+        """
+        synchronous = str(config.get("SQLITE_SYNCHRONOUS", "NORMAL")).upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            raise ValueError(f"SQLITE_SYNCHRONOUS must be one of {_SYNCHRONOUS_MODES}")
+        pragmas = [
+            f"PRAGMA synchronous={synchronous}",
+            f"PRAGMA busy_timeout={int(config.get('SQLITE_BUSY_TIMEOUT_MS', 5000))}",
+            f"PRAGMA cache_size=-{int(config.get('SQLITE_CACHE_SIZE_KB', 65536))}",  # negative = KiB
+            "PRAGMA foreign_keys=ON",  # honour ON DELETE CASCADE like PostgreSQL
+        ]
+        if not in_memory:
+            # WAL lets readers run alongside a writer; fsync only at checkpoints
+            pragmas.insert(0, "PRAGMA journal_mode=WAL")
+            pragmas.append(f"PRAGMA mmap_size={int(config.get('SQLITE_MMAP_SIZE', 268435456))}")
+
+        def set_pragmas(dbapi_conn, _record):
+            cur = dbapi_conn.cursor()
+            for stmt in pragmas:
+                cur.execute(stmt)
+            cur.close()
+        return set_pragmas
+
     def init_app(self, app, db):
         """Initialize Flask app with SQLite configuration.
         
@@ -22,7 +102,49 @@ class SQLiteDatabase(DatabaseInterface):
         Returns:
             SQLAlchemy: Configured database instance.
         """
-        app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///app.db"
+        path = app.config.get("SQLITE_PATH") or "app.db"
+        in_memory = path == ":memory:"
+        app.config["SQLALCHEMY_DATABASE_URI"] = MEMORY_URI if in_memory else f"sqlite:///{path}"
         app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+        app.config["SQLALCHEMY_ENGINE_OPTIONS"] = {
+            **self.engine_options(app.config),
+            **app.config.get("SQLALCHEMY_ENGINE_OPTIONS", {}),  # explicit overrides win
+        }
+        self.bind_replica(app)
         db.init_app(app)
+
+        with app.app_context():
+            event.listen(db.engine, "connect", self._pragma_hook(app.config, in_memory))
+            if in_memory:
+                # Otherwise data and schema vanish when the pool closes its last connection
+                keep_alive(app, db.engine)
+            attach_pool_stats(db.engine)
+            if self.replica_url:
+                replica = db.engines["replica"]
+                event.listen(replica, "connect", self._pragma_hook(app.config, False))
+                attach_pool_stats(replica, "replica")
+                app.logger.warning(
+                    "DATABASE_REPLICA_URL is a SQLite file: it is copied from the primary "
+                    "after each write (local testing only)"
+                )
+                engine = db.engine
+                app.extensions["replica_sync"] = lambda: self.sync_replica(engine, replica)
+                self.sync_replica(engine, replica)
+                db.metadata.create_all(replica)  # a new primary has no tables yet
         return db
+
+    @staticmethod
+    def sync_replica(primary, replica):
+        """Copy the primary database into the local replica file.
+
+        Args:
+            primary (Engine): Primary engine.
+            replica (Engine): Replica engine (a SQLite file).
+        """
+        source = primary.raw_connection()
+        target = replica.raw_connection()
+        try:
+            source.driver_connection.backup(target.driver_connection)
+        finally:
+            target.close()
+            source.close()
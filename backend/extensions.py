@@ -2,17 +2,21 @@
 
 This module contains Flask extension instances and initialization functions
 for CORS, sessions, OAuth, and Supabase client configuration.
+
+Heavy client libraries (Supabase, Authlib, Flask-Session backends, Redis)
+are imported on first use, so job workers and CLI commands that never
+touch them start faster.
 """
 
+import threading
+from flask import current_app
 from flask_sqlalchemy import SQLAlchemy
-from authlib.integrations.flask_client import OAuth
 from flask_cors import CORS
-from flask_session import Session as FlaskSession
-from supabase import create_client
+from .database.routing import RoutingSession
 
 # Global extension instances
-db = SQLAlchemy()        # Shared SQLAlchemy instance for database operations
-oauth = OAuth()          # OAuth client for Google authentication
+db = SQLAlchemy(session_options={"class_": RoutingSession})  # Shared instance; routes read-only traffic to a replica
+_oauth_lock = threading.Lock()  # guards first-use OAuth registration
 
 def init_cors(app, origin):
     """Initialize CORS for the Flask application.
@@ -32,11 +36,12 @@ def init_session(app, session_type, redis_url, env):
         redis_url (str): Redis connection URL for redis session type.
         env (str): Environment ('production' or 'development').
     """
-    from redis import from_url as redis_from_url
+    from flask_session import Session as FlaskSession
     app.config["SESSION_TYPE"] = session_type
     
     # Configure Redis for session storage if specified
     if session_type == "redis":
+        from redis import from_url as redis_from_url
         app.config["SESSION_REDIS"] = redis_from_url(redis_url)
     
     # Set session cookie configuration
@@ -56,21 +61,39 @@ def init_session(app, session_type, redis_url, env):
 def init_oauth(app, client_id, client_secret):
     """Initialize OAuth configuration for Google authentication.
     
+    Only records the credentials; the OAuth registry is created on first
+    use by get_oauth().
+    
     Args:
         app (Flask): Flask application instance.
         client_id (str): Google OAuth client ID.
         client_secret (str): Google OAuth client secret.
     """
-    oauth.init_app(app)
+    app.config["GOOGLE_CLIENT_ID"] = client_id
+    app.config["GOOGLE_CLIENT_SECRET"] = client_secret
+
+def get_oauth():
+    """Lazy initialization of the OAuth registry with caching.
     
-    # Register Google OAuth provider with OpenID Connect
-    oauth.register(
-        name="google",
-        server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
-        client_id=client_id,
-        client_secret=client_secret,
-        client_kwargs={"scope": "openid email profile"},  # Request basic profile info
-    )
+    Returns:
+        OAuth: Registry of the current app with the Google provider registered.
+    """
+    if not hasattr(current_app, "_oauth"):
+        with _oauth_lock:
+            if not hasattr(current_app, "_oauth"):
+                from authlib.integrations.flask_client import OAuth
+                oauth = OAuth(current_app)
+                
+                # Register Google OAuth provider with OpenID Connect
+                oauth.register(
+                    name="google",
+                    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
+                    client_id=current_app.config.get("GOOGLE_CLIENT_ID"),
+                    client_secret=current_app.config.get("GOOGLE_CLIENT_SECRET"),
+                    client_kwargs={"scope": "openid email profile"},  # Request basic profile info
+                )
+                current_app._oauth = oauth
+    return current_app._oauth
 
 def init_supabase(url, key):
     """Initialize Supabase client for file storage.
@@ -87,4 +110,5 @@ def init_supabase(url, key):
     """
     if not url or not key:
         raise RuntimeError("SUPABASE_URL and SUPABASE_SERVICE_KEY must be set")
+    from supabase import create_client
     return create_client(url, key)
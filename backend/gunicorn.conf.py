@@ -0,0 +1,89 @@
+"""Gunicorn Configuration for CareConnect Backend.
+
+The app is loaded once in the master (``preload_app``) so workers share
+its memory copy-on-write. Anything that must not be shared across a
+fork is set up per worker in ``post_fork``:
+    - database engines drop the pooled connections inherited from the
+      master, so no two processes use the same socket;
+    - background schedulers start in exactly one worker, the one holding
+      an exclusive lock on Config.SCHEDULER_LOCK_FILE. If it exits, the
+      lock is released and its replacement takes over.
+
+Prometheus metrics are collected in multiprocess mode: every worker
+writes to files in Config.METRICS_MULTIPROC_DIR, which is emptied when
+this file is loaded (before the app preloads), and a worker's live
+gauges are dropped when it exits.
+
+Usage:
+    gunicorn -c backend/gunicorn.conf.py
+"""
+
+import fcntl
+import os
+import shutil
+
+from sqlalchemy.pool import StaticPool
+
+from backend.config import Config
+
+# Must be set before prometheus_client is first imported (when the app preloads).
+# preload_app loads the app before on_starting runs, so the directory is
+# reset here: start empty so old workers' samples are dropped.
+os.environ["PROMETHEUS_MULTIPROC_DIR"] = Config.METRICS_MULTIPROC_DIR
+shutil.rmtree(Config.METRICS_MULTIPROC_DIR, ignore_errors=True)
+os.makedirs(Config.METRICS_MULTIPROC_DIR, exist_ok=True)
+
+wsgi_app = "backend.wsgi:app"
+preload_app = True
+bind = Config.GUNICORN_BIND
+workers = Config.GUNICORN_WORKERS
+worker_class = Config.GUNICORN_WORKER_CLASS
+threads = Config.GUNICORN_THREADS
+timeout = Config.GUNICORN_TIMEOUT
+graceful_timeout = 30
+keepalive = 5
+accesslog = "-"
+
+# Open lock file of the scheduler leader (kept for the worker's lifetime)
+_scheduler_lock = None
+
+def _acquire_scheduler_lock(path):
+    """Try to become the scheduler leader without blocking.
+
+    Args:
+        path (str): Lock file shared by all workers.
+
+    Returns:
+        file: Open lock file if the lock was acquired, otherwise None.
+    """
+    f = open(path, "a")
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        f.close()
+        return None
+    return f
+
+def child_exit(server, worker):
+    """Drop the live gauges (pool usage) of a worker that has exited."""
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
+
+def post_fork(server, worker):
+    """Reset inherited connections and elect the scheduler worker."""
+    global _scheduler_lock
+    from backend.extensions import db
+    from backend.wsgi import app
+    from backend.controllers.jobs_controller import JobsController
+
+    with app.app_context():
+        for engine in db.engines.values():
+            # A StaticPool holds the only handle to an in-memory database
+            if not isinstance(engine.pool, StaticPool):
+                engine.dispose(close=False)  # leave the master's sockets alone
+
+    if Config.RUN_SCHEDULERS:
+        _scheduler_lock = _acquire_scheduler_lock(Config.SCHEDULER_LOCK_FILE)
+        if _scheduler_lock is not None:
+            server.log.info("Worker %s runs the background schedulers", os.getpid())
+            JobsController.start_schedulers(app)
@@ -0,0 +1,53 @@
+"""HTTP Caching for CareConnect Backend.
+
+This module provides the ``@cacheable`` view decorator. It adds an ETag
+(a hash of the response body), Cache-Control and optionally
+Last-Modified to successful GET responses, and answers conditional
+requests for an unchanged body with 304 Not Modified.
+"""
+
+import hashlib
+from functools import wraps
+
+from flask import current_app, request
+
+def cacheable(max_age: int = 0, public: bool = True, last_modified=None):
+    """Make a GET view's responses cacheable and revalidatable.
+
+    Args:
+        max_age (int): Seconds a client may reuse the response without
+            asking again. 0 sends ``no-cache``: clients revalidate every
+            time but get a body-less 304 when nothing changed.
+        public (bool): Allow shared caches (proxies/CDNs) to store it.
+        last_modified (callable, optional): Returns the datetime the
+            content last changed, or None if unknown.
+
+    Returns:
+        callable: Decorator for a view function.
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            response = current_app.make_response(fn(*args, **kwargs))
+            if request.method not in ("GET", "HEAD") or response.status_code != 200:
+                return response
+
+            digest = hashlib.blake2b(response.get_data(), digest_size=16).hexdigest()
+            response.set_etag(digest)
+            if last_modified is not None:
+                modified = last_modified()
+                if modified is not None:
+                    response.last_modified = modified
+
+            cc = response.cache_control
+            if max_age > 0:
+                cc.max_age = max_age
+            else:
+                cc.no_cache = True
+            if public:
+                cc.public = True
+            else:
+                cc.private = True
+            return response.make_conditional(request)
+        return wrapper
+    return decorator
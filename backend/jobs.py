@@ -0,0 +1,108 @@
+"""Standalone Job Worker for CareConnect Backend.
+
+This module runs background jobs in their own process instead of as threads
+inside the web process. The worker app only binds configuration and the
+database: no blueprints, sessions, CORS or OAuth are set up.
+
+Usage:
+    python -m backend.jobs list
+    python -m backend.jobs run cleanup_expired_items
+    python -m backend.jobs run expire_matched_requests --days 3
+    python -m backend.jobs scheduler
+
+Run web workers with RUN_SCHEDULERS=false when the scheduler runs here.
+"""
+
+import argparse
+import json
+import sys
+import time
+from flask import Flask
+from backend.config import Config
+from backend.extensions import db
+from backend.database.database_factory import DatabaseFactory
+from backend.controllers.jobs_controller import JobsController
+
+# Job keys that accept a --days argument, mapped to their keyword name
+_DAYS_KWARG = {
+    "expire_matched_requests": "days_until_expire",
+    "cleanup_approved_donations": "days_until_delete",
+}
+
+def create_worker_app():
+    """Create a minimal Flask application for running jobs.
+
+    Returns:
+        Flask: Application with configuration and database only.
+    """
+    app = Flask(__name__)
+    app.config.from_object(Config)
+
+    impl = DatabaseFactory.getDatabase(Config.DB_TYPE)
+    impl.init_app(app, db)
+    return app
+
+def run_once(app, job_key: str, days=None) -> dict:
+    """Run a single job inside an app context.
+
+    Args:
+        app (Flask): Worker application.
+        job_key (str): Key of the job to run.
+        days (int, optional): Days argument for jobs that accept one.
+
+    Returns:
+        dict: Job status after the run.
+    """
+    kwargs = {}
+    if days is not None and job_key in _DAYS_KWARG:
+        kwargs[_DAYS_KWARG[job_key]] = days
+    with app.app_context():
+        return JobsController.run_job(job_key, **kwargs)
+
+def run_scheduler(app):
+    """Run all scheduled jobs until interrupted.
+
+    Args:
+        app (Flask): Worker application.
+    """
+    JobsController.start_schedulers(app)
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        pass
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.jobs``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.jobs", description="CareConnect job worker")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("list", help="list available jobs")
+    run_p = sub.add_parser("run", help="run one job and exit")
+    run_p.add_argument("job", choices=sorted(JobsController.schedule))
+    run_p.add_argument("--days", type=int, default=None, help="days threshold for expiry/cleanup jobs")
+    sub.add_parser("scheduler", help="run the periodic scheduler loop")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for key, (_, interval) in JobsController.schedule.items():
+            print(f"{key}\tevery {interval}s")
+        return 0
+
+    app = create_worker_app()
+    if args.command == "run":
+        status = run_once(app, args.job, days=args.days)
+        print(json.dumps({args.job: status}))
+        return 1 if status.get("last_error") else 0
+
+    run_scheduler(app)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""Fast JSON Provider for CareConnect Backend.
+
+This module replaces Flask's default JSON provider with one backed by
+orjson. Datetimes and dates are written natively as ISO 8601 strings
+(the same format the controllers produced with ``.isoformat()``),
+Decimals as strings (exact, as Flask's default provider wrote them), and
+keys are sorted like Flask's default output.
+"""
+
+import decimal
+
+import orjson
+from flask.json.provider import JSONProvider
+
+_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+def _default(obj):
+    """Serialize types orjson does not support natively."""
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):  # markupsafe.Markup and friends
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider using orjson for dumps, loads and responses."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        """Serialize ``obj`` to a JSON string (Flask's kwargs are ignored)."""
+        return orjson.dumps(obj, default=_default, option=_OPTIONS).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without an intermediate str round trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=_OPTIONS), mimetype="application/json"
+        )
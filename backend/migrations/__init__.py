@@ -0,0 +1,6 @@
+"""Migrations Package.
+
+This package contains the Alembic environment and versioned schema
+revisions for the CareConnect database. Use
+``python -m backend.database.migrations`` to apply or check them.
+"""
@@ -0,0 +1,46 @@
+"""Alembic Environment for CareConnect Backend.
+
+Runs migrations against the connection handed over by
+``backend.database.migrations``, or against DATABASE_URL when invoked
+through the plain ``alembic`` command line.
+"""
+
+from alembic import context
+from sqlalchemy import create_engine, pool
+
+from backend.config import Config
+from backend.models import db
+
+target_metadata = db.metadata
+
+def _configure(**kwargs):
+    context.configure(target_metadata=target_metadata, compare_type=True, **kwargs)
+
+def run_migrations_offline():
+    """Emit SQL to stdout instead of running it (``alembic upgrade --sql``)."""
+    url = context.config.get_main_option("sqlalchemy.url") or Config.SQLALCHEMY_DATABASE_URI
+    _configure(url=url, literal_binds=True, dialect_opts={"paramstyle": "named"})
+    with context.begin_transaction():
+        context.run_migrations()
+
+def run_migrations_online():
+    """Run migrations on a live connection."""
+    connection = context.config.attributes.get("connection")
+    if connection is not None:
+        _run_on(connection)
+        return
+    url = context.config.get_main_option("sqlalchemy.url") or Config.SQLALCHEMY_DATABASE_URI
+    engine = create_engine(url, poolclass=pool.NullPool)
+    with engine.connect() as conn:
+        _run_on(conn)
+
+def _run_on(connection):
+    # SQLite cannot ALTER most things in place; batch mode copies the table
+    _configure(connection=connection, render_as_batch=connection.dialect.name == "sqlite")
+    with context.begin_transaction():
+        context.run_migrations()
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
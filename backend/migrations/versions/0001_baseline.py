@@ -0,0 +1,112 @@
+"""Baseline schema (tables as created by db.create_all before migrations).
+
+Existing databases created with db.create_all() already have these tables:
+mark them with ``python -m backend.database.migrations stamp 0001`` and then
+run ``upgrade``.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19 10:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATEGORIES = ("Food", "Drinks", "Furnitures", "Electronics", "Essentials")
+
+
+def _shared_enum(*values, name):
+    """Enum whose PostgreSQL type was already created by an earlier table."""
+    return sa.Enum(*values, name=name).with_variant(
+        postgresql.ENUM(*values, name=name, create_type=False), "postgresql"
+    )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "user",
+        sa.Column("email", sa.String(255), primary_key=True, unique=True, nullable=False),
+        sa.Column("name", sa.String(255), nullable=True),
+        sa.Column("contact_number", sa.String(50), nullable=True, unique=True),
+        sa.Column("password_hash", sa.Text(), nullable=True),
+        sa.Column("role", sa.Enum("M", "C", name="role_enum"), nullable=False),
+    )
+    op.create_table(
+        "manager",
+        sa.Column("email", sa.String(255), sa.ForeignKey("user.email", ondelete="CASCADE"), primary_key=True),
+        sa.Column("cc", sa.String(255), nullable=False),
+    )
+    op.create_table(
+        "client",
+        sa.Column("email", sa.String(255), sa.ForeignKey("user.email", ondelete="CASCADE"), primary_key=True),
+        sa.Column("monthly_income", sa.Numeric(12, 2), nullable=True),
+        sa.Column("account_status", sa.Enum("Pending", "Confirmed", "Rejected", name="account_status"), nullable=False),
+        sa.Column("gmail_acc", sa.Boolean(), nullable=False),
+    )
+    op.create_table(
+        "request",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("requester_email", sa.String(255), sa.ForeignKey("client.email", ondelete="CASCADE"), nullable=False),
+        sa.Column("request_category", sa.Enum(*CATEGORIES, name="category_enum"), nullable=False),
+        sa.Column("request_item", sa.String(120), nullable=False),
+        sa.Column("request_quantity", sa.Integer(), nullable=False),
+        sa.Column("allocation", sa.Integer(), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("status", sa.Enum("Pending", "Matched", "Expired", "Completed", name="s"), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("matched_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_table(
+        "donation",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("donor_email", sa.String(255), sa.ForeignKey("client.email", ondelete="CASCADE"), nullable=False),
+        sa.Column("donation_category", _shared_enum(*CATEGORIES, name="category_enum"), nullable=False),
+        sa.Column("donation_item", sa.String(120), nullable=False),
+        sa.Column("donation_quantity", sa.Integer(), nullable=False),
+        sa.Column("location", sa.String(255), nullable=False),
+        sa.Column("image_link", sa.Text(), nullable=False),
+        sa.Column("expiryDate", sa.Date(), nullable=True),
+        sa.Column("approved_at", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.Enum("Pending", "Approved", "Added", name="s2"), nullable=True),
+    )
+    op.create_table(
+        "item",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("donation_id", sa.Integer(), sa.ForeignKey("donation.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("status", sa.Enum("Available", "Unavailable", name="Availability"), nullable=False),
+    )
+    op.create_table(
+        "reservation",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("request_id", sa.Integer(), sa.ForeignKey("request.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("item_id", sa.Integer(), sa.ForeignKey("item.id", ondelete="CASCADE"), nullable=False),
+    )
+    op.create_table(
+        "notification",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("receiver_email", sa.String(255), sa.ForeignKey("user.email", ondelete="CASCADE"), nullable=False),
+        sa.Column("message", sa.String(255), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("viewed", sa.Boolean(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ("notification", "reservation", "item", "donation", "request", "client", "manager", "user"):
+        op.drop_table(table)
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        for enum_name in ("Availability", "s2", "s", "category_enum", "account_status", "role_enum"):
+            postgresql.ENUM(name=enum_name).drop(bind, checkfirst=True)
@@ -0,0 +1,45 @@
+"""Secondary indexes for hot filter columns.
+
+Covers the columns the controllers and jobs filter, join and sort on:
+allocation (pending requests by age, items by donation), CC summaries
+(request/donation by location), reservation release loops, notification
+polling and pending-registration lists.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19 10:05:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, Sequence[str], None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = (
+    ("ix_request_status_created_at", "request", ["status", "created_at"]),
+    ("ix_request_location_item", "request", ["location", "request_item"]),
+    ("ix_item_donation_id_status", "item", ["donation_id", "status"]),
+    ("ix_reservation_request_id", "reservation", ["request_id"]),
+    ("ix_reservation_item_id", "reservation", ["item_id"]),
+    ("ix_notification_receiver_viewed", "notification", ["receiver_email", "viewed"]),
+    ("ix_donation_location_status", "donation", ["location", "status"]),
+    ("ix_client_account_status", "client", ["account_status"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
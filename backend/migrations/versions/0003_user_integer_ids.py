@@ -0,0 +1,144 @@
+"""Integer surrogate keys for users.
+
+Adds ``user.id`` and moves every foreign key off the 255-char email:
+manager/client are keyed by ``user_id``, requests and donations point at
+``client.user_id`` and notifications at ``user.id``. Existing rows are
+backfilled by matching emails; ``user.email`` stays as a unique column.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19 11:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, Sequence[str], None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, new id column, old email column, referenced table, referenced column)
+# Children first, so a referenced key is never dropped while still in use.
+USER_REFS = (
+    ("request", "requester_id", "requester_email", "client", "user_id"),
+    ("donation", "donor_id", "donor_email", "client", "user_id"),
+    ("notification", "receiver_id", "receiver_email", "user", "id"),
+    ("manager", "user_id", "email", "user", "id"),
+    ("client", "user_id", "email", "user", "id"),
+)
+KEYED_BY_USER = ("manager", "client")
+
+
+def _pk_name(table):
+    return sa.inspect(op.get_bind()).get_pk_constraint(table).get("name")
+
+
+def _has_unique(table, columns):
+    uniques = sa.inspect(op.get_bind()).get_unique_constraints(table)
+    return any(u["column_names"] == columns for u in uniques)
+
+
+def _user_table(key):
+    """The user table keyed by ``key`` ("id" or "email"), for SQLite rebuilds."""
+    columns = [
+        sa.Column("email", sa.String(255), primary_key=key == "email", unique=True, nullable=False),
+        sa.Column("name", sa.String(255), nullable=True),
+        sa.Column("contact_number", sa.String(50), nullable=True, unique=True),
+        sa.Column("password_hash", sa.Text(), nullable=True),
+        sa.Column("role", sa.Enum("M", "C", name="role_enum"), nullable=False),
+    ]
+    if key == "id":
+        columns.insert(0, sa.Column("id", sa.Integer(), primary_key=True))
+    return sa.Table("user", sa.MetaData(), *columns)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    postgres = op.get_bind().dialect.name == "postgresql"
+    op.drop_index("ix_notification_receiver_viewed", table_name="notification")
+
+    # user.id, numbered for existing rows
+    if postgres:
+        op.execute('ALTER TABLE "user" ADD COLUMN id SERIAL')
+    else:
+        op.add_column("user", sa.Column("id", sa.Integer(), nullable=True))
+        op.execute('UPDATE "user" SET id = rowid')
+
+    # Integer reference columns, backfilled from the email they replace
+    for table, new_col, old_col, _, _ in USER_REFS:
+        op.add_column(table, sa.Column(new_col, sa.Integer(), nullable=True))
+        op.execute(
+            f'UPDATE "{table}" SET {new_col} = '
+            f'(SELECT u.id FROM "user" u WHERE u.email = "{table}".{old_col})'
+        )
+
+    # Dropping the email columns also drops their foreign keys and primary keys
+    for table, new_col, old_col, _, _ in USER_REFS:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column(old_col)
+            batch.alter_column(new_col, existing_type=sa.Integer(), nullable=False)
+
+    # The user primary key moves from email to id; email stays unique
+    if postgres:
+        op.drop_constraint(_pk_name("user"), "user", type_="primary")
+        op.alter_column("user", "id", existing_type=sa.Integer(), nullable=False)
+        op.create_primary_key("user_pkey", "user", ["id"])
+        if not _has_unique("user", ["email"]):
+            op.create_unique_constraint("user_email_key", "user", ["email"])
+    else:
+        with op.batch_alter_table("user", copy_from=_user_table("id"), recreate="always"):
+            pass
+
+    for table in KEYED_BY_USER:
+        with op.batch_alter_table(table) as batch:
+            batch.create_primary_key(f"{table}_pkey", ["user_id"])
+
+    for table, new_col, _, ref_table, ref_col in reversed(USER_REFS):
+        with op.batch_alter_table(table) as batch:
+            batch.create_foreign_key(
+                f"{table}_{new_col}_fkey", ref_table, [new_col], [ref_col], ondelete="CASCADE"
+            )
+
+    op.create_index("ix_notification_receiver_viewed", "notification", ["receiver_id", "viewed"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    postgres = op.get_bind().dialect.name == "postgresql"
+    op.drop_index("ix_notification_receiver_viewed", table_name="notification")
+
+    for table, new_col, old_col, _, _ in USER_REFS:
+        op.add_column(table, sa.Column(old_col, sa.String(255), nullable=True))
+        op.execute(
+            f'UPDATE "{table}" SET {old_col} = '
+            f'(SELECT u.email FROM "user" u WHERE u.id = "{table}".{new_col})'
+        )
+
+    for table, new_col, old_col, _, _ in USER_REFS:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column(new_col)
+            batch.alter_column(old_col, existing_type=sa.String(255), nullable=False)
+
+    if postgres:
+        op.drop_column("user", "id")  # takes the primary key with it
+        op.create_primary_key("user_pkey", "user", ["email"])
+    else:
+        with op.batch_alter_table("user", copy_from=_user_table("email"), recreate="always"):
+            pass
+
+    for table in KEYED_BY_USER:
+        with op.batch_alter_table(table) as batch:
+            batch.create_primary_key(f"{table}_pkey", ["email"])
+
+    for table, _, old_col, ref_table, _ in reversed(USER_REFS):
+        with op.batch_alter_table(table) as batch:
+            batch.create_foreign_key(
+                f"{table}_{old_col}_fkey", ref_table, [old_col], ["email"], ondelete="CASCADE"
+            )
+
+    op.create_index("ix_notification_receiver_viewed", "notification", ["receiver_email", "viewed"])
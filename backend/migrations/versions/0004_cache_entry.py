@@ -0,0 +1,39 @@
+"""Shared cache rows with a refresh lease.
+
+Adds ``cache_entry``: one row per cached dataset holding the last
+downloaded payload and a lease, so only one worker in the cluster
+refreshes the community club markers at a time.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19 13:30:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, Sequence[str], None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "cache_entry",
+        sa.Column("name", sa.String(64), primary_key=True),
+        sa.Column("payload", sa.Text(), nullable=True),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("lease_owner", sa.String(255), nullable=True),
+        sa.Column("lease_until", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("cache_entry")
@@ -0,0 +1,94 @@
+"""Community clubs as a table.
+
+Adds ``community_club`` and an integer ``cc_id`` on request, donation and
+manager. Existing rows are backfilled from their CC name columns, which
+stay as a display copy; the per-CC indexes move from the names to
+``cc_id``. Coordinates and addresses are filled in by the
+``sync_community_clubs`` job.
+
+``manager.cc_id`` is required from here on. Managers are created by hand,
+so insert them with both columns:
+    INSERT INTO manager (user_id, cc_id, cc)
+    SELECT <user id>, id, name FROM community_club WHERE name = '<CC name>';
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19 16:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, Sequence[str], None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, CC name column)
+CC_REFS = (
+    ("request", "location"),
+    ("donation", "location"),
+    ("manager", "cc"),
+)
+# (index name, table, columns) before and after
+OLD_INDEXES = (
+    ("ix_request_location_item", "request", ["location", "request_item"]),
+    ("ix_donation_location_status", "donation", ["location", "status"]),
+)
+NEW_INDEXES = (
+    ("ix_request_cc_id_item", "request", ["cc_id", "request_item"]),
+    ("ix_donation_cc_id_status", "donation", ["cc_id", "status"]),
+    ("ix_manager_cc_id", "manager", ["cc_id"]),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "community_club",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("name", sa.String(255), nullable=False, unique=True),
+        sa.Column("lat", sa.Float(), nullable=True),
+        sa.Column("lng", sa.Float(), nullable=True),
+        sa.Column("address", sa.Text(), nullable=True),
+    )
+
+    # One row per CC name already in use
+    names = " UNION ".join(f'SELECT {col} AS name FROM "{table}"' for table, col in CC_REFS)
+    op.execute(f"INSERT INTO community_club (name) SELECT name FROM ({names}) AS used ORDER BY name")
+
+    for name, table, _ in OLD_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    for table, col in CC_REFS:
+        op.add_column(table, sa.Column("cc_id", sa.Integer(), nullable=True))
+        op.execute(
+            f'UPDATE "{table}" SET cc_id = '
+            f'(SELECT c.id FROM community_club c WHERE c.name = "{table}".{col})'
+        )
+        with op.batch_alter_table(table) as batch:
+            batch.alter_column("cc_id", existing_type=sa.Integer(), nullable=False)
+            batch.create_foreign_key(f"{table}_cc_id_fkey", "community_club", ["cc_id"], ["id"])
+
+    for name, table, columns in NEW_INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in NEW_INDEXES:
+        op.drop_index(name, table_name=table)
+
+    # Dropping the column also drops its foreign key
+    for table, _ in CC_REFS:
+        with op.batch_alter_table(table) as batch:
+            batch.drop_column("cc_id")
+
+    for name, table, columns in OLD_INDEXES:
+        op.create_index(name, table, columns)
+
+    op.drop_table("community_club")
@@ -1,7 +1,8 @@
 """Database Models for CareConnect Application.
 
 This module defines all SQLAlchemy database models used in the CareConnect system,
-including User, Manager, Client, Request, Donation, Item, Reservation, and Notification models.
+including User, Manager, Client, CommunityClub, Request, Donation, Item,
+Reservation, Notification and CacheEntry models.
 """
 
 from datetime import datetime, timezone
@@ -11,41 +12,67 @@ class User(db.Model):
     """User model representing both managers and clients.
     
     Attributes:
-        email (str): Primary key, unique email address
+        id (int): Primary key (surrogate key used by all foreign keys)
+        email (str): Unique email address used to log in and look users up
         name (str): User's full name
         contact_number (str): Unique contact number
         password_hash (str): Hashed password (null for Google OAuth users)
         role (str): User role - 'M' for Manager, 'C' for Client
     """
     __tablename__ = "user"
-    email = db.Column(db.String(255), primary_key=True, unique=True, nullable=False)
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(255), unique=True, nullable=False)
     name = db.Column(db.String(255), nullable=True)
     contact_number = db.Column(db.String(50), nullable=True, unique=True)
     password_hash = db.Column(db.Text, nullable=True)   # null if Google-only
     role = db.Column(db.Enum("M", "C", name="role_enum"), nullable=False)
 
+class CommunityClub(db.Model):
+    """Community club, synced from the data.gov.sg dataset.
+    
+    Requests, donations and managers point here by ``id``; their name
+    columns keep a copy of ``name`` for display.
+    
+    Attributes:
+        id (int): Primary key
+        name (str): Unique community club name
+        lat (float): Latitude (null for CCs not in the dataset)
+        lng (float): Longitude (null for CCs not in the dataset)
+        address (str): Street address
+    """
+    __tablename__ = "community_club"
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(255), unique=True, nullable=False)
+    lat = db.Column(db.Float, nullable=True)
+    lng = db.Column(db.Float, nullable=True)
+    address = db.Column(db.Text, nullable=True)
+
 class Manager(db.Model):
     """Manager model for community club managers.
     
     Attributes:
-        email (str): Foreign key to User.email
-        cc (str): Community club name the manager oversees
+        user_id (int): Primary key, foreign key to User.id
+        cc_id (int): Foreign key to CommunityClub.id (the CC the manager oversees)
+        cc (str): Display copy of the CC name, written with cc_id; never filtered on
     """
     __tablename__ = "manager"
-    email = db.Column(db.String(255), db.ForeignKey("user.email", ondelete="CASCADE"), primary_key=True)
+    __table_args__ = (db.Index("ix_manager_cc_id", "cc_id"),)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
+    cc_id = db.Column(db.Integer, db.ForeignKey("community_club.id"), nullable=False)
     cc = db.Column(db.String(255), nullable=False)
 
 class Client(db.Model):
     """Client model for users who can make requests and donations.
     
     Attributes:
-        email (str): Foreign key to User.email
+        user_id (int): Primary key, foreign key to User.id
         monthly_income (Decimal): Client's monthly income
         account_status (str): Account status - Pending, Confirmed, or Rejected
         gmail_acc (bool): Whether user registered via Google OAuth
     """
     __tablename__ = "client"
-    email = db.Column(db.String(255), db.ForeignKey("user.email", ondelete="CASCADE"), primary_key=True)
+    __table_args__ = (db.Index("ix_client_account_status", "account_status"),)
+    user_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), primary_key=True)
     monthly_income = db.Column(db.Numeric(12, 2), nullable=True)
     account_status = db.Column(db.Enum("Pending", "Confirmed", "Rejected", name="account_status"), nullable=False, default="Pending")
     gmail_acc = db.Column(db.Boolean, nullable=False, default=False)
@@ -55,23 +82,29 @@ class Request(db.Model):
     
     Attributes:
         id (int): Primary key
-        requester_email (str): Foreign key to Client.email
+        requester_id (int): Foreign key to Client.user_id
         request_category (str): Category - Food, Drinks, Furnitures, Electronics, Essentials
         request_item (str): Name of requested item
         request_quantity (int): Quantity requested
         allocation (int): Number of items allocated
-        location (str): Pickup location
+        cc_id (int): Foreign key to CommunityClub.id (pickup location)
+        location (str): Display copy of the CC name, written with cc_id; never filtered on
         status (str): Request status - Pending, Matched, Expired, Completed
         created_at (datetime): When request was created
         matched_at (datetime): When request was matched with donations
     """
     __tablename__ = "request"
+    __table_args__ = (
+        db.Index("ix_request_status_created_at", "status", "created_at"),  # allocation queue
+        db.Index("ix_request_cc_id_item", "cc_id", "request_item"),  # CC summaries
+    )
     id = db.Column(db.Integer, primary_key=True)
-    requester_email = db.Column(db.String(255), db.ForeignKey("client.email", ondelete="CASCADE"), nullable=False)
+    requester_id = db.Column(db.Integer, db.ForeignKey("client.user_id", ondelete="CASCADE"), nullable=False)
     request_category = db.Column(db.Enum("Food", "Drinks", "Furnitures", "Electronics", "Essentials", name="category_enum"), nullable=False)
     request_item = db.Column(db.String(120), nullable=False)
     request_quantity = db.Column(db.Integer, nullable=False, default=1)
     allocation = db.Column(db.Integer, nullable=False, default=0)
+    cc_id = db.Column(db.Integer, db.ForeignKey("community_club.id"), nullable=False)
     location = db.Column(db.String(255), nullable=False)
     status = db.Column(db.Enum("Pending", "Matched", "Expired", "Completed", name="s"), nullable=False, default="Pending")
     created_at = db.Column(db.DateTime(timezone=True), default=datetime.now(timezone.utc), nullable=False)
@@ -82,22 +115,25 @@ class Donation(db.Model):
     
     Attributes:
         id (int): Primary key
-        donor_email (str): Foreign key to Client.email
+        donor_id (int): Foreign key to Client.user_id
         donation_category (str): Category - Food, Drinks, Furnitures, Electronics, Essentials
         donation_item (str): Name of donated item
         donation_quantity (int): Quantity donated
-        location (str): Donation location
+        cc_id (int): Foreign key to CommunityClub.id (donation location)
+        location (str): Display copy of the CC name, written with cc_id; never filtered on
         image_link (str): URL to donation image
         expiryDate (date): Expiry date for perishable items
         approved_at (datetime): When donation was approved
         status (str): Donation status - Pending, Approved, Added
     """
     __tablename__ = "donation"
+    __table_args__ = (db.Index("ix_donation_cc_id_status", "cc_id", "status"),)
     id = db.Column(db.Integer, primary_key=True)
-    donor_email = db.Column(db.String(255), db.ForeignKey("client.email", ondelete="CASCADE"), nullable=False)
+    donor_id = db.Column(db.Integer, db.ForeignKey("client.user_id", ondelete="CASCADE"), nullable=False)
     donation_category = db.Column(db.Enum("Food", "Drinks", "Furnitures", "Electronics", "Essentials", name="category_enum"), nullable=False)
     donation_item = db.Column(db.String(120), nullable=False)
     donation_quantity = db.Column(db.Integer, nullable=False, default=1)
+    cc_id = db.Column(db.Integer, db.ForeignKey("community_club.id"), nullable=False)
     location = db.Column(db.String(255), nullable=False)
     image_link = db.Column(db.Text, nullable=False)
     expiryDate = db.Column(db.Date, nullable=True)
@@ -113,6 +149,7 @@ class Item(db.Model):
         status (str): Item availability - Available or Unavailable
     """
     __tablename__ = "item"
+    __table_args__ = (db.Index("ix_item_donation_id_status", "donation_id", "status"),)
     id = db.Column(db.Integer, primary_key=True)
     donation_id = db.Column(db.Integer, db.ForeignKey("donation.id", ondelete="CASCADE"), nullable=False)
     status = db.Column(db.Enum("Available", "Unavailable", name="Availability"), nullable=False, default="Available")
@@ -126,6 +163,10 @@ class Reservation(db.Model):
         item_id (int): Foreign key to Item.id
     """
     __tablename__ = "reservation"
+    __table_args__ = (
+        db.Index("ix_reservation_request_id", "request_id"),
+        db.Index("ix_reservation_item_id", "item_id"),
+    )
     id = db.Column(db.Integer, primary_key=True)
     request_id = db.Column(db.Integer, db.ForeignKey("request.id", ondelete="CASCADE"), nullable=False)
     item_id = db.Column(db.Integer, db.ForeignKey("item.id", ondelete="CASCADE"), nullable=False)
@@ -135,14 +176,36 @@ class Notification(db.Model):
     
     Attributes:
         id (int): Primary key
-        receiver_email (str): Foreign key to User.email
+        receiver_id (int): Foreign key to User.id
         message (str): Notification message content
         created_at (datetime): When notification was created
         viewed (bool): Whether notification has been viewed
     """
     __tablename__ = "notification"
+    __table_args__ = (db.Index("ix_notification_receiver_viewed", "receiver_id", "viewed"),)
     id = db.Column(db.Integer, primary_key=True)
-    receiver_email = db.Column(db.String(255), db.ForeignKey("user.email", ondelete="CASCADE"), nullable=False)
+    receiver_id = db.Column(db.Integer, db.ForeignKey("user.id", ondelete="CASCADE"), nullable=False)
     message = db.Column(db.String(255), nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.now(timezone.utc))
     viewed = db.Column(db.Boolean, default=False)
+
+class CacheEntry(db.Model):
+    """Shared copy of a cached dataset plus the refresh lease for it.
+
+    One row per cache. The worker holding an unexpired lease is the only
+    one in the cluster downloading the dataset; the others keep serving
+    their previous copy and pick up ``payload`` once it is written.
+    
+    Attributes:
+        name (str): Primary key, cache name (e.g. "cc_markers")
+        payload (str): JSON-encoded cached data
+        fetched_at (datetime): When the payload was downloaded
+        lease_owner (str): Worker currently refreshing the cache
+        lease_until (datetime): When the refresh lease expires
+    """
+    __tablename__ = "cache_entry"
+    name = db.Column(db.String(64), primary_key=True)
+    payload = db.Column(db.Text, nullable=True)
+    fetched_at = db.Column(db.DateTime(timezone=True), nullable=True)
+    lease_owner = db.Column(db.String(255), nullable=True)
+    lease_until = db.Column(db.DateTime(timezone=True), nullable=True)
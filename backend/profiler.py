@@ -0,0 +1,185 @@
+"""On-Demand Request Profiler for CareConnect Backend.
+
+This module profiles single requests in production. A request is
+profiled only when it carries the admin token, either as an
+``X-Profile`` header or a ``__profile`` query parameter. The profile is
+written to PROFILER_DIR and its file name is returned in the
+``X-Profile-Output`` response header.
+
+Modes (PROFILER_MODE):
+    - "sampling": samples the request thread's stack every
+      PROFILER_INTERVAL_MS and writes ``.folded`` stacks, ready for
+      flamegraph.pl or speedscope.
+    - "cprofile": deterministic cProfile, written as a ``.prof`` pstats
+      file (view with snakeviz, or convert with flameprof).
+
+With PROFILER_TOKEN unset nothing is installed, so requests pay no
+overhead at all. At most PROFILER_MAX_PER_MINUTE requests are profiled
+per process, one at a time, and the directory is pruned to the newest
+PROFILER_MAX_FILES files.
+"""
+
+import cProfile
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from urllib.parse import parse_qs
+
+_HEADER = "HTTP_X_PROFILE"
+_QUERY_PARAM = "__profile"
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9_.-]+")
+
+class _StackSampler(threading.Thread):
+    """Background thread counting the call stacks of one thread."""
+
+    def __init__(self, thread_id: int, interval: float):
+        super().__init__(name="profiler-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._done = threading.Event()
+
+    def run(self):
+        while not self._done.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def folded(self) -> str:
+        """Return the samples in folded-stack format (one stack per line)."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+class ProfilerMiddleware:
+    """WSGI middleware that profiles token-carrying requests.
+
+    Args:
+        wsgi_app (callable): Wrapped WSGI application.
+        config (Mapping): Flask app config with the PROFILER_* settings.
+    """
+
+    def __init__(self, wsgi_app, config):
+        self.wsgi_app = wsgi_app
+        self.token = config["PROFILER_TOKEN"].encode()
+        self.mode = config.get("PROFILER_MODE", "sampling")
+        self.directory = config.get("PROFILER_DIR", "profiles")
+        self.interval = max(config.get("PROFILER_INTERVAL_MS", 5), 1) / 1000
+        self.max_per_minute = config.get("PROFILER_MAX_PER_MINUTE", 6)
+        self.max_files = config.get("PROFILER_MAX_FILES", 50)
+        self._busy = threading.Lock()  # one profiled request at a time
+        self._recent = deque()  # start times of recent profiles
+        self._seq = 0
+
+    def __call__(self, environ, start_response):
+        if not self._requested(environ):
+            return self.wsgi_app(environ, start_response)
+        if not self._busy.acquire(blocking=False):
+            return self.wsgi_app(environ, start_response)
+        try:
+            if not self._within_rate():
+                return self.wsgi_app(environ, start_response)
+            return self._profile(environ, start_response)
+        finally:
+            self._busy.release()
+
+    def _requested(self, environ) -> bool:
+        supplied = environ.get(_HEADER)
+        if supplied is None:
+            if _QUERY_PARAM not in environ.get("QUERY_STRING", ""):
+                return False
+            supplied = (parse_qs(environ["QUERY_STRING"]).get(_QUERY_PARAM) or [""])[0]
+        return hmac.compare_digest(supplied.encode(), self.token)
+
+    def _within_rate(self) -> bool:
+        now = time.monotonic()
+        while self._recent and now - self._recent[0] > 60:
+            self._recent.popleft()
+        if len(self._recent) >= self.max_per_minute:
+            return False
+        self._recent.append(now)
+        return True
+
+    def _profile(self, environ, start_response):
+        captured = {}
+
+        def capture(status, headers, exc_info=None):
+            captured["status"], captured["headers"] = status, headers
+            return lambda data: body.append(data)  # legacy write() callable
+
+        body = []
+        started = time.perf_counter()
+        if self.mode == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = _StackSampler(threading.get_ident(), self.interval)
+            profiler.start()
+        try:
+            app_iter = self.wsgi_app(environ, capture)
+            try:
+                body.extend(app_iter)  # the body is produced inside the profile
+            finally:
+                if hasattr(app_iter, "close"):
+                    app_iter.close()
+        finally:
+            if self.mode == "cprofile":
+                profiler.disable()
+            else:
+                profiler.stop()
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        name = self._write(environ, profiler)
+        headers = list(captured["headers"]) + [
+            ("X-Profile-Output", name),
+            ("X-Profile-Time-Ms", f"{elapsed_ms:.1f}"),
+        ]
+        start_response(captured["status"], headers)
+        return body
+
+    def _write(self, environ, profiler) -> str:
+        os.makedirs(self.directory, exist_ok=True)
+        self._seq += 1
+        path = _UNSAFE_RE.sub("_", environ.get("PATH_INFO", "/").strip("/")) or "root"
+        stem = f"{time.strftime('%Y%m%dT%H%M%S')}-{environ.get('REQUEST_METHOD', 'GET')}-{path[:80]}-{os.getpid()}-{self._seq}"
+        if self.mode == "cprofile":
+            name = f"{stem}.prof"
+            profiler.dump_stats(os.path.join(self.directory, name))
+        else:
+            name = f"{stem}.folded"
+            with open(os.path.join(self.directory, name), "w") as f:
+                f.write(profiler.folded())
+        self._prune()
+        return name
+
+    def _prune(self):
+        """Delete the oldest profiles beyond PROFILER_MAX_FILES."""
+        entries = [e for e in os.scandir(self.directory) if e.name.endswith((".folded", ".prof"))]
+        if len(entries) <= self.max_files:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[:len(entries) - self.max_files]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass  # another worker pruned it first
+
+def init_profiler(app):
+    """Wrap ``app`` with the on-demand profiler when PROFILER_TOKEN is set.
+
+    Args:
+        app (Flask): Flask application instance.
+    """
+    if app.config.get("PROFILER_TOKEN"):
+        app.wsgi_app = ProfilerMiddleware(app.wsgi_app, app.config)
@@ -0,0 +1,20 @@
+"""Admin Routes for CareConnect Backend.
+
+This module defines Flask routes for operational monitoring
+such as database connection pool and query statistics.
+"""
+
+from flask import Blueprint, jsonify
+from ..controllers.admin_controller import AdminController
+
+admin_bp = Blueprint("admin", __name__, url_prefix="/admin")
+
+# Get connection pool checkout-wait and utilisation statistics
+@admin_bp.get("/db/pool")
+def pool_status():
+    return jsonify(AdminController.pool_status())
+
+# Get per-endpoint SQL query counts, timings and N+1 flags
+@admin_bp.get("/db/queries")
+def query_status():
+    return jsonify(AdminController.query_status())
@@ -6,10 +6,24 @@ including location information and fulfillment statistics.
 
 from flask import Blueprint
 from ..controllers.community_controller import CCController as c
+from ..database.routing import read_only
+from ..http_cache import cacheable
+from ..services.cc_cache import cc_cache
 
 community_bp = Blueprint("community", __name__, url_prefix="/api")
 
 # Get community clubs with fulfillment rates and search functionality
+# (clients may reuse it for a minute, then revalidate with the ETag; no
+# Last-Modified, since the live fulfilment rates change without the markers)
 @community_bp.get("/community-clubs")
+@cacheable(max_age=60)
+@read_only
 def community_clubs(): 
     return c.community_clubs()
+
+# Get the community clubs nearest to a location (lat, lng, k, radius_km)
+# (markers only, so they last changed when the markers were downloaded)
+@community_bp.get("/community-clubs/nearest")
+@cacheable(max_age=60, last_modified=cc_cache.modified_at)
+def nearest_community_clubs():
+    return c.nearest_community_clubs()
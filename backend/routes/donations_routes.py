@@ -6,6 +6,7 @@ creation, approval workflow, and CRUD operations for donations.
 
 from flask import Blueprint, current_app
 from ..controllers.donations_controller import DonationController as c
+from ..database.routing import read_only
 from ..extensions import init_supabase
 from ..config import Config
 
@@ -24,6 +25,7 @@ def create_donation():
 
 # Get current user's donations
 @donations_bp.get("/my_donations")
+@read_only
 def my_donations(): 
     return c.my_donations()
 
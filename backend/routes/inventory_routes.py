@@ -6,25 +6,35 @@ including CC summaries, shortage tracking, and analytics.
 
 from flask import Blueprint
 from ..controllers.inventory_controller import InventoryController as c
+from ..database.routing import read_only
+from ..http_cache import cacheable
 
 inventory_bp = Blueprint("inventory", __name__, url_prefix="/api")
 
 # Manager: Get comprehensive CC summary with detailed statistics
+# (per-user data: browsers may keep it, shared caches must not)
 @inventory_bp.route("/manager/cc_summary", methods=["GET"])
+@cacheable(public=False)
+@read_only
 def get_manager_summary():
     return c.manager_cc_summary()
 
 # Manager: Get severe shortage items for specific location
 @inventory_bp.route("/manager/severe_shortage/<string:location>", methods=["GET"])
+@read_only
 def get_severe_shortage(location):
     return c.severe_shortage(location)
 
 # Manager: Get detailed inventory for specific CC
 @inventory_bp.route("/manager/inventory/<string:location>")
+@read_only
 def get_cc_inventory(location):
     return c.get_cc_inventory(location)
 
 # Client: Get simplified CC summary with shortage highlights
+# (private for the same reason)
 @inventory_bp.route("/client/cc_summary", methods=["GET"])
+@cacheable(public=False)
+@read_only
 def get_client_summary(): 
     return c.client_cc_summary()
\ No newline at end of file
@@ -15,8 +15,16 @@ def get_status():
     """Return current job status summary."""
     return jsonify(JobsController.get_status())
 
+# Manually trigger allocation of pending requests
+@jobs_bp.post("/run/allocation")
+def run_allocation_now():
+    """Run the allocation job now and return its result."""
+    result = JobsController.run_allocation_now()
+    return jsonify(result)
+
 # Manually trigger cleanup of expired items
-@jobs_bp.get("/run/cleanup")
+# (POST like the other triggers; GET still accepted for existing callers)
+@jobs_bp.route("/run/cleanup", methods=["GET", "POST"])
 def run_cleanup_now():
     result = JobsController.run_cleanup_now()
     return jsonify(result)
@@ -0,0 +1,17 @@
+"""Metrics Routes for CareConnect Backend.
+
+This module defines the Prometheus scrape endpoint.
+"""
+
+from flask import Blueprint, Response, current_app, jsonify
+from ..controllers.admin_controller import AdminController
+
+metrics_bp = Blueprint("metrics", __name__)
+
+# Get Prometheus metrics (aggregated across gunicorn workers)
+@metrics_bp.get("/metrics")
+def metrics():
+    if not current_app.config.get("METRICS_ENABLED", True):
+        return jsonify({"message": "Not found"}), 404
+    body, content_type = AdminController.metrics()
+    return Response(body, content_type=content_type)
@@ -6,6 +6,7 @@ broadcast subscriptions, notification CRUD, and Observer pattern endpoints.
 
 from flask import Blueprint
 from ..controllers.notification_controller import NotificationController as c
+from ..database.routing import read_only
 
 notification_bp = Blueprint("notifications", __name__, url_prefix="/api")
 
@@ -26,6 +27,7 @@ def list_subscriptions():
 
 # Get user's notifications (latest 50)
 @notification_bp.route("/notifications", methods=["GET"])
+@read_only
 def my_notifications():
     return c.my_notifications()
 
@@ -36,6 +38,7 @@ def delete_notification(notification_id: int):
 
 # Get count of unread notifications
 @notification_bp.route("/notifications/unread-count", methods=["GET"])
+@read_only
 def get_unread_count():
     return c.get_unread_count()
 
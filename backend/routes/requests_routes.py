@@ -6,6 +6,7 @@ creation, updates, completion workflow, and CRUD operations.
 
 from flask import Blueprint
 from ..controllers.requests_controller import RequestController as c
+from ..database.routing import read_only
 
 requests_bp = Blueprint("requests", __name__, url_prefix="/api")
 
@@ -16,6 +17,7 @@ def create_request():
 
 # Get current user's requests
 @requests_bp.get("/my_requests")
+@read_only
 def my_requests(): 
     return c.my_requests()
 
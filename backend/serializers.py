@@ -0,0 +1,67 @@
+"""Model Serializers for CareConnect Backend.
+
+This module defines one serializer per model so every controller returns
+the same fields in the same format. Field access is compiled once into an
+``operator.attrgetter``; dates, datetimes and Decimals are left as-is for
+the JSON provider to encode.
+"""
+
+from operator import attrgetter
+from typing import Iterable, List
+
+class ModelSerializer:
+    """Precompiled serializer turning model instances into dicts.
+
+    Attributes:
+        fields (tuple): Attribute names copied into the output, in order.
+    """
+
+    def __init__(self, *fields: str):
+        self.fields = fields
+        getter = attrgetter(*fields)
+        # attrgetter returns a bare value (not a tuple) for a single field
+        self._values = getter if len(fields) > 1 else (lambda obj: (getter(obj),))
+
+    def __call__(self, obj, **extra) -> dict:
+        """Serialize one instance.
+
+        Args:
+            obj: Model instance.
+            **extra: Additional keys (e.g. joined columns) to include.
+
+        Returns:
+            dict: Field name to value.
+        """
+        out = dict(zip(self.fields, self._values(obj)))
+        if extra:
+            out.update(extra)
+        return out
+
+    def many(self, rows: Iterable) -> List[dict]:
+        """Serialize a sequence of instances.
+
+        Args:
+            rows (iterable): Model instances.
+
+        Returns:
+            list: One dict per instance.
+        """
+        fields, values = self.fields, self._values
+        return [dict(zip(fields, values(obj))) for obj in rows]
+
+request_serializer = ModelSerializer(
+    "id", "request_category", "request_item", "request_quantity", "allocation",
+    "location", "status", "created_at", "matched_at",
+)
+
+donation_serializer = ModelSerializer(
+    "id", "donation_category", "donation_item", "donation_quantity", "location",
+    "image_link", "status", "expiryDate",
+)
+
+notification_serializer = ModelSerializer("id", "message", "created_at", "viewed")
+
+client_serializer = ModelSerializer("monthly_income", "account_status", "gmail_acc")
+
+# Pending-registration list rows: only what managers review
+pending_client_serializer = ModelSerializer("monthly_income")
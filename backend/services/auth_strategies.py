@@ -7,10 +7,10 @@ and traditional email/password authentication.
 
 from abc import ABC, abstractmethod
 from flask import jsonify, redirect, url_for, session
-from ..extensions import oauth, db
+from ..extensions import get_oauth, db
 from ..models import User, Client
 from ..services.find_user import find_user_by_email
-from ..services.password import hash_password, verify_password
+from ..services.password import PasswordServiceBusy, hash_password, needs_rehash, verify_password
 from ..services.notification_strategies import DatabaseNotificationStrategy
 
 
@@ -62,6 +62,7 @@ class GoogleOAuthStrategy(AuthenticationStrategy):
         """
         try:
             # Exchange authorization code for access token
+            oauth = get_oauth()
             oauth.google.authorize_access_token()
             
             # Get user info endpoint from Google's metadata
@@ -81,7 +82,7 @@ class GoogleOAuthStrategy(AuthenticationStrategy):
                 # Update name if not previously set
                 user.name = user.name or info.get("name")
                 db.session.commit()
-                session["user_email"] = user.email
+                session["user_id"] = user.id
                 return {"authenticated": True, "redirect": "/clienthome"}, 200
             else:
                 # Auto-create new user for Google OAuth
@@ -108,16 +109,16 @@ class GoogleOAuthStrategy(AuthenticationStrategy):
             db.session.add(user)
             db.session.commit()
             
-            client = Client(gmail_acc=True, email=user.email)
+            client = Client(gmail_acc=True, user_id=user.id)
             db.session.add(client)
             db.session.commit()
             
             # Welcome notification
             msg = f"Welcome to CareConnect, {user.name}. Your Google account has been linked successfully!"
             notification_strategy = DatabaseNotificationStrategy()
-            notification_strategy.create_notification(msg, user.email)
+            notification_strategy.create_notification(msg, user.id)
             
-            session["user_email"] = user.email
+            session["user_id"] = user.id
             return {"authenticated": True, "redirect": "/clienthome"}, 201
             
         except Exception as e:
@@ -146,11 +147,23 @@ class PasswordStrategy(AuthenticationStrategy):
         if not email or not password:
             return {"error": "Email and password are required"}, 400
         
-        user = User.query.get(email)
-        if not user or not user.password_hash or not verify_password(password, user.password_hash):
-            return {"error": "Invalid credentials"}, 401
+        user = find_user_by_email(email)
+        try:
+            if not user or not user.password_hash or not verify_password(password, user.password_hash):
+                return {"error": "Invalid credentials"}, 401
+        except PasswordServiceBusy as e:
+            return {"error": str(e)}, 503
+
+        # Hashed with older costs: store a hash with the configured ones
+        # (skipped when the pool is busy; the next login tries again)
+        if needs_rehash(user.password_hash):
+            try:
+                user.password_hash = hash_password(password)
+                db.session.commit()
+            except PasswordServiceBusy:
+                pass
         
-        session["user_email"] = user.email
+        session["user_id"] = user.id
         return {"authenticated": True, "role": user.role}, 200
     
     def create_user(self, data):
@@ -172,11 +185,14 @@ class PasswordStrategy(AuthenticationStrategy):
                 return {"error": "Monthly income must be a non-negative number"}, 400
             
             # Check for duplicate email registration
-            if User.query.get(data["email"]):
+            if find_user_by_email(data["email"]):
                 return {"error": "Email already registered"}, 409
             
             # Create user
-            phash = hash_password(data["password"])
+            try:
+                phash = hash_password(data["password"])
+            except PasswordServiceBusy as e:
+                return {"error": str(e)}, 503
             user = User(
                 name=data["name"],
                 contact_number=data["contactNumber"],
@@ -190,7 +206,7 @@ class PasswordStrategy(AuthenticationStrategy):
             # Create client profile
             client = Client(
                 monthly_income=float(data["monthlyIncome"]),
-                email=data["email"]
+                user_id=user.id
             )
             db.session.add(client)
             db.session.commit()
@@ -204,16 +220,16 @@ class PasswordStrategy(AuthenticationStrategy):
                 )
                 notification_strategy = DatabaseNotificationStrategy()
                 for m in managers:
-                    notification_strategy.create_notification(message=msg, receiver_email=m.email)
+                    notification_strategy.create_notification(message=msg, receiver_id=m.id)
             
             # Welcome message
             msg = (
                 f"Welcome to CareConnect, {user.name}. Our admins will verify your account shortly. "
                 "Once verified, you will be able to donate and request (if applicable)."
             )
-            notification_strategy.create_notification(msg, user.email)
+            notification_strategy.create_notification(msg, user.id)
             
-            session["user_email"] = user.email
+            session["user_id"] = user.id
             return {"authenticated": True}, 201
         
         except Exception as e:
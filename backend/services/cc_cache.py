@@ -0,0 +1,395 @@
+"""Community Club Marker Cache for CareConnect Backend.
+
+This module keeps the parsed data.gov.sg community club markers in
+memory and on disk, so a restarted or newly forked worker serves the map
+at once instead of blocking on the slow poll + download.
+
+Markers are loaded at startup from CC_CACHE_FILE, or from the bundled
+snapshot (backend/data/cc_markers.json) when that file is missing. Once
+they are older than CC_CACHE_TTL_SECONDS the stale list keeps being
+served while one background thread refreshes it. A request blocks on the
+download only when no markers are available at all.
+
+Across workers and hosts, the ``cache_entry`` row is a lease: only its
+holder downloads, and the others adopt the payload it stores there.
+
+Usage:
+    python -m backend.services.cc_cache snapshot                  # download into the bundled snapshot
+    python -m backend.services.cc_cache snapshot --geojson cc.geojson
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from ..config import Config
+from ..models import CacheEntry, db
+from .community_clubs import feat_to_marker, fetch_cc_markers_from_api
+from .geo_index import GeoIndex
+from .name_index import NameIndex
+
+SNAPSHOT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cc_markers.json")
+
+def read_markers_file(path: str) -> Optional[tuple]:
+    """Read a markers file written by ``write_markers_file``.
+
+    Args:
+        path (str): File path.
+
+    Returns:
+        tuple: (markers, fetched_at), or None if the file is missing or unreadable.
+    """
+    try:
+        with open(path) as f:
+            data = json.load(f)
+        return list(data["markers"]), float(data.get("fetched_at") or 0)
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+def write_markers_file(path: str, markers: List[dict], fetched_at: float):
+    """Write markers atomically (temp file + rename), so readers never see a partial file.
+
+    Args:
+        path (str): Destination path.
+        markers (list): Marker dicts.
+        fetched_at (float): Unix time the markers were downloaded.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"fetched_at": fetched_at, "markers": markers}, f, separators=(",", ":"))
+    os.replace(tmp, path)
+
+@dataclass(frozen=True)
+class Snapshot:
+    """One immutable generation of the markers and the indexes built on them.
+
+    Refreshes build a new Snapshot and swap it in with a single
+    assignment, so a reader holding one never sees a half-built list or
+    an index that does not match it.
+
+    Attributes:
+        markers (tuple): Marker dicts (shared; copy before modifying).
+        fetched_at (float): Unix time the markers were downloaded.
+        geo (GeoIndex): KD-tree over the markers' coordinates.
+        search (NameIndex): Token/prefix index over the markers' names.
+        by_name (dict): Exact marker name to position.
+        Index results are positions in ``markers``.
+    """
+    markers: Tuple[dict, ...] = ()
+    fetched_at: float = 0.0
+    geo: GeoIndex = field(init=False, repr=False, compare=False)
+    search: NameIndex = field(init=False, repr=False, compare=False)
+    by_name: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "geo", GeoIndex([(m["lat"], m["lng"]) for m in self.markers]))
+        object.__setattr__(self, "search", NameIndex([m["name"] for m in self.markers]))
+        object.__setattr__(self, "by_name", {m["name"]: i for i, m in enumerate(self.markers)})
+
+class _Flight:
+    """One in-progress refresh that other threads can wait for."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[Exception] = None
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+def _timestamp(value: Optional[datetime]) -> float:
+    if value is None:
+        return 0.0
+    if value.tzinfo is None:  # SQLite returns naive UTC datetimes
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+class MarkerCache:
+    """Community club markers with a disk copy and stale-while-revalidate.
+
+    Refreshes are single-flight: within a process only one thread
+    downloads at a time and the others keep the previous snapshot (or, on
+    a cold start, wait for that one download). Once bound to an app, the
+    ``cache_entry`` row extends this to the cluster: the worker holding
+    its lease downloads and stores the payload there, and the others
+    adopt it instead of downloading too.
+
+    Args:
+        fetch (callable): Downloads and returns the current markers.
+        path (str): Disk copy shared by the workers of one host.
+        ttl (float): Seconds before markers count as stale.
+        retry_after (float): Seconds to wait after a refresh before starting another.
+        lease_seconds (float): How long a worker may hold the cluster refresh lease.
+        fallback_path (str): Bundled snapshot used when the disk copy is missing.
+        name (str): Key of the ``cache_entry`` row.
+    """
+
+    poll_interval = 1.0  # seconds between checks while another worker refreshes
+
+    def __init__(self, fetch: Callable[[], List[dict]], path: str, ttl: float, retry_after: float,
+                 lease_seconds: float, fallback_path: str = SNAPSHOT_PATH, name: str = "cc_markers"):
+        self.fetch = fetch
+        self.path = path
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.lease_seconds = lease_seconds
+        self.fallback_path = fallback_path
+        self.name = name
+        self.app = None  # set by init_cc_cache; enables the cluster lease
+        self.snapshot: Optional[Snapshot] = None
+        self._lock = threading.Lock()
+        self._flight: Optional[_Flight] = None
+        self._last_attempt = 0.0
+
+    def load(self):
+        """Load markers from the disk copy, or else the bundled snapshot (no network)."""
+        loaded = read_markers_file(self.path) or read_markers_file(self.fallback_path)
+        self.snapshot = Snapshot(tuple(loaded[0]), loaded[1]) if loaded else Snapshot()
+
+    def set(self, markers: List[dict], fetched_at: Optional[float] = None, persist: bool = True):
+        """Swap in a new snapshot of the markers.
+
+        Args:
+            markers (list): New marker list.
+            fetched_at (float, optional): Download time (default: now).
+            persist (bool): Also write the disk copy.
+        """
+        snapshot = Snapshot(tuple(markers), time.time() if fetched_at is None else fetched_at)
+        self.snapshot = snapshot
+        if persist:
+            write_markers_file(self.path, list(snapshot.markers), snapshot.fetched_at)
+
+    def current(self) -> Snapshot:
+        """Return the current snapshot, loading it from disk on first use."""
+        if self.snapshot is None:
+            self.load()
+        return self.snapshot
+
+    def modified_at(self) -> Optional[datetime]:
+        """Return when the current markers were downloaded, or None if unknown."""
+        fetched_at = self.current().fetched_at
+        return datetime.fromtimestamp(fetched_at, timezone.utc) if fetched_at else None
+
+    def is_stale(self, snapshot: Optional[Snapshot] = None) -> bool:
+        snapshot = snapshot or self.current()
+        return time.time() - snapshot.fetched_at > self.ttl
+
+    def peek(self) -> Tuple[dict, ...]:
+        """Return the cached markers without ever blocking (may be empty).
+
+        Starts a background refresh when they are stale or missing.
+        """
+        return self.peek_snapshot().markers
+
+    def peek_snapshot(self) -> Snapshot:
+        """Like ``peek`` but return the whole snapshot, indexes included."""
+        snapshot = self.current()
+        if not snapshot.markers or self.is_stale(snapshot):
+            self.refresh_in_background()
+        return snapshot
+
+    def get(self) -> Tuple[dict, ...]:
+        """Return the markers, downloading them first only if none are available.
+
+        Returns:
+            tuple: Marker dicts (shared; copy before modifying).
+
+        Raises:
+            Exception: The download error when no markers are available at all.
+        """
+        return self.get_snapshot().markers
+
+    def get_snapshot(self) -> Snapshot:
+        """Like ``get`` but return the whole snapshot, indexes included."""
+        snapshot = self.current()
+        if snapshot.markers:
+            if self.is_stale(snapshot):
+                self.refresh_in_background()
+            return snapshot
+
+        flight, leader = self._join_flight()
+        if leader:
+            self._run(flight)
+        else:
+            flight.done.wait(self.lease_seconds)
+        if self.snapshot.markers:
+            return self.snapshot
+        raise flight.error or RuntimeError("Community club markers are not available yet")
+
+    def refresh_in_background(self):
+        """Refresh on a daemon thread unless a refresh is running or was just tried."""
+        with self._lock:
+            if self._flight is not None or time.time() - self._last_attempt < self.retry_after:
+                return
+        flight, leader = self._join_flight()
+        if leader:
+            threading.Thread(target=self._run, args=(flight,), name="cc-cache-refresh", daemon=True).start()
+
+    def _join_flight(self) -> Tuple[_Flight, bool]:
+        """Return the refresh in progress, or start one (leader=True)."""
+        with self._lock:
+            if self._flight is not None:
+                return self._flight, False
+            self._flight = _Flight()
+            self._last_attempt = time.time()
+            return self._flight, True
+
+    def _run(self, flight: _Flight):
+        try:
+            self._refresh()
+        except Exception as e:
+            flight.error = e
+            print("Community club refresh failed, serving cached markers:", e)
+        finally:
+            with self._lock:
+                self._flight = None
+            flight.done.set()
+
+    def _refresh(self):
+        # Another worker on this host may have refreshed the disk copy already
+        on_disk = read_markers_file(self.path)
+        if on_disk and on_disk[0] and time.time() - on_disk[1] <= self.ttl:
+            self.set(*on_disk, persist=False)
+            return
+        if self.app is None:
+            self.set(self.fetch())
+            return
+        with self.app.app_context():
+            engine = db.engine
+        try:
+            self._refresh_shared(engine)
+        except SQLAlchemyError as e:
+            print("Community club cache row unavailable, refreshing locally:", e)
+            self.set(self.fetch())
+
+    def _refresh_shared(self, engine):
+        """Adopt the shared copy, or download it under the cluster lease."""
+        if self._adopt(engine):
+            return
+        owner = f"{socket.gethostname()}:{os.getpid()}"
+        if self._acquire_lease(engine, owner):
+            try:
+                markers = self.fetch()
+            except Exception:
+                self._release_lease(engine, owner)
+                raise
+            fetched_at = _utcnow()
+            table = CacheEntry.__table__
+            with engine.begin() as conn:
+                conn.execute(table.update()
+                    .where(table.c.name == self.name)
+                    .values(payload=json.dumps(markers), fetched_at=fetched_at, lease_owner=None, lease_until=None))
+            self.set(markers, fetched_at.timestamp())
+            return
+
+        # Another worker is downloading: keep serving ours until its copy lands
+        deadline = time.time() + self.lease_seconds
+        while time.time() < deadline:
+            time.sleep(self.poll_interval)
+            if self._adopt(engine):
+                return
+        raise RuntimeError("Community club refresh by another worker did not finish")
+
+    def _adopt(self, engine) -> bool:
+        """Take the shared payload if it is fresh and newer than ours."""
+        table = CacheEntry.__table__
+        with engine.connect() as conn:
+            row = conn.execute(
+                select(table.c.payload, table.c.fetched_at).where(table.c.name == self.name)
+            ).first()
+        if row is None or not row.payload:
+            return False
+        fetched_at = _timestamp(row.fetched_at)
+        if time.time() - fetched_at > self.ttl or fetched_at <= self.current().fetched_at:
+            return False
+        self.set(json.loads(row.payload), fetched_at)
+        return True
+
+    def _acquire_lease(self, engine, owner: str) -> bool:
+        """Take the refresh lease if it is free or expired.
+
+        The conditional UPDATE is atomic, so exactly one worker wins even
+        when several find the lease expired at the same moment.
+        """
+        table = CacheEntry.__table__
+        now = _utcnow()
+        until = now + timedelta(seconds=self.lease_seconds)
+        with engine.begin() as conn:
+            taken = conn.execute(table.update()
+                .where(table.c.name == self.name)
+                .where(or_(table.c.lease_until.is_(None), table.c.lease_until < now))
+                .values(lease_owner=owner, lease_until=until)).rowcount
+        if taken:
+            return True
+        try:
+            with engine.begin() as conn:
+                conn.execute(table.insert().values(name=self.name, lease_owner=owner, lease_until=until))
+            return True
+        except IntegrityError:
+            return False  # the row exists and its lease is held
+
+    def _release_lease(self, engine, owner: str):
+        table = CacheEntry.__table__
+        with engine.begin() as conn:
+            conn.execute(table.update()
+                .where(table.c.name == self.name, table.c.lease_owner == owner)
+                .values(lease_owner=None, lease_until=None))
+
+cc_cache = MarkerCache(
+    fetch=lambda: fetch_cc_markers_from_api(Config.CC_DATASET_ID),
+    path=Config.CC_CACHE_FILE,
+    ttl=Config.CC_CACHE_TTL_SECONDS,
+    retry_after=Config.CC_CACHE_RETRY_SECONDS,
+    lease_seconds=Config.CC_CACHE_LEASE_SECONDS,
+)
+
+def init_cc_cache(app):
+    """Load the community club markers from disk at startup.
+
+    Also binds the cache to ``app`` so refreshes coordinate through the
+    ``cache_entry`` lease row.
+
+    Args:
+        app (Flask): Flask application instance.
+    """
+    cc_cache.app = app
+    cc_cache.load()
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.services.cc_cache``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.services.cc_cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    snap = sub.add_parser("snapshot", help="regenerate the bundled fallback snapshot")
+    snap.add_argument("--geojson", metavar="PATH", help="convert a downloaded GeoJSON file instead of fetching")
+    snap.add_argument("--output", default=SNAPSHOT_PATH, help="snapshot path")
+    args = parser.parse_args(argv)
+
+    if args.geojson:
+        with open(args.geojson) as f:
+            features = (json.load(f) or {}).get("features") or []
+        markers = [m for m in map(feat_to_marker, features) if m]
+    else:
+        markers = fetch_cc_markers_from_api(Config.CC_DATASET_ID)
+    write_markers_file(args.output, markers, time.time())
+    print(f"Wrote {len(markers)} markers to {args.output}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Community Club Registry Service for CareConnect Backend.
+
+This module keeps the ``community_club`` table in step with the dataset
+and resolves the CC names chosen by users to row ids. Names not (yet) in
+the dataset still get a row, without coordinates, so a write never fails
+because the marker download is behind.
+
+``cc_id`` is the reference; ``Request.location``, ``Donation.location``
+and ``Manager.cc`` are display copies of ``CommunityClub.name`` written in
+the same statement as ``cc_id`` and never used to filter or join. They
+cannot drift: the sync matches clubs by name, so a row's name never
+changes (a renamed club becomes a new row).
+
+Managers are provisioned outside the app. Give a new manager both
+columns, e.g.
+    INSERT INTO manager (user_id, cc_id, cc)
+    SELECT <user id>, id, name FROM community_club WHERE name = '<CC name>';
+"""
+
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+
+from ..extensions import db
+from ..models import CommunityClub
+from .cc_cache import cc_cache
+
+# Name -> id for committed rows seen by this process. Cleared when the
+# table is synced and when an engine is disposed (e.g. a test database
+# being recreated), so ids of a previous database are never reused.
+_ids: Dict[str, int] = {}
+_ids_lock = threading.Lock()
+
+def clear_cc_ids():
+    """Forget every remembered name -> id mapping."""
+    with _ids_lock:
+        _ids.clear()
+
+@event.listens_for(Engine, "engine_disposed")
+def _on_engine_disposed(engine):
+    clear_cc_ids()
+
+def cc_id_for(name: str) -> int:
+    """Return the id of the community club called ``name``, adding it if new.
+
+    Args:
+        name (str): Community club name as chosen by the user.
+
+    Returns:
+        int: ``CommunityClub.id``.
+    """
+    cc_id = _ids.get(name)
+    if cc_id is not None:
+        return cc_id
+    cc_id = db.session.scalar(select(CommunityClub.id).where(CommunityClub.name == name))
+    if cc_id is not None:
+        with _ids_lock:
+            _ids[name] = cc_id
+        return cc_id
+    # Not remembered until committed: the caller's transaction may roll back
+    try:
+        with db.session.begin_nested():
+            club = CommunityClub(name=name)
+            db.session.add(club)
+        return club.id
+    except IntegrityError:
+        # Another worker added it first
+        return db.session.scalar(select(CommunityClub.id).where(CommunityClub.name == name))
+
+def sync_community_clubs(markers: Optional[List[dict]] = None) -> Dict[str, object]:
+    """Upsert every community club in the dataset into ``community_club``.
+
+    Args:
+        markers (list, optional): Markers to sync (default: the cached dataset).
+
+    Returns:
+        dict: Job execution results with counts of added and updated rows.
+    """
+    if markers is None:
+        markers = cc_cache.get()
+    clear_cc_ids()
+    existing = {c.name: c for c in CommunityClub.query.all()}
+    added = updated = 0
+    for m in markers:
+        club = existing.get(m["name"])
+        if club is None:
+            club = CommunityClub(name=m["name"])
+            db.session.add(club)
+            existing[m["name"]] = club
+            added += 1
+        elif (club.lat, club.lng, club.address) != (m["lat"], m["lng"], m.get("address")):
+            updated += 1
+        else:
+            continue
+        club.lat, club.lng, club.address = m["lat"], m["lng"], m.get("address")
+    if added or updated:
+        db.session.commit()
+    return {
+        "job": "sync_community_clubs", "status": "ok", "at": datetime.now(timezone.utc).isoformat(),
+        "added": added, "updated": updated,
+    }
@@ -2,10 +2,23 @@
 
 This module handles fetching and parsing community club data
 from Singapore's open data API.
+
+The GeoJSON download is parsed incrementally: features are decoded one
+at a time from the response stream and converted to markers as they
+arrive, so memory stays bounded by the size of one feature rather than
+the whole document.
 """
 
-import requests
-import os, html, re, time, uuid
+import codecs, html, json, re
+from typing import Iterable, Iterator
+
+# Description table rows and HTML tags (compiled once, used per feature)
+_ROW_RE = re.compile(r"<th>(.*?)</th>\s*<td>(.*?)</td>", flags=re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s*")
+
+_STREAM_CHUNK_BYTES = 64 * 1024
+_decoder = json.JSONDecoder()
 
 def parse_desc_table(desc_html: str) -> dict:
     """Parse HTML description table from API data.
@@ -22,14 +35,10 @@ def parse_desc_table(desc_html: str) -> dict:
     text = html.unescape(desc_html)
     
     # Extract table rows with th/td pairs
-    pairs = re.findall(r"<th>(.*?)</th>\s*<td>(.*?)</td>", text, flags=re.I | re.S)
     data = {}
-    tag_re = re.compile(r"<[^>]+>")  # Regex to remove HTML tags
-    
-    # Process each key-value pair
-    for k, v in pairs:
-        key = str(k).strip().upper()  # Normalize key to uppercase
-        val = tag_re.sub("", v).strip()  # Remove HTML tags from value
+    for k, v in _ROW_RE.findall(text):
+        key = k.strip().upper()  # Normalize key to uppercase
+        val = _TAG_RE.sub("", v).strip()  # Remove HTML tags from value
         data[key] = val
     return data
 
@@ -71,18 +80,119 @@ def feat_to_marker(feat):
     
     return {"name": name, "lat": lat, "lng": lng, "address": address, "link": link}
 
-def fetch_cc_markers_from_api(DATASET_ID: str):
-    """Fetch community club markers from Singapore open data API.
+class _JsonStream:
+    """Decode JSON values one at a time from an iterable of text chunks."""
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self.buf = ""
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            return False
+        self.buf = self.buf[self.pos:] + chunk  # drop what was consumed
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at end of input)."""
+        while True:
+            self.pos = _WS_RE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise ValueError(f"Expected {char!r} at offset {self.pos} of GeoJSON stream")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buf, self.pos)
+                # A number at the buffer's end may continue in the next chunk
+                if end < len(self.buf) or not self._fill():
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+
+def iter_geojson_features(chunks: Iterable[str]) -> Iterator[dict]:
+    """Yield the features of a GeoJSON FeatureCollection incrementally.
+
+    Top-level members before ``features`` (type, name, crs) are small and
+    skipped; each feature is decoded on its own, so only one feature and
+    one chunk are held in memory at a time.
+
+    Args:
+        chunks (iterable): Text chunks of the document, in order.
+
+    Yields:
+        dict: One GeoJSON feature object.
+
+    Raises:
+        ValueError: If the document is not a JSON object.
+    """
+    stream = _JsonStream(chunks)
+    stream.expect("{")
+    while stream.peek() not in ("}", ""):
+        key = stream.value()
+        stream.expect(":")
+        if key == "features" and stream.peek() == "[":
+            stream.expect("[")
+            while stream.peek() not in ("]", ""):
+                yield stream.value()
+                if stream.peek() == ",":
+                    stream.expect(",")
+            return
+        stream.value()  # skip another member
+        if stream.peek() == ",":
+            stream.expect(",")
+
+def iter_markers(chunks: Iterable[str]) -> Iterator[dict]:
+    """Convert a streamed GeoJSON document to markers as features arrive.
+
+    Args:
+        chunks (iterable): Text chunks of the document.
+
+    Yields:
+        dict: Marker data for each Point feature.
+    """
+    for feat in iter_geojson_features(chunks):
+        m = feat_to_marker(feat)
+        if m: yield m  # Only yield valid markers
+
+def _iter_text(response, chunk_size: int = _STREAM_CHUNK_BYTES) -> Iterator[str]:
+    """Decode a streamed HTTP response body to text chunks.
+
+    JSON is UTF-8 (RFC 8259) whatever charset the storage host reports.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        yield decoder.decode(chunk)
+    yield decoder.decode(b"", final=True)
+
+def stream_cc_markers_from_api(DATASET_ID: str) -> Iterator[dict]:
+    """Stream community club markers from Singapore open data API.
     
     Args:
         DATASET_ID (str): Dataset ID for the API request.
         
-    Returns:
-        list: List of community club marker objects.
+    Yields:
+        dict: Community club marker objects, as the download progresses.
         
     Raises:
         RuntimeError: If API request fails.
     """
+    import requests  # imported on first fetch; only the web process needs it
+
     # Step 1: Poll the API to get download URL
     POLL_URL = f"https://api-open.data.gov.sg/v1/public/api/datasets/{DATASET_ID}/poll-download"
     j = requests.get(POLL_URL, timeout=20).json()
@@ -91,14 +201,21 @@ def fetch_cc_markers_from_api(DATASET_ID: str):
     if j.get("code") != 0 or "data" not in j or "url" not in j["data"]:
         raise RuntimeError(f"Poll Download failed: {j}")
     
-    # Step 2: Download the actual GeoJSON data
-    gj = requests.get(j["data"]["url"], timeout=60).json()
-    features = (gj or {}).get("features") or []
-    
-    # Step 3: Convert GeoJSON features to marker objects
-    markers = []
-    for f in features:
-        m = feat_to_marker(f)
-        if m: markers.append(m)  # Only add valid markers
+    # Step 2: Stream the GeoJSON and convert features as they arrive
+    with requests.get(j["data"]["url"], timeout=60, stream=True) as resp:
+        resp.raise_for_status()
+        yield from iter_markers(_iter_text(resp))
+
+def fetch_cc_markers_from_api(DATASET_ID: str):
+    """Fetch community club markers from Singapore open data API.
     
-    return markers
\ No newline at end of file
+    Args:
+        DATASET_ID (str): Dataset ID for the API request.
+        
+    Returns:
+        list: List of community club marker objects.
+        
+    Raises:
+        RuntimeError: If API request fails.
+    """
+    return list(stream_cc_markers_from_api(DATASET_ID))
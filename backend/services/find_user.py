@@ -4,20 +4,30 @@ This module provides utility functions for finding and retrieving
 user, client, and manager records from the database.
 """
 
-from ..models import User, Client, Manager
+from ..models import User, Client, Manager, CommunityClub
 from flask import session
 from ..extensions import db
+from .user_context import current_user
 
 def get_current_user():
     """Get the currently authenticated user from session.
     
+    Cached per request and briefly across requests (see user_context).
+    
     Returns:
         User: Current user instance or None if not authenticated.
     """
+    if session.get("user_id") is not None:
+        return current_user()
+    # Sessions created before user ids existed only carry the email
     email = session.get("user_email")
     if not email:
         return None
-    return db.session.get(User, email)
+    user = find_user_by_email(email)
+    if user:
+        session.pop("user_email", None)
+        session["user_id"] = user.id
+    return user
 
 def find_user_by_email(email):
     """Find user by email address.
@@ -28,7 +38,7 @@ def find_user_by_email(email):
     Returns:
         User: User instance or None if not found.
     """
-    return User.query.get(email)
+    return User.query.filter_by(email=email).first()
 
 def find_client_by_email(email):
     """Find client by email address.
@@ -39,7 +49,7 @@ def find_client_by_email(email):
     Returns:
         Client: Client instance or None if not found.
     """
-    return Client.query.get(email)
+    return Client.query.join(User).filter(User.email == email).first()
 
 def find_manager_by_email(email):
     """Find manager by email address.
@@ -50,7 +60,7 @@ def find_manager_by_email(email):
     Returns:
         Manager: Manager instance or None if not found.
     """
-    return Manager.query.get(email)
+    return Manager.query.join(User).filter(User.email == email).first()
 
 def find_managers_by_cc(cc: str):
     """Find manager by community club name.
@@ -61,4 +71,7 @@ def find_managers_by_cc(cc: str):
     Returns:
         Manager: First manager for the CC or None if not found.
     """
-    return Manager.query.filter_by(cc=cc).first()
\ No newline at end of file
+    return (Manager.query
+        .join(CommunityClub, CommunityClub.id == Manager.cc_id)
+        .filter(CommunityClub.name == cc)
+        .first())
\ No newline at end of file
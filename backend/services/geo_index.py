@@ -0,0 +1,148 @@
+"""Spatial Index Service for CareConnect Backend.
+
+This module answers nearest-neighbour and radius queries over community
+club coordinates with a KD-tree. Points are projected onto the unit
+sphere (x, y, z), where straight-line (chord) distance grows with
+great-circle distance, so the tree prunes correctly anywhere on the globe
+and results are reported as haversine kilometres.
+"""
+
+import heapq
+import math
+from typing import List, Optional, Sequence, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+
+def to_xyz(lat: float, lng: float) -> Tuple[float, float, float]:
+    """Project a latitude/longitude in degrees onto the unit sphere."""
+    phi, lam = math.radians(lat), math.radians(lng)
+    cos_phi = math.cos(phi)
+    return (cos_phi * math.cos(lam), cos_phi * math.sin(lam), math.sin(phi))
+
+def chord_to_km(chord: float) -> float:
+    """Great-circle distance (km) for a chord length on the unit sphere."""
+    return 2 * EARTH_RADIUS_KM * math.asin(min(chord / 2, 1.0))
+
+def km_to_chord(km: float) -> float:
+    """Chord length on the unit sphere for a great-circle distance (km)."""
+    return 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp, dl = p2 - p1, math.radians(lng2 - lng1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(math.sqrt(a), 1.0))
+
+class GeoIndex:
+    """Immutable KD-tree over (lat, lng) points.
+
+    Nodes are stored in flat lists (implicit tree over a median-sorted
+    order), so building and querying a few thousand points allocates
+    almost nothing per query.
+
+    Args:
+        points (sequence): (lat, lng) pairs; query results refer to their positions.
+    """
+
+    def __init__(self, points: Sequence[Tuple[float, float]]):
+        xyz = [to_xyz(lat, lng) for lat, lng in points]
+        order = list(range(len(xyz)))
+        self._ids: List[int] = [0] * len(order)
+        self._pts: List[Tuple[float, float, float]] = [(0.0, 0.0, 0.0)] * len(order)
+        self._axes: List[int] = [0] * len(order)
+        self._build(xyz, order, 0, len(order))
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _build(self, xyz, order, lo, hi):
+        # Node for order[lo:hi] sits at the median; children are the two halves
+        if hi - lo <= 0:
+            return
+        spans = [
+            max(xyz[i][a] for i in order[lo:hi]) - min(xyz[i][a] for i in order[lo:hi])
+            for a in range(3)
+        ]
+        axis = spans.index(max(spans))  # split on the widest dimension
+        order[lo:hi] = sorted(order[lo:hi], key=lambda i: xyz[i][axis])
+        mid = (lo + hi) // 2
+        self._ids[mid], self._pts[mid], self._axes[mid] = order[mid], xyz[order[mid]], axis
+        self._build(xyz, order, lo, mid)
+        self._build(xyz, order, mid + 1, hi)
+
+    def nearest(self, lat: float, lng: float, k: int = 1,
+                max_km: Optional[float] = None) -> List[Tuple[int, float]]:
+        """Return the ``k`` points closest to (lat, lng).
+
+        Args:
+            lat (float): Query latitude in degrees.
+            lng (float): Query longitude in degrees.
+            k (int): Number of neighbours.
+            max_km (float, optional): Ignore points further than this.
+
+        Returns:
+            list: (point position, distance in km) pairs, nearest first.
+        """
+        if k <= 0 or not self._ids:
+            return []
+        q = to_xyz(lat, lng)
+        bound = km_to_chord(max_km) ** 2 if max_km is not None else math.inf
+        heap: List[Tuple[float, int]] = []  # max-heap of (-squared chord, position)
+
+        def visit(lo, hi):
+            if hi - lo <= 0:
+                return
+            mid = (lo + hi) // 2
+            p, axis = self._pts[mid], self._axes[mid]
+            d2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+            worst = -heap[0][0] if len(heap) == k else bound
+            if d2 <= worst:
+                heapq.heappush(heap, (-d2, self._ids[mid]))
+                if len(heap) > k:
+                    heapq.heappop(heap)
+            diff = q[axis] - p[axis]
+            near, far = ((lo, mid), (mid + 1, hi)) if diff < 0 else ((mid + 1, hi), (lo, mid))
+            visit(*near)
+            worst = -heap[0][0] if len(heap) == k else bound
+            if diff * diff <= worst:  # the splitting plane is closer than the worst kept point
+                visit(*far)
+
+        visit(0, len(self._ids))
+        return [(i, chord_to_km(math.sqrt(-neg))) for neg, i in sorted(heap, reverse=True)]
+
+    def within(self, lat: float, lng: float, radius_km: float,
+               limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Return the points within ``radius_km`` of (lat, lng).
+
+        Args:
+            lat (float): Query latitude in degrees.
+            lng (float): Query longitude in degrees.
+            radius_km (float): Search radius in kilometres.
+            limit (int, optional): Keep only the nearest ``limit`` points.
+
+        Returns:
+            list: (point position, distance in km) pairs, nearest first.
+        """
+        if limit is not None:
+            return self.nearest(lat, lng, limit, max_km=radius_km)
+        q = to_xyz(lat, lng)
+        bound = km_to_chord(radius_km) ** 2
+        found = []
+        stack = [(0, len(self._ids))]
+        while stack:
+            lo, hi = stack.pop()
+            if hi - lo <= 0:
+                continue
+            mid = (lo + hi) // 2
+            p, axis = self._pts[mid], self._axes[mid]
+            d2 = (p[0] - q[0]) ** 2 + (p[1] - q[1]) ** 2 + (p[2] - q[2]) ** 2
+            if d2 <= bound:
+                found.append((d2, self._ids[mid]))
+            diff = q[axis] - p[axis]
+            if diff < 0 or diff * diff <= bound:
+                stack.append((lo, mid))
+            if diff >= 0 or diff * diff <= bound:
+                stack.append((mid + 1, hi))
+        found.sort()
+        return [(i, chord_to_km(math.sqrt(d2))) for d2, i in found]
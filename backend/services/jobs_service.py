@@ -8,7 +8,7 @@ from datetime import datetime, timedelta, timezone
 from sqlalchemy import or_
 from typing import Dict, List
 
-from ..models import db, Request, Donation, Item, Reservation
+from ..models import db, CommunityClub, Request, Donation, Item, Reservation
 from .run_allocation import run_allocation
 from ..services.metrics import check_and_broadcast_for_cc
 from ..services.notification_strategies import DatabaseNotificationStrategy
@@ -72,12 +72,10 @@ def run_cleanup_expired_items_once() -> Dict[str, object]:
     run_allocation()
 
     # Check fulfillment rates for affected CCs and broadcast if low
-    affected_ccs = set()
-    from ..models import Request
-    for rid in affected_request_ids:
-        req = Request.query.get(rid)
-        if req and req.location:
-            affected_ccs.add(req.location)
+    affected_ccs = {name for (name,) in (db.session.query(CommunityClub.name)
+        .join(Request, Request.cc_id == CommunityClub.id)
+        .filter(Request.id.in_(affected_request_ids))
+        .distinct())}
     
     # Broadcast low fulfillment alerts for affected community clubs
     for cc in affected_ccs:
@@ -139,7 +137,7 @@ def run_expire_matched_requests_once(days_until_expire: int = 2) -> Dict[str, st
                 "Please make another request if needed."
             )
             notification_strategy = DatabaseNotificationStrategy()
-            notification_strategy.create_notification(message=msg, receiver_email=req.requester_email)
+            notification_strategy.create_notification(message=msg, receiver_id=req.requester_id)
 
         db.session.commit()
 
@@ -186,7 +184,7 @@ def run_cleanup_approved_donations_once(days_until_delete: int = 2) -> Dict[str,
             "has been automatically removed after 2 days of approval."
         )
         notification_strategy = DatabaseNotificationStrategy()
-        notification_strategy.create_notification(message=message, receiver_email=donation.donor_email)
+        notification_strategy.create_notification(message=message, receiver_id=donation.donor_id)
 
         # Delete donation (cascade removes items, reservations)
         db.session.delete(donation)
@@ -7,7 +7,7 @@ and triggers broadcasts when fulfillment rates are low.
 from sqlalchemy import and_, func
 from ..models import Request
 from ..broadcast_observer import subject
-from ..models import Request, db  
+from ..models import CommunityClub, Request, db
 
 def check_and_broadcast_for_cc(cc: str) -> float:
     """Check fulfillment rate for a community club and broadcast if low.
@@ -24,7 +24,8 @@ def check_and_broadcast_for_cc(cc: str) -> float:
             func.sum(Request.request_quantity),
             func.sum(Request.allocation)
         )
-        .filter(Request.location==cc)
+        .join(CommunityClub, CommunityClub.id == Request.cc_id)
+        .filter(CommunityClub.name == cc)
         .first()
     )
 
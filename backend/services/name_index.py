@@ -0,0 +1,106 @@
+"""Name Search Index Service for CareConnect Backend.
+
+This module indexes community club names for the map's search box. Names
+are normalised (case, accents and punctuation folded) and split into
+tokens. An inverted index maps whole tokens to clubs, a prefix trie maps
+every token prefix to the clubs having such a token, and a second trie
+over every token suffix does the same for any substring of a token, so a
+query is answered by intersecting one posting set per query token.
+"""
+
+import re
+import unicodedata
+from typing import Dict, List, Optional, Sequence, Set
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+
+def normalize(text: str) -> str:
+    """Lower-case ``text``, strip accents and turn punctuation into spaces."""
+    folded = unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode().lower()
+    return _NON_ALNUM_RE.sub(" ", folded).strip()
+
+def tokenize(text: str) -> List[str]:
+    return normalize(text).split()
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.ids: Set[int] = set()  # every name with a token under this prefix
+
+class NameIndex:
+    """Immutable token + prefix index over a list of names.
+
+    Args:
+        names (sequence): Names to index; results refer to their positions.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        self._names = [normalize(n) for n in names]
+        self._tokens: Dict[str, Set[int]] = {}
+        self._root = _TrieNode()    # token prefixes
+        self._suffixes = _TrieNode()  # prefixes of token suffixes = token substrings
+        for i, name in enumerate(self._names):
+            for token in name.split():
+                self._tokens.setdefault(token, set()).add(i)
+                self._insert(self._root, token, i)
+                for start in range(1, len(token)):
+                    self._insert(self._suffixes, token[start:], i)
+
+    @staticmethod
+    def _insert(root: _TrieNode, text: str, i: int):
+        node = root
+        for ch in text:
+            node = node.children.setdefault(ch, _TrieNode())
+            node.ids.add(i)
+
+    def _prefixed(self, prefix: str, root: Optional[_TrieNode] = None) -> Set[int]:
+        node = root or self._root
+        for ch in prefix:
+            node = node.children.get(ch)
+            if node is None:
+                return set()
+        return node.ids
+
+    def _containing(self, part: str) -> Set[int]:
+        return self._prefixed(part) | self._prefixed(part, self._suffixes)
+
+    @staticmethod
+    def _intersect(postings: List[Set[int]]) -> Set[int]:
+        postings = sorted(postings, key=len)
+        hits = set(postings[0])
+        for ids in postings[1:]:
+            hits &= ids
+            if not hits:
+                break
+        return hits
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """Find names containing each query token inside one of their tokens.
+
+        Names where every query token starts a token come first, ranked by
+        more whole-token matches, then names starting with the first query
+        token, then shorter names, then alphabetical. Names matching only
+        inside tokens ("pines" in "Tampines") follow, ranked the same way.
+
+        Args:
+            query (str): Free-text query, e.g. "tamp east".
+            limit (int, optional): Maximum number of results.
+
+        Returns:
+            list: Positions of the matching names, best match first.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        prefix_hits = self._intersect([self._prefixed(t) for t in terms])
+        infix_hits = self._intersect([self._containing(t) for t in terms]) - prefix_hits
+
+        def rank(i):
+            name = self._names[i]
+            exact = sum(1 for t in terms if i in self._tokens.get(t, ()))
+            return (-exact, not name.startswith(terms[0]), len(name), name)
+
+        ranked = sorted(prefix_hits, key=rank) + sorted(infix_hits, key=rank)
+        return ranked[:limit] if limit else ranked
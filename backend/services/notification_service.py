@@ -10,7 +10,7 @@ from .notification_strategies import DatabaseNotificationStrategy
 # Create default strategy instance
 db_strategy = DatabaseNotificationStrategy()
 
-def create_notification(message: str, receiver_email: str):
+def create_notification(message: str, receiver_id: int):
     """Create a notification for a user.
     
     Legacy function for backward compatibility.
@@ -18,10 +18,10 @@ def create_notification(message: str, receiver_email: str):
     
     Args:
         message (str): The notification message content.
-        receiver_email (str): Email address of the notification recipient.
+        receiver_id (int): User id of the notification recipient.
         
     Returns:
         The result of the notification creation operation.
     """
-    return db_strategy.create_notification(message, receiver_email)
+    return db_strategy.create_notification(message, receiver_id)
 
@@ -6,7 +6,7 @@ email, and SMS notifications.
 """
 
 from abc import ABC, abstractmethod
-from ..models import Notification, db
+from ..models import Notification, User, db
 
 class NotificationStrategy(ABC):
     """Abstract interface for notification strategies.
@@ -15,12 +15,12 @@ class NotificationStrategy(ABC):
     """
     
     @abstractmethod
-    def create_notification(self, message: str, receiver_email: str) -> Notification:
+    def create_notification(self, message: str, receiver_id: int) -> Notification:
         """Create and send notification using specific strategy.
         
         Args:
             message (str): Notification message content.
-            receiver_email (str): Email of notification recipient.
+            receiver_id (int): User id of notification recipient.
             
         Returns:
             Notification: Created notification instance.
@@ -36,13 +36,13 @@ class DatabaseNotificationStrategy(NotificationStrategy):
     Stores notifications in the database for retrieval through the web interface.
     """
     
-    def create_notification(self, message: str, receiver_email: str) -> Notification:
-        if not message or not receiver_email:
-            raise ValueError("message and receiver_email are required")
+    def create_notification(self, message: str, receiver_id: int) -> Notification:
+        if not message or not receiver_id:
+            raise ValueError("message and receiver_id are required")
 
         notif = Notification(
             message=message,
-            receiver_email=receiver_email,
+            receiver_id=receiver_id,
         )
         db.session.add(notif)
         db.session.commit()
@@ -54,17 +54,18 @@ class EmailNotificationStrategy(NotificationStrategy):
     Sends notifications via email while also storing them in the database.
     """
     
-    def create_notification(self, message: str, receiver_email: str) -> Notification:
-        if not message or not receiver_email:
-            raise ValueError("message and receiver_email are required")
+    def create_notification(self, message: str, receiver_id: int) -> Notification:
+        if not message or not receiver_id:
+            raise ValueError("message and receiver_id are required")
         
         # Email sending logic would go here
-        print(f"Sending email to {receiver_email}: {message}")
+        receiver = db.session.get(User, receiver_id)
+        print(f"Sending email to {receiver.email if receiver else receiver_id}: {message}")
         
         # Still store in database for record keeping
         notif = Notification(
             message=message,
-            receiver_email=receiver_email,
+            receiver_id=receiver_id,
         )
         db.session.add(notif)
         db.session.commit()
@@ -76,17 +77,18 @@ class SMSNotificationStrategy(NotificationStrategy):
     Sends notifications via SMS while also storing them in the database.
     """
     
-    def create_notification(self, message: str, receiver_email: str) -> Notification:
-        if not message or not receiver_email:
-            raise ValueError("message and receiver_email are required")
+    def create_notification(self, message: str, receiver_id: int) -> Notification:
+        if not message or not receiver_id:
+            raise ValueError("message and receiver_id are required")
         
         # SMS sending logic would go here
-        print(f"Sending SMS to {receiver_email}: {message}")
+        receiver = db.session.get(User, receiver_id)
+        print(f"Sending SMS to {receiver.contact_number if receiver else receiver_id}: {message}")
         
         # Still store in database for record keeping
         notif = Notification(
             message=message,
-            receiver_email=receiver_email,
+            receiver_id=receiver_id,
         )
         db.session.add(notif)
         db.session.commit()
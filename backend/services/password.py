@@ -2,30 +2,212 @@
 
 This module provides secure password hashing and verification
 using the Argon2 algorithm for user authentication.
+
+Hashes run on a bounded thread pool (argon2-cffi releases the GIL while
+hashing, so the threads use separate cores). At most
+PASSWORD_HASH_WORKERS hashes run at once, since each one allocates
+PASSWORD_MEMORY_COST KiB, and at most PASSWORD_HASH_QUEUE more wait.
+Further calls fail fast with PasswordServiceBusy, which callers turn
+into a 503, instead of tying up request threads.
+
+Costs come from Config; pick them for a target latency with:
+    python -m backend.services.password calibrate --target-ms 250
+
+Stored hashes made with other costs (including passlib's defaults) still
+verify. ``needs_rehash`` tells the login path to store a new hash.
+argon2 is imported on first use to keep process start-up fast.
 """
 
-from passlib.hash import argon2
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from ..config import Config
+
+class PasswordServiceBusy(RuntimeError):
+    """Raised when the hashing pool and its queue are full."""
+
+_lock = threading.Lock()
+_hasher = None
+_pool: Optional[ThreadPoolExecutor] = None
+_slots: Optional[threading.BoundedSemaphore] = None
+
+def _make_hasher(time_cost: int, memory_cost: int, parallelism: int):
+    from argon2 import PasswordHasher
+    return PasswordHasher(time_cost=time_cost, memory_cost=memory_cost, parallelism=parallelism)
+
+def _get_hasher():
+    global _hasher
+    if _hasher is None:
+        with _lock:
+            if _hasher is None:
+                _hasher = _make_hasher(
+                    Config.PASSWORD_TIME_COST, Config.PASSWORD_MEMORY_COST, Config.PASSWORD_PARALLELISM
+                )
+    return _hasher
+
+def _get_pool() -> Tuple[ThreadPoolExecutor, threading.BoundedSemaphore]:
+    global _pool, _slots
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                workers = max(1, Config.PASSWORD_HASH_WORKERS)
+                _slots = threading.BoundedSemaphore(workers + max(0, Config.PASSWORD_HASH_QUEUE))
+                _pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="argon2")
+    return _pool, _slots
+
+def _run(fn: Callable, *args):
+    """Run ``fn(*args)`` on the hashing pool and wait for the result.
+
+    Raises:
+        PasswordServiceBusy: If every worker and queue slot is taken.
+    """
+    pool, slots = _get_pool()
+    if not slots.acquire(blocking=False):
+        raise PasswordServiceBusy("Too many password operations in progress, please retry")
+    try:
+        future = pool.submit(fn, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return future.result()
 
 def hash_password(pw: str) -> str:
     """Hash a password using Argon2.
-    
+
     Args:
         pw (str): Plain text password to hash.
-        
+
     Returns:
         str: Hashed password string.
+
+    Raises:
+        PasswordServiceBusy: If the hashing pool is saturated.
     """
-    return argon2.hash(pw)
+    return _run(_get_hasher().hash, pw)
+
+def _verify(pw: str, hashed: str) -> bool:
+    from argon2.exceptions import InvalidHashError, VerificationError
+    try:
+        return _get_hasher().verify(hashed, pw)
+    except (VerificationError, InvalidHashError):
+        return False
 
 def verify_password(pw: str, hashed: str) -> bool:
     """Verify a password against its hash.
-    
+
     Args:
         pw (str): Plain text password to verify.
         hashed (str): Hashed password to compare against.
-        
+
     Returns:
         bool: True if password matches, False otherwise.
+
+    Raises:
+        PasswordServiceBusy: If the hashing pool is saturated.
+    """
+    return _run(_verify, pw, hashed)
+
+def needs_rehash(hashed: str) -> bool:
+    """Whether ``hashed`` was made with costs other than the configured ones.
+
+    Args:
+        hashed (str): Stored password hash (already verified).
+
+    Returns:
+        bool: True if the password should be hashed again and stored.
+    """
+    from argon2.exceptions import InvalidHashError
+    try:
+        return _get_hasher().check_needs_rehash(hashed)
+    except InvalidHashError:
+        return True
+
+def _measure(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    """Median milliseconds to hash a password with the given costs."""
+    hasher = _make_hasher(time_cost, memory_cost, parallelism)
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+def calibrate(target_ms: float, memory_cost: int, parallelism: int,
+              samples: int = 3) -> Tuple[int, int, float]:
+    """Pick Argon2 costs that hash in about ``target_ms`` on this machine.
+
+    Memory is halved (down to 8 MiB) while a single pass is already too
+    slow; then the time cost is raised as far as the target allows.
+
+    Args:
+        target_ms (float): Wanted hashing latency in milliseconds.
+        memory_cost (int): Starting memory cost in KiB.
+        parallelism (int): Lanes per hash.
+        samples (int): Timings per candidate (the median is used).
+
+    Returns:
+        tuple: (time cost, memory cost in KiB, measured milliseconds).
     """
-    from passlib.hash import argon2 as _argon
-    return _argon.verify(pw, hashed)
\ No newline at end of file
+    one_pass = _measure(1, memory_cost, parallelism, samples)
+    while one_pass > target_ms and memory_cost > 8 * 1024:
+        memory_cost //= 2
+        one_pass = _measure(1, memory_cost, parallelism, samples)
+    time_cost, measured = 1, one_pass
+    while True:
+        candidate = _measure(time_cost + 1, memory_cost, parallelism, samples)
+        if candidate > target_ms:
+            return time_cost, memory_cost, measured
+        time_cost, measured = time_cost + 1, candidate
+
+def _throughput(time_cost: int, memory_cost: int, parallelism: int, workers: int, seconds: float = 3.0) -> float:
+    """Hashes per second with ``workers`` threads hashing back to back."""
+    hasher = _make_hasher(time_cost, memory_cost, parallelism)
+    deadline = time.perf_counter() + seconds
+    counts = [0] * workers
+
+    def work(i):
+        while time.perf_counter() < deadline:
+            hasher.hash("calibration-password")
+            counts[i] += 1
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(work, range(workers)))
+    return sum(counts) / seconds
+
+def main(argv=None) -> int:
+    """Entry point for ``python -m backend.services.password``.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m backend.services.password")
+    sub = parser.add_subparsers(dest="command", required=True)
+    cal = sub.add_parser("calibrate", help="pick Argon2 costs for a target hashing latency")
+    cal.add_argument("--target-ms", type=float, default=250.0, help="hashing latency to aim for")
+    cal.add_argument("--memory-mib", type=int, default=Config.PASSWORD_MEMORY_COST // 1024,
+                     help="starting memory cost (halved if even one pass is too slow)")
+    cal.add_argument("--parallelism", type=int, default=Config.PASSWORD_PARALLELISM, help="lanes per hash")
+    cal.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                     help="threads for the throughput check")
+    args = parser.parse_args(argv)
+
+    time_cost, memory_cost, measured = calibrate(args.target_ms, args.memory_mib * 1024, args.parallelism)
+    rate = _throughput(time_cost, memory_cost, args.parallelism, args.workers)
+    print(f"{measured:.0f} ms per hash; {rate:.1f} hashes/s with {args.workers} threads")
+    print(f"PASSWORD_TIME_COST={time_cost}")
+    print(f"PASSWORD_MEMORY_COST={memory_cost}")
+    print(f"PASSWORD_PARALLELISM={args.parallelism}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
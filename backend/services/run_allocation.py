@@ -2,39 +2,75 @@
 
 This module handles the core allocation algorithm that matches
 pending requests with available donated items using FIFO ordering.
+With ALLOCATION_CROSS_CC on, requests still short after matching within
+their own CC are topped up from stock at the nearest other CCs.
+
+Runs never overlap: a process-wide lock serializes them within a worker
+(request threads and the scheduler thread), and on PostgreSQL the
+pending requests and candidate items are locked with
+FOR UPDATE SKIP LOCKED, so concurrent runs in other processes work on
+disjoint rows. SQLite ignores row locks and relies on the process lock.
 """
 
+import threading
+from collections import defaultdict, deque
 from datetime import datetime, timedelta, timezone
 from sqlalchemy import or_
-from typing import Dict, List
+from typing import Dict, List, Optional, Sequence, Tuple
 
-from ..models import db, Request, Donation, Item, Reservation
+from ..config import Config
+from ..models import db, CommunityClub, Request, Donation, Item, Reservation
+from ..services.cc_cache import cc_cache
 from ..services.notification_strategies import DatabaseNotificationStrategy
+from ..services.telemetry import record_allocation
 
 # Asia/Singapore timezone for date cutoffs, etc.
 SG_TZ = timezone(timedelta(hours=8))
 
-def run_allocation() -> Dict[str, str]:
+# Held for a whole allocation pass, commit included
+_allocation_lock = threading.Lock()
+
+def run_allocation(wait: bool = True) -> Optional[Dict[str, str]]:
     """Match pending requests to available items using FIFO algorithm.
     
     Matches Pending requests to Available items (FIFO within each queue).
     Updates request status to 'Matched' when fully allocated and sends
     notifications to requesters.
     
+    Args:
+        wait (bool): Wait for a pass already running in this process to
+            finish; with False, return None instead.
+    
     Returns:
-        dict: Allocation job execution results.
+        dict: Allocation job execution results, including the number of
+        requests matched and items reserved in this pass, or None if
+        ``wait`` is False and another pass is running.
     """
+    if not _allocation_lock.acquire(blocking=wait):
+        return None
+    try:
+        return _allocate()
+    finally:
+        _allocation_lock.release()
+
+def _allocate() -> Dict[str, str]:
+    """One allocation pass; the caller holds ``_allocation_lock``."""
     # Get current date in Singapore timezone for expiry checks
     sg_today = datetime.now(SG_TZ).date()
     now_utc = datetime.now(timezone.utc)
 
-    # Get all pending requests ordered by creation time (FIFO)
+    # Get all pending requests ordered by creation time (FIFO). Rows are
+    # re-read even if this session loaded them earlier, and on PostgreSQL
+    # rows another process is allocating are skipped
     pending: List[Request] = (Request.query
         .filter(Request.status == "Pending")
         .order_by(Request.created_at.asc(), Request.id.asc())
+        .populate_existing()
+        .with_for_update(skip_locked=True)
         .all())
 
     changed = False  # Track if any changes were made
+    matched = reserved = 0  # Exported as allocation counters
 
     # Process each pending request in FIFO order
     for req in pending:
@@ -48,6 +84,7 @@ def run_allocation() -> Dict[str, str]:
                 req.status = "Matched"
                 req.matched_at = now_utc
                 changed = True
+                matched += 1
             continue  # Move to next request
 
         # Find matching available items for this request
@@ -56,13 +93,15 @@ def run_allocation() -> Dict[str, str]:
             .join(Donation, Item.donation_id == Donation.id)
             .filter(
                 Item.status == "Available",                    # Item must be available
-                Donation.location == req.location,             # Same community club
+                Donation.cc_id == req.cc_id,                   # Same community club
                 Donation.donation_item == req.request_item,    # Same item type
                 # Either no expiry date or not yet expired in Singapore timezone
                 or_(Donation.expiryDate.is_(None), Donation.expiryDate >= sg_today),
             )
             .order_by(Item.id.asc())  # FIFO allocation (earliest items first)
             .limit(need)              # Only get as many as needed
+            .populate_existing()
+            .with_for_update(of=Item, skip_locked=True)
             .all())
 
         # Allocate each candidate item to this request
@@ -71,23 +110,146 @@ def run_allocation() -> Dict[str, str]:
             db.session.add(Reservation(request_id=req.id, item_id=it.id))  # Create reservation
             req.allocation = (req.allocation or 0) + 1  # Increment allocation count
             changed = True
+            reserved += 1
 
         # If request is now fully allocated, mark as Matched and notify user
         if (req.allocation or 0) >= requested and requested > 0:
             req.status = "Matched"
             req.matched_at = now_utc
             changed = True
+            matched += 1
 
             # Send notification to requester about successful match
-            message = (
-                f"Good news! Your request '{req.request_item}' in {req.location} "
-                "has been successfully matched with available items."
-            )
-            notification_strategy = DatabaseNotificationStrategy()
-            notification_strategy.create_notification(message=message, receiver_email=req.requester_email)
+            _notify_matched(req)
+
+    # Second pass: top up still-short requests from nearby CCs
+    if Config.ALLOCATION_CROSS_CC:
+        short = [r for r in pending if r.status == "Pending" and (r.allocation or 0) < (r.request_quantity or 0)]
+        extra_matched, extra_reserved = _allocate_from_nearby(short, sg_today, now_utc)
+        matched += extra_matched
+        reserved += extra_reserved
+        changed = changed or extra_reserved > 0
 
     # Commit all changes if any allocations were made
     if changed:
         db.session.commit()
+    record_allocation(matched, reserved)
+
+    return {"job": "allocation", "status": "ok", "at": now_utc.isoformat(), "matched": matched, "reserved": reserved}
 
-    return {"job": "allocation", "status": "ok", "at": now_utc.isoformat()}
\ No newline at end of file
+def _notify_matched(req: Request, sources: Sequence[str] = ()):
+    """Tell the requester their request is fully matched.
+    
+    Args:
+        req (Request): The matched request.
+        sources (list): Other CCs that supplied items, if any.
+    """
+    message = (
+        f"Good news! Your request '{req.request_item}' in {req.location} "
+        "has been successfully matched with available items."
+    )
+    if sources:
+        message += f" Some items come from nearby {', '.join(sources)}."
+    notification_strategy = DatabaseNotificationStrategy()
+    notification_strategy.create_notification(message=message, receiver_id=req.requester_id)
+
+def nearby_ccs(locations, k: int, radius_km: float) -> Dict[str, List[str]]:
+    """Find the nearest other CCs for each CC, using the cached spatial index.
+    
+    Args:
+        locations (iterable): CC names to look up.
+        k (int): Maximum neighbours per CC.
+        radius_km (float): Maximum distance to a neighbour.
+        
+    Returns:
+        dict: CC name to neighbour names, nearest first. CCs missing from
+        the marker cache are left out.
+    """
+    snapshot = cc_cache.peek_snapshot()
+    out = {}
+    for name in set(locations):
+        pos = snapshot.by_name.get(name)
+        if pos is None:
+            continue
+        m = snapshot.markers[pos]
+        hits = snapshot.geo.nearest(m["lat"], m["lng"], k + 1, max_km=radius_km)
+        out[name] = [snapshot.markers[i]["name"] for i, _ in hits if i != pos][:k]
+    return out
+
+def _allocate_from_nearby(short: List[Request], sg_today, now_utc) -> Tuple[int, int]:
+    """Reserve items at nearby CCs for requests their own CC could not fill.
+    
+    Neighbours are looked up once per CC, and the candidate stock for all
+    requests is loaded in one query, then handed out in FIFO order of
+    requests (nearest CC first, oldest item first).
+    
+    Args:
+        short (list): Pending requests still missing items, oldest first.
+        sg_today (date): Current date in Singapore, for expiry checks.
+        now_utc (datetime): Timestamp for newly matched requests.
+        
+    Returns:
+        tuple: (requests matched, items reserved).
+    """
+    if not short:
+        return 0, 0
+    # Names are only needed for the spatial lookup and the notification
+    names = dict(db.session.query(CommunityClub.id, CommunityClub.name)
+        .filter(CommunityClub.id.in_({r.cc_id for r in short}))
+        .all())
+    near_names = nearby_ccs(
+        names.values(), Config.ALLOCATION_CROSS_CC_K, Config.ALLOCATION_CROSS_CC_RADIUS_KM
+    )
+    wanted = {n for ns in near_names.values() for n in ns}
+    if not wanted:
+        return 0, 0
+    ids = dict(db.session.query(CommunityClub.name, CommunityClub.id)
+        .filter(CommunityClub.name.in_(wanted))
+        .all())
+    names.update((cc_id, name) for name, cc_id in ids.items())
+    neighbours: Dict[int, List[int]] = {
+        cc_id: [ids[n] for n in near_names.get(name, ()) if n in ids] for cc_id, name in names.items()
+    }
+    source_ccs = {cc_id for ccs in neighbours.values() for cc_id in ccs}
+    if not source_ccs:
+        return 0, 0
+
+    # All candidate stock in one query (the local pass is flushed first)
+    stock: Dict[Tuple[int, str], deque] = defaultdict(deque)
+    rows = (db.session.query(Item, Donation.cc_id, Donation.donation_item)
+        .join(Donation, Item.donation_id == Donation.id)
+        .filter(
+            Item.status == "Available",
+            Donation.cc_id.in_(source_ccs),
+            Donation.donation_item.in_({r.request_item for r in short}),
+            or_(Donation.expiryDate.is_(None), Donation.expiryDate >= sg_today),
+        )
+        .order_by(Item.id.asc())
+        .populate_existing()
+        .with_for_update(of=Item, skip_locked=True)
+        .all())
+    for it, cc_id, item_name in rows:
+        stock[(cc_id, item_name)].append(it)
+
+    matched = reserved = 0
+    for req in short:
+        requested = req.request_quantity or 0
+        sources = []
+        for cc_id in neighbours.get(req.cc_id, ()):
+            queue = stock.get((cc_id, req.request_item))
+            while queue and (req.allocation or 0) < requested:
+                it = queue.popleft()
+                it.status = "Unavailable"
+                db.session.add(Reservation(request_id=req.id, item_id=it.id))
+                req.allocation = (req.allocation or 0) + 1
+                reserved += 1
+                if names[cc_id] not in sources:
+                    sources.append(names[cc_id])
+            if (req.allocation or 0) >= requested:
+                break
+        if sources and (req.allocation or 0) >= requested:
+            req.status = "Matched"
+            req.matched_at = now_utc
+            matched += 1
+            _notify_matched(req, sources)
+    return matched, reserved
@@ -0,0 +1,234 @@
+"""Prometheus Telemetry Service for CareConnect Backend.
+
+This module defines the metrics exported at ``/metrics``: request latency
+and status codes per blueprint endpoint, SQL statements per request,
+connection pool utilisation, background job durations and allocation
+throughput. Per-CC queue sizes are read from the database at scrape time.
+
+Under gunicorn, PROMETHEUS_MULTIPROC_DIR is set by backend/gunicorn.conf.py
+before prometheus_client is imported, so every worker writes its samples
+to shared files and a scrape of any one worker returns the totals of all
+of them. A standalone job worker started with the same directory adds its
+job and allocation metrics too. Without the variable (development server)
+the metrics live in this process only.
+"""
+
+import os
+import time
+
+from flask import current_app, g, request
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import func
+
+from ..database.pool_stats import get_pool_stats
+from ..database.query_stats import current_stats
+
+# Metrics without labels open their sample files on import, so the
+# directory must exist before any metric is defined (any entry point)
+if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+    os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_JOB_BUCKETS = (0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0, 300.0)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+# HTTP
+HTTP_LATENCY = Histogram(
+    "careconnect_http_request_duration_seconds", "Request latency by blueprint endpoint",
+    ["endpoint", "method"], buckets=_LATENCY_BUCKETS,
+)
+HTTP_RESPONSES = Counter(
+    "careconnect_http_responses_total", "Responses by blueprint endpoint and status code",
+    ["endpoint", "method", "status"],
+)
+
+# SQL per request (from query_stats)
+DB_QUERIES = Histogram(
+    "careconnect_db_queries_per_request", "SQL statements executed per request",
+    ["endpoint"], buckets=_QUERY_COUNT_BUCKETS,
+)
+DB_QUERY_SECONDS = Counter(
+    "careconnect_db_query_seconds_total", "Time spent executing SQL statements",
+    ["endpoint"],
+)
+
+# Connection pools (from pool_stats), refreshed by each worker after every request
+POOL_IN_USE = Gauge(
+    "careconnect_db_pool_in_use", "Connections checked out of the pool",
+    ["bind"], multiprocess_mode="livesum",
+)
+POOL_CAPACITY = Gauge(
+    "careconnect_db_pool_capacity", "Pool size plus max overflow (QueuePool only)",
+    ["bind"], multiprocess_mode="livesum",
+)
+POOL_TIMEOUTS = Gauge(
+    "careconnect_db_pool_timeouts", "Checkouts that timed out waiting for a connection",
+    ["bind"], multiprocess_mode="livesum",
+)
+POOL_WAIT_MAX = Gauge(
+    "careconnect_db_pool_wait_max_seconds", "Longest checkout wait for a connection",
+    ["bind"], multiprocess_mode="livemax",
+)
+
+# Background jobs (JobsController._safe_run)
+JOB_DURATION = Histogram(
+    "careconnect_job_duration_seconds", "Background job run time",
+    ["job"], buckets=_JOB_BUCKETS,
+)
+JOB_RUNS = Counter(
+    "careconnect_job_runs_total", "Background job runs by outcome",
+    ["job", "outcome"],
+)
+
+# Allocation (run_allocation)
+ALLOCATION_MATCHED = Counter(
+    "careconnect_allocation_requests_matched_total", "Requests moved to Matched by allocation",
+)
+ALLOCATION_RESERVED = Counter(
+    "careconnect_allocation_items_reserved_total", "Items reserved for requests by allocation",
+)
+
+
+class QueueCollector:
+    """Collect per-CC queue sizes from the database at scrape time.
+
+    Runs only in the process serving the scrape, so the values are never
+    summed across workers.
+    """
+
+    def collect(self):
+        from ..models import CommunityClub, Donation, Item, Request, db
+
+        pending = GaugeMetricFamily(
+            "careconnect_queue_pending_requests", "Pending requests per community club", labels=["cc"]
+        )
+        outstanding = GaugeMetricFamily(
+            "careconnect_queue_outstanding_items", "Items still needed by Pending requests per community club",
+            labels=["cc"],
+        )
+        available = GaugeMetricFamily(
+            "careconnect_queue_available_items", "Available donated items per community club", labels=["cc"]
+        )
+        try:
+            request_rows = (db.session.query(
+                    CommunityClub.name,
+                    func.count(Request.id),
+                    func.coalesce(func.sum(Request.request_quantity - Request.allocation), 0),
+                )
+                .join(CommunityClub, CommunityClub.id == Request.cc_id)
+                .filter(Request.status == "Pending")
+                .group_by(CommunityClub.name)
+                .all())
+            item_rows = (db.session.query(CommunityClub.name, func.count(Item.id))
+                .join(Donation, Item.donation_id == Donation.id)
+                .join(CommunityClub, CommunityClub.id == Donation.cc_id)
+                .filter(Item.status == "Available")
+                .group_by(CommunityClub.name)
+                .all())
+        except Exception:
+            current_app.logger.exception("Could not read queue sizes for /metrics")
+            return
+        for cc, count, need in request_rows:
+            pending.add_metric([cc], count)
+            outstanding.add_metric([cc], need)
+        for cc, count in item_rows:
+            available.add_metric([cc], count)
+        yield pending
+        yield outstanding
+        yield available
+
+
+_queue_registry = CollectorRegistry(auto_describe=False)
+_queue_registry.register(QueueCollector())
+
+
+def record_job(job_key: str, seconds: float, ok: bool):
+    """Record one background job run.
+
+    Args:
+        job_key (str): Key of the job in ``JobsController.schedule``.
+        seconds (float): Wall time of the run.
+        ok (bool): Whether the job finished without raising.
+    """
+    JOB_DURATION.labels(job_key).observe(seconds)
+    JOB_RUNS.labels(job_key, "ok" if ok else "error").inc()
+
+
+def record_allocation(matched: int, reserved: int):
+    """Record the outcome of one allocation pass.
+
+    Args:
+        matched (int): Requests moved to Matched.
+        reserved (int): Items reserved for requests.
+    """
+    if matched:
+        ALLOCATION_MATCHED.inc(matched)
+    if reserved:
+        ALLOCATION_RESERVED.inc(reserved)
+
+
+def render_metrics():
+    """Render all metrics in the Prometheus text format.
+
+    Must be called inside an app context (queue sizes are queried).
+
+    Returns:
+        tuple: (body bytes, content type).
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry) + generate_latest(_queue_registry), CONTENT_TYPE_LATEST
+
+
+def _update_pool_gauges():
+    for bind, stats in get_pool_stats().items():
+        POOL_IN_USE.labels(bind).set(stats["in_use"])
+        POOL_TIMEOUTS.labels(bind).set(stats["timeouts"])
+        POOL_WAIT_MAX.labels(bind).set(stats["wait_max_ms"] / 1000)
+        if "size" in stats:
+            POOL_CAPACITY.labels(bind).set(stats["size"] + max(stats["max_overflow"], 0))
+
+
+def _start_request():
+    g._metrics_started = time.perf_counter()
+
+
+def _finish_request(response):
+    started = g.pop("_metrics_started", None)
+    if started is None:
+        return response
+    endpoint = request.endpoint or "<unmatched>"  # route names, never raw paths
+    HTTP_LATENCY.labels(endpoint, request.method).observe(time.perf_counter() - started)
+    HTTP_RESPONSES.labels(endpoint, request.method, str(response.status_code)).inc()
+
+    stats = current_stats()
+    if stats is not None:
+        DB_QUERIES.labels(endpoint).observe(stats.count)
+        DB_QUERY_SECONDS.labels(endpoint).inc(stats.total_ms / 1000)
+    _update_pool_gauges()
+    return response
+
+
+def init_telemetry(app):
+    """Record request metrics for every request when METRICS_ENABLED is on.
+
+    Args:
+        app (Flask): Flask application instance.
+    """
+    if not app.config.get("METRICS_ENABLED", True):
+        return
+    app.before_request(_start_request)
+    app.after_request(_finish_request)
@@ -0,0 +1,135 @@
+"""User Context Service for CareConnect Backend.
+
+This module caches the logged-in user and their Client or Manager row so
+a request, and the burst of API calls a page load makes, does not look
+them up again and again.
+
+Within a request the rows are kept in ``flask.g``. Across requests each
+process keeps a snapshot of the column values per user id for
+USER_CONTEXT_TTL_SECONDS. A hit is attached to the request's session
+with ``merge(load=False)``, so it is an ordinary persistent object
+(changes flush as usual) without a SELECT. The password hash is never
+cached; it is loaded only if read.
+
+Every committed ORM change to a user, client or manager row (profile
+updates, registration decisions, OAuth logins, ...) drops that user's
+snapshot in the committing process; ``invalidate_user`` does the same by
+hand. Other worker processes keep theirs until the TTL runs out, so it
+is kept short: account status and role changes reach every worker
+within USER_CONTEXT_TTL_SECONDS.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Dict, Optional, Tuple
+
+from flask import g, has_request_context, session
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from ..config import Config
+from ..extensions import db
+from ..models import Client, Manager, User
+
+_ROLE_MODELS = {"C": Client, "M": Manager}
+_UNCACHED = {User: ("password_hash",)}
+
+# user id -> (expiry, user values, role row values or None)
+_cache: "OrderedDict[int, Tuple[float, dict, Optional[dict]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+def _values(obj) -> Dict[str, object]:
+    skip = _UNCACHED.get(type(obj), ())
+    return {a.key: getattr(obj, a.key) for a in inspect(type(obj)).column_attrs if a.key not in skip}
+
+def _attach(model, values: dict):
+    """Turn cached column values into a persistent instance without a query."""
+    obj = model(**values)
+    make_transient_to_detached(obj)  # columns left out are loaded on access
+    return db.session.merge(obj, load=False)
+
+def _load(user_id: int):
+    """Return (user, role row) from the TTL cache, or the database."""
+    now = time.monotonic()
+    with _cache_lock:
+        hit = _cache.get(user_id)
+        if hit and hit[0] > now:
+            _cache.move_to_end(user_id)
+    if hit and hit[0] > now:
+        _, user_values, role_values = hit
+        user = _attach(User, user_values)
+        model = _ROLE_MODELS.get(user.role)
+        return user, _attach(model, role_values) if model and role_values else None
+
+    user = db.session.get(User, user_id)
+    if user is None:
+        return None, None
+    model = _ROLE_MODELS.get(user.role)
+    role = db.session.get(model, user.id) if model else None
+
+    if Config.USER_CONTEXT_TTL_SECONDS > 0:
+        entry = (now + Config.USER_CONTEXT_TTL_SECONDS, _values(user), _values(role) if role else None)
+        with _cache_lock:
+            _cache[user_id] = entry
+            _cache.move_to_end(user_id)
+            while len(_cache) > Config.USER_CONTEXT_CACHE_SIZE:
+                _cache.popitem(last=False)
+    return user, role
+
+def _context():
+    """(user, role row) for the session's user, loaded once per request."""
+    if "_user_context" not in g:
+        user_id = session.get("user_id")
+        g._user_context = _load(user_id) if user_id is not None else (None, None)
+    return g._user_context
+
+def current_user() -> Optional[User]:
+    """Return the logged-in user (by ``session["user_id"]``), or None."""
+    return _context()[0]
+
+def current_client() -> Optional[Client]:
+    """Return the logged-in user's Client row, or None if not a client."""
+    user, role = _context()
+    return role if user is not None and user.role == "C" else None
+
+def current_manager() -> Optional[Manager]:
+    """Return the logged-in user's Manager row, or None if not a manager."""
+    user, role = _context()
+    return role if user is not None and user.role == "M" else None
+
+def invalidate_user(user_id: int):
+    """Forget the cached user context of ``user_id`` in this process.
+
+    Args:
+        user_id (int): Id of the user whose rows changed.
+    """
+    with _cache_lock:
+        _cache.pop(user_id, None)
+    if has_request_context():
+        ctx = g.get("_user_context")
+        if ctx and ctx[0] is not None and ctx[0].id == user_id:
+            g.pop("_user_context", None)
+
+_CHANGED = "_user_context_changed"
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed(session, flush_context):
+    """Remember which users' rows this transaction wrote."""
+    changed = session.info.setdefault(_CHANGED, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, User):
+            changed.add(obj.id)
+        elif isinstance(obj, (Client, Manager)):
+            changed.add(obj.user_id)
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed(session):
+    # After the commit, so a concurrent miss cannot cache the old values again
+    for user_id in session.info.pop(_CHANGED, ()):
+        invalidate_user(user_id)
+
+@event.listens_for(Session, "after_rollback")
+def _forget_changed(session):
+    session.info.pop(_CHANGED, None)
@@ -0,0 +1,53 @@
+"""Test Fixtures for CareConnect Backend.
+
+Tests run against the in-memory database with schedulers off, so they
+never touch the database configured in ``.env``. Run from the repository
+root with:
+    python -m pytest backend/tests
+"""
+
+import os
+import tempfile
+
+# Config is read at import time: set the test environment first
+_TMP = tempfile.mkdtemp(prefix="careconnect-tests-")
+os.environ.update(
+    DB_TYPE="memory",
+    DATABASE_URL="",
+    DATABASE_REPLICA_URL="",
+    RUN_SCHEDULERS="false",
+    SESSION_TYPE="filesystem",
+    SESSION_FILE_DIR=os.path.join(_TMP, "sessions"),
+    CC_CACHE_FILE=os.path.join(_TMP, "cc_markers.json"),
+)
+
+import pytest
+
+from backend.app import create_app
+from backend.database.fixtures import seed
+from backend.extensions import db
+from backend.services.cc_cache import cc_cache
+
+MARKERS = [
+    {"name": "Alpha CC", "lat": 1.30, "lng": 103.80, "address": "1 Alpha Road"},
+    {"name": "Beta CC", "lat": 1.31, "lng": 103.81, "address": "2 Beta Road"},
+]
+
+@pytest.fixture(scope="session")
+def app():
+    """The application, with a fixed marker list and a seeded database."""
+    app = create_app()
+    cc_cache.fetch = lambda: MARKERS
+    cc_cache.set(MARKERS)
+    with app.app_context():
+        seed(db, ccs=[m["name"] for m in MARKERS], clients=4, requests=8, donations=4)
+    return app
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+def login(client, user_id: int):
+    """Make ``client`` act as the user with ``user_id``."""
+    with client.session_transaction() as sess:
+        sess["user_id"] = user_id
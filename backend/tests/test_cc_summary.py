@@ -0,0 +1,25 @@
+"""Tests for the community club summaries."""
+
+from backend.models import Manager, Request, db
+from backend.tests.conftest import MARKERS, login
+
+def _post_request(client, location):
+    return client.post("/api/requests", json={
+        "request_category": "Food", "request_item": "Rice",
+        "request_quantity": 3, "location": location,
+    })
+
+def test_summaries_list_only_dataset_ccs(app, client):
+    with app.app_context():
+        requester = db.session.query(Request.requester_id).first()[0]
+        manager = db.session.query(Manager.user_id).first()[0]
+
+    login(client, requester)
+    assert _post_request(client, "lol not a cc <b>").status_code == 201
+
+    login(client, manager)
+    dataset = sorted(m["name"] for m in MARKERS)
+    for url in ("/api/manager/cc_summary", "/api/client/cc_summary"):
+        response = client.get(url)
+        assert response.status_code == 200
+        assert [cc["location"] for cc in response.get_json()] == dataset
@@ -0,0 +1,13 @@
+"""Tests that the entry modules stay within the import-time budget."""
+
+import pytest
+
+from backend.benchmarks.import_time import DEFAULT_BUDGET_MS, DEFAULT_MODULES, measure
+
+@pytest.mark.parametrize("module", DEFAULT_MODULES)
+def test_entry_module_import(module):
+    result = measure(module, runs=3, top=0)
+    assert not result["lazy_loaded"], f"{module} imports lazily loaded modules at import time"
+    assert result["total_ms"] <= DEFAULT_BUDGET_MS, (
+        f"{module} imports in {result['total_ms']} ms (budget {DEFAULT_BUDGET_MS} ms)"
+    )
@@ -0,0 +1,10 @@
+"""Tests for the orjson JSON provider."""
+
+import decimal
+from datetime import date
+
+def test_decimals_stay_exact_strings(app):
+    assert app.json.loads(app.json.dumps({"income": decimal.Decimal("2077.10")})) == {"income": "2077.10"}
+
+def test_dates_are_iso(app):
+    assert app.json.dumps({"d": date(2026, 1, 2)}) == '{"d":"2026-01-02"}'
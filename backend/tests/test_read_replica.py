@@ -0,0 +1,50 @@
+"""Tests for read-replica routing with a local two-file SQLite setup."""
+
+import pytest
+
+from backend.app import create_app
+from backend.config import Config
+from backend.database.fixtures import seed
+from backend.models import Notification, db
+from backend.tests.conftest import login
+
+@pytest.fixture(scope="module")
+def replica_app(tmp_path_factory):
+    path = tmp_path_factory.mktemp("replica")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Config, "DB_TYPE", "sqlite")
+        mp.setattr(Config, "SQLITE_PATH", str(path / "primary.db"))
+        mp.setattr(Config, "DATABASE_REPLICA_URL", f"sqlite:///{path / 'replica.db'}")
+        mp.setattr(Config, "DB_AUTO_MIGRATE", True)
+        app = create_app()
+    with app.app_context():
+        seed(db, ccs=["Alpha CC"], clients=2, requests=4, donations=2, notifications_per_client=3)
+        user_id = db.session.query(Notification.receiver_id).first()[0]
+    return app, user_id
+
+def _unread(client):
+    response = client.get("/api/notifications/unread-count")
+    assert response.status_code == 200
+    return response.get_json()["unread"]
+
+def test_replica_file_gets_the_primarys_data(replica_app):
+    app, user_id = replica_app
+    client = app.test_client()
+    login(client, user_id)
+    assert _unread(client) == 3
+
+def test_bulk_update_pins_reads_to_primary(replica_app):
+    app, user_id = replica_app
+    client = app.test_client()
+    login(client, user_id)
+    sync = app.extensions.pop("replica_sync")  # simulate replication lag
+    try:
+        assert client.post("/api/notifications/mark-read").status_code == 200
+        assert _unread(client) == 0
+
+        # A user who did not write still reads the lagging replica
+        other = app.test_client()
+        login(other, user_id)
+        assert _unread(other) == 3
+    finally:
+        app.extensions["replica_sync"] = sync
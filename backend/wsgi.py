@@ -0,0 +1,13 @@
+"""WSGI Entry Point for CareConnect Backend.
+
+Production servers load ``backend.wsgi:app``. Background schedulers are
+not started here: under gunicorn they are started after fork by one
+elected worker (see ``backend/gunicorn.conf.py``).
+
+Usage:
+    gunicorn -c backend/gunicorn.conf.py
+"""
+
+from backend.app import create_app
+
+app = create_app(start_schedulers=False)